@@ -1,26 +1,35 @@
 """item_swap -- for swapping an item from one inventory container to another."""
 
+from adventure.grammar import Phrase
 from adventure.inventory import Inventory
-from adventure.constants import location_mod_words
+from adventure.journal import ItemTransferred, container_place
 from adventure.items.item import Item
 
 
-def item_swap(args: list, inv: Inventory) -> str:
-    """Let player move item from one container to another."""
+def item_swap(phrase: Phrase, inv: Inventory, emit=None) -> str:
+    """Let player move item from one container to another.
+
+    A successful swap is passed to `emit` as an `ItemTransferred` event.
+    """
     dest: str = None
     mover: str = None
     source = None
-    for arg in args:
-        if arg in inv.list_all_containers():
-            dest = arg
-        elif arg in location_mod_words:
-            continue
+    containers = inv.list_all_containers()
+    for word in phrase.direct + phrase.indirect:
+        if word in containers:
+            dest = word
         else:
-            found: list[dict[str, Item]] = inv.find_item(arg)
+            found: list[dict[str, Item]] = inv.find_item(word)
             if len(found) > 0:
                 mover = found[0]["what"].name
                 source = found[0]["where"]
-    if len(dest) > 0 and mover is not None and source is not None:
+    if dest and mover is not None and source is not None:
         if inv.swap_container_item(source=source, dest=dest, item_name=mover):
+            if emit is not None:
+                emit(
+                    ItemTransferred(
+                        mover, container_place(source), container_place(dest)
+                    )
+                )
             return f"You relocate the {mover} from {source} to {dest}."
     return "You can't swap those things."
@@ -0,0 +1,155 @@
+"""adventure/batch -- run scripts of commands without a terminal.
+
+    python main.py --batch walkthrough.txt other.txt --workers 4
+    echo "look" | python main.py --batch -
+
+Each line of a script is a statement, run the same way the interactive game
+runs it. Blank lines and lines starting with "#" are skipped. Every statement
+gives one JSON object on stdout: the script, line number, input, output, the
+command it resolved to, the kind of error if there was one (see
+`adventure.game.StepResult`) and the id of the room the player ended up in. A
+summary with the number of commands per second goes to stderr, so stdout is
+nothing but JSON lines.
+"""
+
+import json
+import sys
+import time
+from typing import Iterable, Iterator, NamedTuple, TextIO
+
+from adventure.defaults import DEFAULT_COMMANDS_FILE, DEFAULT_DATA_DIR, DEFAULT_MAP_FILE
+from adventure.ui.baseui import BaseUI
+
+
+class BatchOptions(NamedTuple):
+    """The world a batch script is played in."""
+
+    base_data_dir: str = DEFAULT_DATA_DIR
+    map_file: str = DEFAULT_MAP_FILE
+    cmd_file: str = DEFAULT_COMMANDS_FILE
+
+
+class ScriptResult(NamedTuple):
+    """What running one script produced."""
+
+    script: str
+    records: list
+    seconds: float
+
+
+class BatchUI(BaseUI):
+    """A UI that keeps messages instead of showing them and never reads input."""
+
+    def __init__(self):
+        self.messages: list[str] = []
+
+    def display_message(self, message: str, color: str = None):
+        self.messages.append(message)
+
+    def get_input(self, prompt: str = "") -> str:
+        raise EOFError("A batch game cannot read input.")
+
+    def show_color(self, msg: str, color: str) -> str:
+        return msg
+
+
+def run_lines(
+    lines: Iterable[str], options: BatchOptions = BatchOptions(), script: str = "-"
+) -> Iterator[dict]:
+    """Play the statements in `lines` in a new game, yielding a record for each.
+
+    Stops early if a statement ends the game.
+    """
+    # Imported here so the batch runner can be imported without building a game.
+    from adventure.game import Game  # pylint: disable=import-outside-toplevel
+
+    game = Game(
+        base_data_dir=options.base_data_dir,
+        map_file_name=options.map_file,
+        cmd_file_name=options.cmd_file,
+        ui=BatchUI(),
+    )
+    numbered = [
+        (number, line.strip())
+        for number, line in enumerate(lines, 1)
+        if line.strip() and not line.strip().startswith("#")
+    ]
+    results = game.step_many(stmt for _, stmt in numbered)
+    for (number, _), result in zip(numbered, results):
+        yield _record(script, number, result)
+
+
+def _record(script: str, number: int, result) -> dict:
+    """The JSON record for one step of a script."""
+    record = {
+        "script": script,
+        "line": number,
+        "input": result.input,
+        "output": result.output,
+        "command": result.command,
+        "error": result.error,
+        "room_id": result.room_id,
+    }
+    if result.suggestions:
+        record["suggestions"] = list(result.suggestions)
+    return record
+
+
+def run_file(script: str, options: BatchOptions = BatchOptions()) -> ScriptResult:
+    """Run a script file, or stdin if the name is "-"."""
+    start = time.perf_counter()
+    if script == "-":
+        records = list(run_lines(sys.stdin, options, script))
+    else:
+        with open(script, "r", encoding="utf-8") as fh:
+            records = list(run_lines(fh, options, script))
+    return ScriptResult(script, records, time.perf_counter() - start)
+
+
+def run_batch(
+    scripts: list[str],
+    options: BatchOptions = BatchOptions(),
+    workers: int = 0,
+    out: TextIO = None,
+    err: TextIO = None,
+) -> int:
+    """Run scripts, writing JSON lines to `out` and a summary to `err`.
+
+    With `workers`, scripts other than stdin run in parallel on that many
+    processes. Results are written in the order the scripts were given.
+
+    Returns:
+     - (int):   The number of statements run.
+
+    """
+    out = out or sys.stdout
+    err = err or sys.stderr
+    start = time.perf_counter()
+    if workers and len(scripts) > 1 and "-" not in scripts:
+        # Imported here; most batch runs are a single script.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results: Iterable[ScriptResult] = pool.map(
+                run_file, scripts, [options] * len(scripts)
+            )
+            commands = _write_results(results, out)
+    else:
+        commands = _write_results((run_file(s, options) for s in scripts), out)
+    seconds = time.perf_counter() - start
+    rate = commands / seconds if seconds else 0.0
+    print(
+        f"{commands} commands from {len(scripts)} scripts in {seconds:.3f}s "
+        f"({rate:.0f} commands/s)",
+        file=err,
+    )
+    return commands
+
+
+def _write_results(results: Iterable[ScriptResult], out: TextIO) -> int:
+    commands = 0
+    for result in results:
+        for record in result.records:
+            out.write(json.dumps(record) + "\n")
+        commands += len(result.records)
+    return commands
@@ -0,0 +1,81 @@
+"""adventure/cache -- a small bounded least-recently-used cache with statistics."""
+
+import threading
+from collections import OrderedDict
+from typing import Hashable, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Hit and miss statistics for a cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache:
+    """A bounded mapping that forgets the least recently used entry when full.
+
+    It is safe to share between threads.
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def keys(self) -> list:
+        """Return the cached keys, least recently used first."""
+        with self._lock:
+            return list(self._data)
+
+    def get(self, key: Hashable, default=None):
+        """Look up a key, counting the hit or miss and marking it recently used."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value):
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable = None):
+        """Forget one key, or everything (statistics included) if no key is given."""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+                self.hits = 0
+                self.misses = 0
+            else:
+                self._data.pop(key, None)
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
@@ -1,14 +1,16 @@
 """Close command for the adventure game."""
 
+from adventure.grammar import Phrase
+from adventure.journal import DoorClosed
 from adventure.rooms.room import Room
 
 
-def close(game, *args, **kwargs):
+def close(game, phrase: Phrase):
     """Close a door in the current room."""
-    if not args or not args[0]:
+    if not phrase.direct:
         return "You only know how to close things that can be closed. Indicate something to close."
 
-    for close_tgt in args[0]:
+    for close_tgt in phrase.direct:
         found = False
         room: Room = game.current_loc
         directions = [wall.location.name.lower() for wall in room.get_walls()]
@@ -21,6 +23,11 @@ def close(game, *args, **kwargs):
                     for door in wall.doors:
                         if door.is_open:
                             door.close()
+                            game.emit(
+                                DoorClosed(
+                                    room.room_id, wall.location.name.lower(), door.name
+                                )
+                            )
                             return f"You closed the {door.name}."
                         else:
                             return f"The {door.name} is already closed."
@@ -29,6 +36,9 @@ def close(game, *args, **kwargs):
                 found = True
                 if door.is_open:
                     door.close()
+                    wall = room.get_door_wall(door)
+                    side = wall.location.name.lower() if wall else ""
+                    game.emit(DoorClosed(room.room_id, side, door.name))
                     return f"You closed the {door.name}."
                 else:
                     return f"The {door.name} is already closed."
@@ -1,13 +1,19 @@
 """adventure/command -- a command interpreter class to manage actions the player will attempt."""
 
 import importlib
+import importlib.util
 from typing import Union
 from collections.abc import Callable
 from adventure.exceptions import CommandNotFoundError
 
 
 class Command:
-    """A command class for individual verbs the player can perform."""
+    """A command class for individual verbs the player can perform.
+
+    The module named in `action_path` is found but not imported when the
+    command is made; the action is imported on first use. With `strict`, it is
+    imported straight away so a bad path is reported before the game starts.
+    """
 
     def __init__(
         self,
@@ -16,13 +22,17 @@ class Command:
         help_text: str,
         aliases: list[str],
         action_path: str = None,
+        strict: bool = False,
     ) -> None:
         self.name = name
         self.desc = desc
         self.help_text = help_text
         self.aliases: list[str] = aliases or []
         self.action_path = action_path
-        self.action = self._import_action(self.action_path)
+        self._action: Callable = None
+        self._check_action(self.action_path)
+        if strict:
+            self._action = self._import_action(self.action_path)
 
     def __str__(self):
         return f"{self.name} - {self.desc}"
@@ -32,6 +42,30 @@ class Command:
             return self.name.lower() == other.name.lower()
         raise ValueError("Comparable must be a Command object.")
 
+    @property
+    def action(self) -> Callable:
+        """The action function, imported the first time it is needed."""
+        if self._action is None:
+            self._action = self._import_action(self.action_path)
+        return self._action
+
+    def _check_action(self, action_path: str):
+        """Check the action's module can be found, without importing it."""
+        if not action_path:
+            raise ValueError("Action path must be defined!")
+        if "." not in action_path:
+            raise ValueError("Action path must name a module and a function!")
+        module_path = action_path.rsplit(".", 1)[0]
+        try:
+            spec = importlib.util.find_spec(module_path)
+        except ImportError:  # a parent package is missing
+            spec = None
+        if spec is None:
+            raise ImportError(
+                f"Error importing action for command '{self.name}': "
+                f"No module named '{module_path}'"
+            )
+
     def _import_action(self, action_path: str) -> Callable:
         """Dynamically import the action function based on the path."""
         if not action_path:
@@ -1,16 +1,29 @@
 """CommandList module for the adventure game."""
 
-from typing import Iterator
+from typing import Iterator, Optional
 from adventure.commands.command import Command
-from adventure.exceptions import CommandNotFoundError
+from adventure.commands.matching import SpellingIndex, VerbTrie
+from adventure.exceptions import CommandAliasCollisionError, CommandNotFoundError
 from adventure.dao.doc_yaml import get_yaml_doc
 
 
 class CommandList:
-    """A class to manage a list of commands."""
+    """A class to manage a list of commands.
 
-    def __init__(self, commands_yml_file: str = None):
+    Commands are indexed by their case-folded names and aliases, so finding
+    the command for a word takes the same time however many commands exist.
+    The same words go into a trie for matching abbreviations and a spelling
+    index for suggesting commands when a word is misspelled.
+    """
+
+    max_suggestions = 3
+
+    def __init__(self, commands_yml_file: str = None, strict: bool = False):
         self.commands: list[Command] = []
+        # case-folded name or alias -> Command
+        self._index: dict[str, Command] = {}
+        self._prefixes = VerbTrie()
+        self._spellings = SpellingIndex()
         if commands_yml_file:
             cmd_dict = get_yaml_doc(commands_yml_file)
             for cmd in cmd_dict:
@@ -20,25 +33,63 @@ class CommandList:
                     help_text=cmd.get("help_text"),
                     aliases=cmd.get("aliases", []),
                     action_path=cmd.get("action"),
+                    strict=strict,
                 )
-                self.commands.append(new_cmd)
+                self.add_command(new_cmd)
 
     def __iter__(self) -> Iterator[Command]:
         """Allow iteration over the commands."""
         return iter(self.commands)
 
+    def __len__(self) -> int:
+        return len(self.commands)
+
     def add_command(self, command: Command) -> None:
-        """Add a command to the list."""
+        """Add a command to the list.
+
+        Raises:
+         - (CommandAliasCollisionError): If the command's name or one of its
+                                         aliases already belongs to another command.
+
+        """
+        words = {word.casefold() for word in [command.name, *command.aliases]}
+        for word in sorted(words):
+            owner = self._index.get(word)
+            if owner is not None and owner is not command:
+                raise CommandAliasCollisionError(
+                    f"'{word}' cannot be used by both '{owner.name}' and '{command.name}'."
+                )
         self.commands.append(command)
+        self._index.update(dict.fromkeys(words, command))
+        for word in words:
+            self._prefixes.insert(word, command)
+            self._spellings.insert(word)
+
+    def find(self, word: str) -> Optional[Command]:
+        """Return the command a word names, or None if there isn't one."""
+        return self._index.get(word.casefold())
+
+    def find_prefix(self, prefix: str) -> Optional[Command]:
+        """Return the command an abbreviation stands for, if only one fits."""
+        return self._prefixes.unique_prefix(prefix.casefold())
+
+    def suggest(self, word: str) -> list[str]:
+        """Return the command words closest to a misspelled word.
+
+        Words up to one edit away are suggested for short words, and up to two
+        for words of five or more letters.
+        """
+        word = word.casefold()
+        max_distance = 1 if len(word) < 5 else 2
+        matches = self._spellings.search(word, max_distance)
+        return [match for _, match in matches[: self.max_suggestions]]
 
     def get_command(self, name: str) -> Command:
         """Retrieve a command by name or alias."""
-        for cmd in self.commands:
-            if cmd.name.lower() == name.lower() or name.lower() in [
-                alias.lower() for alias in cmd.aliases
-            ]:
-                return cmd
-        raise CommandNotFoundError(f"Command '{name}' not found")
+        cmd = self.find(name)
+        if cmd is None:
+            raise CommandNotFoundError(f"Command '{name}' not found")
+        return cmd
 
     def list_commands(self) -> list[str]:
         """List all available commands."""
@@ -46,8 +97,4 @@ class CommandList:
 
     def has_command(self, name: str) -> bool:
         """Check if a command exists by name or alias."""
-        try:
-            self.get_command(name)
-            return True
-        except CommandNotFoundError:
-            return False
+        return self.find(name) is not None
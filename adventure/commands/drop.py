@@ -1,13 +1,15 @@
 """Drop an item command."""
 
 from adventure.exceptions import ItemNotFoundError, ContainerNotFoundError
+from adventure.grammar import Phrase
+from adventure.journal import ItemTransferred, container_place, room_place
 
 
-def drop(game, *args, **kwargs):
+def drop(game, phrase: Phrase):
     """Drop an item from inventory to the room."""
-    if not args or not args[0]:
+    if not phrase.direct:
         return "You drop nothing like a bad habit."
-    if "all" in args[0]:
+    if "all" in phrase.direct:
         # We'll interpret this as dropping what we're holding, not all bags.
         output = ""
         try:
@@ -17,19 +19,33 @@ def drop(game, *args, **kwargs):
                 for item in hands.contents:
                     hands.contents.remove(item)
                     game.current_loc.contents.append(item)
+                    game.emit(
+                        ItemTransferred(
+                            item.name,
+                            container_place(hands.name),
+                            room_place(game.current_loc.room_id),
+                        )
+                    )
                     output += f"*{item.name}*\n"
         except ContainerNotFoundError:
             # We'll assume they know they're missing a hand if they are...
             return
         return output
     else:
-        for item_name in args[0]:
+        for item_name in phrase.direct:
             found = False
             for container in game.player.inventory.containers:
                 try:
                     found = container.get(item_name)
                     container.remove(found)
                     game.current_loc.contents.append(found)
+                    game.emit(
+                        ItemTransferred(
+                            found.name,
+                            container_place(container.name),
+                            room_place(game.current_loc.room_id),
+                        )
+                    )
                     output = "You dropped:\n"
                     output += f"*{found.name}* from {container.short_desc}."
                     return output
@@ -1,7 +1,7 @@
 """Display the available commands to the player in the game."""
 
 
-def help(self, *args, **kwargs):
+def help(self, phrase=None):
     """Display the available commands."""
     output = "Available commands:\n"
     for cmd in self.interpreter.commands:
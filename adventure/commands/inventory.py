@@ -1,6 +1,6 @@
 """Inventory Command."""
 
 
-def inv(game, *args, **kwargs):
+def inv(game, phrase=None):
     """Display the things you have on hand."""
     print(game.player.inventory.list_all_contents())
@@ -0,0 +1,126 @@
+"""adventure/commands/matching -- find commands from partial or misspelled verbs.
+
+`VerbTrie` resolves a prefix to a command when every verb starting with it
+belongs to the same command, so "exa" finds examine. `SpellingIndex` finds the
+verbs within a few edits of a misspelled word for "did you mean" suggestions.
+Both are filled in as commands are added to a `CommandList`.
+"""
+
+# Marks a trie node whose verbs belong to more than one command.
+_AMBIGUOUS = object()
+
+
+class _TrieNode:
+    __slots__ = ("children", "owner")
+
+    def __init__(self):
+        self.children: dict = {}
+        # The command every verb below this node belongs to, or _AMBIGUOUS.
+        self.owner = None
+
+
+class VerbTrie:
+    """A prefix tree of verbs that knows which prefixes are unambiguous."""
+
+    def __init__(self, min_prefix: int = 2):
+        self.min_prefix = min_prefix
+        self._root = _TrieNode()
+
+    def insert(self, word: str, command):
+        """Add a verb for a command."""
+        node = self._root
+        for char in word:
+            node = node.children.setdefault(char, _TrieNode())
+            if node.owner is None:
+                node.owner = command
+            elif node.owner is not command:
+                node.owner = _AMBIGUOUS
+
+    def unique_prefix(self, prefix: str):
+        """Return the one command with a verb starting with `prefix`, or None.
+
+        Prefixes shorter than `min_prefix`, or shared by the verbs of more than
+        one command, do not match anything.
+        """
+        if len(prefix) < self.min_prefix:
+            return None
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return None if node.owner is _AMBIGUOUS else node.owner
+
+
+def edit_distance(first: str, second: str, limit: int = None) -> int:
+    """The Levenshtein distance between two words.
+
+    With a `limit`, gives up as soon as the distance must be more than that
+    and returns `limit` + 1.
+    """
+    if len(first) < len(second):
+        first, second = second, first
+    if limit is not None and len(first) - len(second) > limit:
+        return limit + 1
+    previous = list(range(len(second) + 1))
+    for i, a in enumerate(first, 1):
+        current = [i]
+        for j, b in enumerate(second, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a != b))
+            )
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class SpellingIndex:
+    """Words indexed by their deletions, for finding words a few edits away.
+
+    Two words within `max_distance` edits of each other can both be cut down
+    to a common string by deleting at most `max_distance` letters from each
+    (the symmetric delete method). Indexing every word under each of its
+    deletions lets a search look at only those candidates. A BK-tree was
+    tried first, but with short verbs it prunes so little that it compares
+    nearly every word.
+    """
+
+    def __init__(self, max_distance: int = 2):
+        self.max_distance = max_distance
+        # deletion -> words it was cut from
+        self._deletions: dict[str, list[str]] = {}
+        self._words: set[str] = set()
+
+    def insert(self, word: str):
+        """Add a word to the index."""
+        if word in self._words:
+            return
+        self._words.add(word)
+        for deletion in _deletions(word, self.max_distance):
+            self._deletions.setdefault(deletion, []).append(word)
+
+    def search(self, word: str, max_distance: int) -> list[tuple[int, str]]:
+        """All (distance, word) pairs within `max_distance` edits, closest first."""
+        max_distance = min(max_distance, self.max_distance)
+        candidates = set()
+        for deletion in _deletions(word, max_distance):
+            candidates.update(self._deletions.get(deletion, ()))
+        found = []
+        for candidate in candidates:
+            distance = edit_distance(word, candidate, max_distance)
+            if distance <= max_distance:
+                found.append((distance, candidate))
+        return sorted(found)
+
+
+def _deletions(word: str, count: int) -> set[str]:
+    """The word and every string made by deleting up to `count` letters from it."""
+    found = {word}
+    frontier = {word}
+    for _ in range(count):
+        frontier = {
+            part[:i] + part[i + 1 :] for part in frontier for i in range(len(part))
+        }
+        found |= frontier
+    return found
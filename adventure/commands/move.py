@@ -1,22 +1,18 @@
 """Player movement action."""
 
+from adventure.grammar import Phrase
+from adventure.journal import Moved
 from adventure.rooms.room import Room
 from adventure.map.direction import Direction
-from adventure.constants import mobility_mod_words
 
 
-def move(game, *args, **kwargs) -> str:
+def move(game, phrase: Phrase) -> str:
     """Move the player around the map."""
-    action = kwargs.get("action")
-    if len(args[0]) == 0:
-        return f"You {action} about the room."
-    for word in args[0]:
-        if word in mobility_mod_words:
-            args[0].remove(word)
-    if len(args[0]) == 0:
+    action = phrase.verb
+    if not phrase.obj:
         return f"You {action} about the room."
     try:
-        direction = Direction.from_string(args[0].pop())
+        direction = Direction.from_string(phrase.obj)
     except KeyError as e:
         raise KeyError(f"You can't {action} that way.") from e
     room: Room = game.current_loc if game else None
@@ -28,6 +24,13 @@ def move(game, *args, **kwargs) -> str:
                 if door.is_open:
                     if door.leads_to is not None:
                         game.current_loc = game.map.get_room(door.leads_to)
+                        game.emit(
+                            Moved(
+                                source=room.room_id,
+                                dest=door.leads_to,
+                                direction=direction.name.lower(),
+                            )
+                        )
                         return f"You {action} through the {door.name} to {game.current_loc.name}."
                     return f"You can't {action} that way."
                 return f"The {door.name} is closed. You can't {action} that way until you open it."
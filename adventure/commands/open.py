@@ -1,14 +1,16 @@
 """Open command for the adventure game."""
 
+from adventure.grammar import Phrase
+from adventure.journal import DoorOpened
 from adventure.rooms.room import Room
 
 
-def open_cmd(game, *args, **kwargs):
+def open_cmd(game, phrase: Phrase):
     """Open a door in the current room."""
-    if not args or not args[0]:
+    if not phrase.direct:
         return "You only know how to open things that can be opened. Indicate something to open."
 
-    for open_tgt in args[0]:
+    for open_tgt in phrase.direct:
         found = False
         room: Room = game.current_loc
         directions = [wall.location.name.lower() for wall in room.get_walls()]
@@ -21,6 +23,11 @@ def open_cmd(game, *args, **kwargs):
                     for door in wall.doors:
                         if not door.is_open:
                             door.open()
+                            game.emit(
+                                DoorOpened(
+                                    room.room_id, wall.location.name.lower(), door.name
+                                )
+                            )
                             return f"You opened the {door.name}."
                         else:
                             return f"The {door.name} is already opened."
@@ -29,6 +36,9 @@ def open_cmd(game, *args, **kwargs):
                 found = True
                 if not door.is_open:
                     door.open()
+                    wall = room.get_door_wall(door)
+                    side = wall.location.name.lower() if wall else ""
+                    game.emit(DoorOpened(room.room_id, side, door.name))
                     return f"You opened the {door.name}."
                 else:
                     return f"The {door.name} is already opened."
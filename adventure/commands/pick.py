@@ -1,18 +1,28 @@
 """Pick command for the adventure game."""
 
+from adventure.grammar import Phrase
+from adventure.journal import ItemTransferred, container_place, room_place
 
-def pick(game, *args, **kwargs) -> str:
+
+def pick(game, phrase: Phrase) -> str:
     """Obtain an item from the room."""
-    if not args or not args[0]:
+    # "up" is a direction, so "pick up" leaves it in the direct object.
+    names = [word for word in phrase.direct if word.lower() != "up"]
+    if not names:
         return "You pick your nose, briefly."
-    if "up" in args[0]:
-        args[0].remove("up")
     for item in game.current_loc.contents:
-        if item.name.lower() in args[0]:
+        if item.name.lower() in names:
             if item.weight <= 100:
                 if game.player.inventory.can_hold("hands", item):
                     game.player.inventory.insert_into("hands", item)
                     game.current_loc.contents.remove(item)
+                    game.emit(
+                        ItemTransferred(
+                            item.name,
+                            room_place(game.current_loc.room_id),
+                            container_place("hands"),
+                        )
+                    )
                     return f"You pick up {item.name}."
                 else:
                     return "You don't have a free hand to pick that up."
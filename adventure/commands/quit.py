@@ -1,7 +1,7 @@
 """Quit the game command."""
 
 
-def quit_game(game, *args, **kwargs) -> None:
+def quit_game(game, phrase=None) -> None:
     """We are LEAVING!"""
     game.is_running = False
     return
@@ -0,0 +1,28 @@
+"""Save and restore commands for the adventure game."""
+
+import os
+from adventure.save import SaveFile
+
+
+def save_game(game, phrase=None) -> str:
+    """Save the game to its save file."""
+    saves: SaveFile = game.saves
+    if saves is None:
+        return "This game cannot be saved."
+    try:
+        saves.save(game)
+    except ValueError as ve:
+        return f"The game could not be saved: {ve}"
+    return "Game saved."
+
+
+def restore_game(game, phrase=None) -> str:
+    """Put the game back as it was when it was last saved."""
+    saves: SaveFile = game.saves
+    if saves is None or not os.path.isfile(saves.path):
+        return "There is no saved game to go back to."
+    try:
+        saves.restore(game)
+    except ValueError as ve:
+        return f"The saved game could not be restored: {ve}"
+    return f"Game restored. You are in {game.current_loc.name}."
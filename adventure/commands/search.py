@@ -1,7 +1,7 @@
 """Search command for the adventure game."""
 
 
-def search(game, *args, **kwargs):
+def search(game, phrase=None):
     """Search the room for items."""
     output = "An exhaustive search of the room reveals the following items:\n"
     if len(game.current_loc.contents) == 0:
@@ -2,11 +2,12 @@
 
 from adventure.action.item_swap import item_swap
 from adventure.exceptions import ItemNotFoundError
+from adventure.grammar import Phrase
 
 
-def swap(game, *args, **kwargs) -> str:
+def swap(game, phrase: Phrase) -> str:
     """Swap an item from one container to another."""
     try:
-        return item_swap(*args, game.player.inventory)
+        return item_swap(phrase, game.player.inventory, emit=game.emit)
     except ItemNotFoundError:
         return "You can't seem to locate that to swap it."
@@ -1,27 +1,30 @@
 """Throw an item command."""
 
 from typing import Union
-from adventure.constants import self_words
+from adventure.grammar import Phrase
+from adventure.journal import ItemTransferred, container_place, room_place
 
 
-def throw(game, *args, **kwargs) -> Union[str | None]:
+def throw(game, phrase: Phrase) -> Union[str | None]:
     """Throw an item from inventory to the room."""
     thrown_thing = None
     target = None
-    if len(args[0]) == 0:
+    if not phrase.direct:
         return "You throw your hands out into the air."
     else:
-        thrown_thing = args[0].pop(0)
+        thrown_thing = phrase.direct[0]
         if not game.player.inventory.holding(thrown_thing):
             return f"You don't have {thrown_thing} to throw."
         else:
             item_list = game.player.inventory.find_item(thrown_thing)
-        if "at" in args[0]:
-            target_name = args[0].pop(args[0].index("at") + 1)
-            if target_name in self_words:
+        if phrase.target:
+            target = phrase.target
+            if phrase.indirect_is_self:
                 return f"You bounce {thrown_thing} off your own head."
-            if target_name not in game.current_loc.contents:
-                return f"You can't throw {thrown_thing} at {target_name} because it isn't here."
+            if target not in game.current_loc.contents:
+                return (
+                    f"You can't throw {thrown_thing} at {target} because it isn't here."
+                )
 
         for found in item_list:
             container_name = found.get("where")
@@ -29,7 +32,14 @@ def throw(game, *args, **kwargs) -> Union[str | None]:
             container = game.player.inventory.get(container_name)
             container.remove(item)
             game.current_loc.contents.append(item)
+            game.emit(
+                ItemTransferred(
+                    item.name,
+                    container_place(container.name),
+                    room_place(game.current_loc.room_id),
+                )
+            )
             if target:
-                return f"You throw {found.get('what').name} from {container.short_desc} at {target_name}."
+                return f"You throw {found.get('what').name} from {container.short_desc} at {target}."
             else:
                 return f"You throw {found.get('what')} from {container.short_desc}."
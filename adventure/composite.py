@@ -0,0 +1,62 @@
+"""adventure/composite -- the classes the loaders compose from data file class lists.
+
+Loaders build an object's class from a base class plus the classes named in
+its data file. Identical compositions share one class object, however many
+objects are loaded with it.
+"""
+
+from typing import Dict, Iterable, Tuple
+
+# (class name, base classes) -> composed class
+_COMPOSITE_TYPES: Dict[Tuple[str, Tuple[type, ...]], type] = {}
+
+
+def merge_bases(
+    base: type, class_names: Iterable[str], class_map: Dict[str, type], kind: str
+) -> Tuple[type, ...]:
+    """Work out the base classes for a composite from the class names in a data file.
+
+    A named class that extends one already in the list replaces it rather
+    than being added alongside it.
+
+    Arguments:
+     - base(type):          The class every composite of this kind extends.
+     - class_names(list):   The class names listed in the data file.
+     - class_map(dict):     Class name -> class for this kind of thing.
+     - kind(str):           What is being loaded, for error messages.
+
+    Returns:
+     - (tuple):             The base classes for the composite.
+
+    Raises:
+     - (ValueError):        If a class name is not in the class map.
+
+    """
+    base_classes = [base]
+    for cls_name in class_names:
+        if cls_name not in class_map:
+            raise ValueError(f"Unknown {kind} class: {cls_name}")
+        cls = class_map[cls_name]
+        if cls:
+            for i, existing in enumerate(base_classes):
+                if issubclass(cls, existing):
+                    base_classes[i] = cls
+                    break
+            else:
+                base_classes.append(cls)
+    return tuple(base_classes)
+
+
+def composite_type(name: str, bases: Tuple[type, ...]) -> type:
+    """Get the class with this name and these bases, creating it the first time."""
+    key = (name, bases)
+    cls = _COMPOSITE_TYPES.get(key)
+    if cls is None:
+        # An empty __slots__ keeps slotted bases from gaining a __dict__ back.
+        cls = _COMPOSITE_TYPES.setdefault(key, type(name, bases, {"__slots__": ()}))
+    return cls
+
+
+def composite_type_count() -> int:
+    """The number of distinct composite classes created so far."""
+    return len(_COMPOSITE_TYPES)
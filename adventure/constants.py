@@ -1,16 +1,22 @@
-"""adventure/constants."""
+"""adventure/constants.
 
-self_words = ["me", "myself", "I", "self"]
-visibility_mod_words = ["at", "around", "into", "over", "about"]
-mobility_mod_words = ["to", "the", "towards", "near", "from", "with", "by", "on", "off"]
-location_mod_words = [
-    "to",
-    "into",
-    "out",
-    "over",
-    "under",
-    "above",
-    "below",
-    "around",
-    "through",
-]
+Word classes used to parse statements. Words are stored lower case; the
+grammar case-folds each token once before looking it up.
+"""
+
+self_words = frozenset({"me", "myself", "i", "self"})
+articles = frozenset({"the", "a", "an"})
+visibility_mod_words = frozenset({"at", "around", "into", "over", "about"})
+mobility_mod_words = frozenset(
+    {"to", "towards", "near", "from", "with", "by", "on", "off"}
+)
+location_mod_words = frozenset(
+    {"to", "into", "out", "over", "under", "above", "below", "around", "through"}
+)
+# "up" and "down" are directions, so they are never prepositions.
+prepositions = (
+    visibility_mod_words
+    | mobility_mod_words
+    | location_mod_words
+    | frozenset({"in", "inside", "onto", "for", "of"})
+)
@@ -1,13 +1,24 @@
 """adventure/dao/doc_yaml -- functions to read in YAML documents."""
 
-import yaml
-from yaml.parser import ParserError
+import os
+from adventure.cache import CacheInfo, LRUCache
+from adventure.dao.parser import parse_file
+from adventure.defaults import DEFAULT_DOC_CACHE_SIZE
 from adventure.exceptions import EmptyFileError, BadYamlError
 
+# (fname, mtime_ns, size) -> doc
+_doc_cache = LRUCache(maxsize=DEFAULT_DOC_CACHE_SIZE)
+
 
 def get_yaml_doc(fname: str) -> dict:
     """Read in a yaml doc and return a dictionary of the contents.
 
+    The file may also be JSON; the parser is picked by the file's extension.
+    Documents are cached by file name and reused until the file's modification
+    time or size changes. Every call returns its own copy of the document.
+    The cache holds DEFAULT_DOC_CACHE_SIZE documents, more after
+    `reserve_doc_cache`.
+
     Arguments:
         fname(str):     Name of the YAML document to read in.
 
@@ -18,16 +29,60 @@ def get_yaml_doc(fname: str) -> dict:
         (FileNotFoundError): if the named file cannot be found.
         (EmptyFileError):    if the named file does not contain any content.
     """
+    stat = os.stat(fname)
+    key = (fname, stat.st_mtime_ns, stat.st_size)
+    doc = _doc_cache.get(key)
+    if doc is None:
+        doc = _read_yaml_doc(fname)
+        _doc_cache.put(key, doc)
+    return _copy_doc(doc)
+
+
+def reserve_doc_cache(count: int):
+    """Make room in the document cache for `count` more documents.
+
+    A map reads its room files in order, so once there are more of them than
+    the cache holds each load pushes out the files the next load reads first.
+    The cache is grown to hold them beside DEFAULT_DOC_CACHE_SIZE others, such
+    as the walls, doors and things the rooms share. It is never shrunk.
+    """
+    _doc_cache.maxsize = max(_doc_cache.maxsize, count + DEFAULT_DOC_CACHE_SIZE)
+
+
+def doc_cache_info() -> CacheInfo:
+    """Return hit and miss statistics for the document cache."""
+    return _doc_cache.info()
+
+
+def invalidate_doc_cache(fname: str = None):
+    """Drop one cached document, or all of them if no file name is given."""
+    if fname is None:
+        _doc_cache.invalidate()
+        return
+    for key in [key for key in _doc_cache.keys() if key[0] == fname]:
+        _doc_cache.invalidate(key)
+
+
+def _read_yaml_doc(fname: str) -> dict:
+    """Parse a yaml (or json) doc from disk."""
     doc: dict = {}
     try:
-        with open(fname, "r", encoding="utf-8") as fh:
-            doc = yaml.safe_load(fh)
-        if not doc:
-            raise EmptyFileError("Data file {fname} contained no data!")
-        if not isinstance(doc, dict) and not isinstance(doc, list):
-            raise BadYamlError(f"Data file {fname} did not contain valid YAML data!")
-        return doc
-    except ParserError as pe:
-        raise BadYamlError(f"Data file {fname} could not be parsed: {pe}") from pe
+        doc = parse_file(fname)
+    except BadYamlError as bye:
+        raise BadYamlError(f"Data file {fname} could not be parsed: {bye}") from bye
     except FileNotFoundError as fnfe:
         raise fnfe
+    if not doc:
+        raise EmptyFileError(f"Data file {fname} contained no data!")
+    if not isinstance(doc, dict) and not isinstance(doc, list):
+        raise BadYamlError(f"Data file {fname} did not contain valid YAML data!")
+    return doc
+
+
+def _copy_doc(doc):
+    """Copy the containers of a document so callers cannot change the cached one."""
+    if isinstance(doc, dict):
+        return {key: _copy_doc(value) for key, value in doc.items()}
+    if isinstance(doc, list):
+        return [_copy_doc(value) for value in doc]
+    return doc
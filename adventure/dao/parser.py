@@ -0,0 +1,110 @@
+"""adventure/dao/parser -- the parsers used to read game data files.
+
+Every data file is read through `parse_file`, which picks a parser backend by
+the file's extension. YAML is read with libyaml's CSafeLoader when PyYAML was
+built with it and with the pure Python SafeLoader otherwise. JSON files are an
+alternative encoding of the same documents.
+"""
+
+import json
+import os
+from typing import Callable, Dict, NamedTuple, Optional, TextIO
+import yaml
+from adventure.exceptions import BadYamlError
+
+try:
+    from yaml import CSafeLoader as FastSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    FastSafeLoader = None
+
+# Extensions tried, in order, when a data file is named without one.
+DATA_EXTENSIONS = (".yml", ".yaml", ".json")
+
+
+class ParserBackend(NamedTuple):
+    """A named function that parses an open text stream into a document."""
+
+    name: str
+    load: Callable[[TextIO], object]
+
+
+def _yaml_backend(name: str, loader) -> ParserBackend:
+    def load(stream: TextIO):
+        try:
+            return yaml.load(stream, Loader=loader)
+        except yaml.YAMLError as pe:
+            raise BadYamlError(str(pe)) from pe
+
+    return ParserBackend(name=name, load=load)
+
+
+def _json_load(stream: TextIO):
+    try:
+        return json.load(stream)
+    except json.JSONDecodeError as jde:
+        raise BadYamlError(str(jde)) from jde
+
+
+BACKENDS: Dict[str, ParserBackend] = {
+    "yaml": _yaml_backend("yaml", yaml.SafeLoader),
+    "json": ParserBackend(name="json", load=_json_load),
+}
+if FastSafeLoader is not None:
+    BACKENDS["cyaml"] = _yaml_backend("cyaml", FastSafeLoader)
+
+# extension -> backend name
+EXTENSION_BACKENDS: Dict[str, str] = {
+    ".yml": "cyaml" if "cyaml" in BACKENDS else "yaml",
+    ".yaml": "cyaml" if "cyaml" in BACKENDS else "yaml",
+    ".json": "json",
+}
+
+
+def register_backend(name: str, load: Callable[[TextIO], object], *extensions: str):
+    """Add a parser backend and make it the parser for the given extensions."""
+    BACKENDS[name] = ParserBackend(name=name, load=load)
+    for ext in extensions:
+        EXTENSION_BACKENDS[ext.lower()] = name
+
+
+def backend_for(fname: str) -> ParserBackend:
+    """Return the parser backend used for a file, chosen by its extension."""
+    ext = os.path.splitext(fname)[1].lower()
+    return BACKENDS[EXTENSION_BACKENDS.get(ext, EXTENSION_BACKENDS[".yml"])]
+
+
+def parse_file(fname: str, backend: Optional[str] = None):
+    """Parse a data file.
+
+    Arguments:
+     - fname(str):      The data file to read.
+     - backend(str):    The name of the backend to use. Chosen by extension if unset.
+
+    Returns:
+     - The parsed document.
+
+    Raises:
+     - (FileNotFoundError): If the file does not exist.
+     - (BadYamlError):      If the file cannot be parsed.
+
+    """
+    parser = BACKENDS[backend] if backend else backend_for(fname)
+    with open(fname, "r", encoding="utf-8") as fh:
+        return parser.load(fh)
+
+
+def find_data_file(stem: str) -> Optional[str]:
+    """Find the data file for a path given without an extension.
+
+    Returns the first of `stem`.yml, `stem`.yaml or `stem`.json that exists,
+    or None if none of them do.
+    """
+    for ext in DATA_EXTENSIONS:
+        if os.path.isfile(stem + ext):
+            return stem + ext
+    return None
+
+
+def resolve_data_file(stem: str) -> str:
+    """Like `find_data_file`, but gives `stem`.yml if no data file exists."""
+    return find_data_file(stem) or stem + DATA_EXTENSIONS[0]
@@ -1,6 +1,15 @@
 """Default configuration values for the adventure game."""
 
+import os
+
 DEFAULT_DATA_DIR = "adventure/data"
 DEFAULT_COMMANDS_FILE = "commands.yml"
 DEFAULT_MAP_FILE = "maps/sparse_map.yml"
 DEFAULT_CONSOLE_WIDTH = 80
+# Documents kept by the document cache. Loading a map grows it to fit the map's
+# room files on top of this many; see adventure.dao.doc_yaml.
+DEFAULT_DOC_CACHE_SIZE = 1024
+DEFAULT_PARSE_CACHE_SIZE = 256
+# Build rooms, walls, doors and items with __slots__ instead of a __dict__ each.
+# Set ADVENTURE_COMPACT=0 to build them the old way, e.g. to compare memory use.
+COMPACT_OBJECTS = os.environ.get("ADVENTURE_COMPACT", "1") != "0"
@@ -16,6 +16,15 @@ class CommandError(Exception):
 class CommandNotFoundError(CommandError):
     """Raised when a command is not found in the command list."""
 
+    def __init__(self, *args, suggestions: list = None):
+        super().__init__(*args)
+        # Command words the player may have meant.
+        self.suggestions: list = suggestions or []
+
+
+class CommandAliasCollisionError(CommandError):
+    """Raised when two commands share a name or alias."""
+
 
 class InventoryError(Exception):
     """Base class for inventory-related exceptions."""
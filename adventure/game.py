@@ -1,44 +1,108 @@
 """adventure/game -- track the game state and history."""
 
-from adventure.rooms.room import Room
+import contextlib
+import io
+import re
+import time
+from typing import Iterable, NamedTuple, Optional
 from adventure.interpreter import Interpreter
+from adventure.journal import Journal
 from adventure.map.map import Map
+from adventure.map.overlay import RoomView, WorldOverlay
 from adventure.player.player import Player
+from adventure.save import SaveFile
 from adventure.ui.prompt import Prompt
-from adventure.ui.consoleui import BaseUI, ConsoleUI
+from adventure.ui.baseui import BaseUI
 from adventure.exceptions import CommandNotFoundError, BadStatementError
 
+# Color codes printed by commands are dropped from step output.
+_ANSI_CODE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+class StepResult(NamedTuple):
+    """What playing one statement did."""
+
+    input: str
+    output: str
+    # The name of the command the statement resolved to.
+    command: Optional[str]
+    # None, "BadStatementError", "CommandNotFoundError", or the name of the
+    # exception a command raised.
+    error: Optional[str]
+    suggestions: tuple
+    room_id: Optional[int]
+    # Seconds taken.
+    elapsed: float
+
 
 class Game:
-    """This is the game class."""
+    """This is the game class.
+
+    `run` plays the game interactively on the console. `step` and `step_many`
+    play statements from code and return `StepResult`s, without any UI.
+
+    Games given the same `world` share one loaded map; each keeps what its
+    player changed in its own `WorldOverlay`. Each game has its own `Player`.
+    """
 
     base_data_dir: str = ""
     is_running: bool
-    current_loc: Room = None
+    current_loc: RoomView = None
     ui: BaseUI
     prompt: Prompt
     interpreter: Interpreter
-    map: Map
-    player: Player = Player()
+    map: WorldOverlay
+    player: Player
 
-    def __init__(self, base_data_dir: str, map_file_name: str, cmd_file_name: str):
+    def __init__(
+        self,
+        base_data_dir: str,
+        map_file_name: str,
+        cmd_file_name: str,
+        strict: bool = False,
+        ui: BaseUI = None,
+        world: Map = None,
+        interpreter: Interpreter = None,
+        journal: Journal = None,
+        session: str = "",
+        save_file: str = "",
+    ):
         if not base_data_dir:
             raise ValueError("A base data directory must be provided.")
-        if not map_file_name:
+        if not map_file_name and world is None:
             raise ValueError("A map file name must be provided.")
-        if not cmd_file_name:
+        if not cmd_file_name and interpreter is None:
             raise ValueError("A commands file name must be provided.")
         self.base_data_dir = base_data_dir
         self.is_running = True
-        self.interpreter = Interpreter(commands_file=f"{base_data_dir}/{cmd_file_name}")
-        self.ui = ConsoleUI()
+        self.player = Player()
+        # An interpreter keeps no player state, so games can share one too.
+        self.interpreter = interpreter or Interpreter(
+            commands_file=f"{base_data_dir}/{cmd_file_name}", strict=strict
+        )
+        # Where the events commands emit are written, and who they came from.
+        self.journal = journal
+        self.session = session
+        # Where the save and restore commands keep the game, if they may.
+        self.saves = SaveFile(save_file) if save_file else None
+        # A console UI is only made when the game is run interactively.
+        self.ui = ui
         self.prompt = Prompt(ui=self.ui)
-        self.map = Map(base_data_dir=base_data_dir, file_name=map_file_name)
+        if world is None:
+            world = Map(base_data_dir=base_data_dir, file_name=map_file_name)
+        # The game's changes to the world are kept apart from it, so one loaded
+        # map can be shared by many games.
+        self.map = WorldOverlay(world)
         self.current_loc = self.map.get_room(self.map.start_room)
         self.prompt.load()
 
     def run(self):
         """Run the main game loop."""
+        if self.ui is None:
+            # Imported here so embedded games never load the console libraries.
+            from adventure.ui.consoleui import ConsoleUI
+
+            self.ui = self.prompt.ui = ConsoleUI()
         self.prompt.show("greeting", "yellow")
         self.prompt.show("opening", "blue")
         while self.is_running:
@@ -46,16 +110,87 @@ class Game:
                 stmt = self.prompt.read_input()
                 if not stmt:
                     continue
-                action = self.interpreter.prepare(stmt)
-                result = action.verb.do_action(
-                    self, action.args, action=action.tokens[0]
-                )
-                if result:
-                    self.prompt.display(result, "green")
-            except BadStatementError:
-                self.prompt.show("bad_statement", "red")
-            except CommandNotFoundError:
-                self.prompt.show("unknown_action", "red")
+                result = self.step(stmt)
+                if result.error == "BadStatementError":
+                    self.prompt.show("bad_statement", "red")
+                elif result.error == "CommandNotFoundError":
+                    self.prompt.show("unknown_action", "red")
+                    if result.suggestions:
+                        words = " or ".join(f"'{word}'" for word in result.suggestions)
+                        self.prompt.show("did_you_mean", "yellow", words=words)
+                elif result.output:
+                    self.prompt.display(
+                        result.output, "red" if result.error else "green"
+                    )
             except SystemExit:
                 self.prompt.show("Escape key pressed: exiting...")
         self.prompt.show("farewell", "blue")
+
+    def emit(self, event: NamedTuple):
+        """Record a change a command made to the game in the journal, if any."""
+        if self.journal is not None:
+            self.journal.append(event, self.session)
+
+    def step(self, text: str) -> StepResult:
+        """Play one statement and report what happened, without using the UI.
+
+        Anything the command prints is captured into the result's output.
+        """
+        printed = io.StringIO()
+        with contextlib.redirect_stdout(printed):
+            result = self._step(text, printed)
+        if self.journal is not None:
+            self.journal.flush_if_due()
+        return result
+
+    def step_many(self, texts: Iterable[str]) -> list[StepResult]:
+        """Play statements in order, stopping early if one ends the game.
+
+        The same as calling `step` for each, but output is captured once for
+        the whole batch.
+        """
+        results = []
+        printed = io.StringIO()
+        with contextlib.redirect_stdout(printed):
+            for text in texts:
+                if not self.is_running:
+                    break
+                results.append(self._step(text, printed))
+                printed.seek(0)
+                printed.truncate()
+        if self.journal is not None:
+            self.journal.flush_if_due()
+        return results
+
+    def _step(self, text: str, printed: io.StringIO) -> StepResult:
+        start = time.perf_counter()
+        command = error = None
+        output = ""
+        suggestions: tuple = ()
+        try:
+            statement = self.interpreter.prepare(text)
+            command = statement.verb.name
+            output = statement.verb.do_action(self, statement.phrase) or ""
+        except BadStatementError:
+            error = "BadStatementError"
+            output = self.prompt.msg.get("bad_statement", "")
+        except CommandNotFoundError as cnfe:
+            error = "CommandNotFoundError"
+            output = self.prompt.msg.get("unknown_action", "")
+            suggestions = tuple(cnfe.suggestions)
+        except Exception as excp:  # pylint: disable=broad-except
+            # A failing command is reported, not allowed to end the game.
+            error = type(excp).__name__
+            output = str(excp.args[0]) if excp.args else str(excp)
+        if printed.tell():
+            text_printed = _ANSI_CODE.sub("", printed.getvalue()).rstrip("\n")
+            output = f"{text_printed}\n{output}" if output else text_printed
+        return StepResult(
+            input=text,
+            output=output,
+            command=command,
+            error=error,
+            suggestions=suggestions,
+            room_id=self.current_loc.room_id if self.current_loc else None,
+            elapsed=time.perf_counter() - start,
+        )
@@ -0,0 +1,81 @@
+"""adventure/grammar -- sort the words of a statement into their roles.
+
+A statement's words after the verb are classified once into a `Phrase`:
+
+    throw the rock at me
+    ----- --- ---- -- --
+    verb  (article, dropped) direct object, preposition, indirect object
+
+Prepositions before the direct object ("look *at* the rock", "go *to* the
+north") are kept as particles. Words naming the player ("me", "myself") are
+flagged as self references. Commands are handed the Phrase, which cannot be
+changed, instead of a list of tokens to pick through.
+"""
+
+from typing import Iterable, NamedTuple, Optional
+from adventure.constants import articles, prepositions, self_words
+
+
+class Phrase(NamedTuple):
+    """The words of a statement, sorted by what they do."""
+
+    verb: str
+    direct: tuple = ()
+    preposition: Optional[str] = None
+    indirect: tuple = ()
+    particles: tuple = ()
+    direct_is_self: bool = False
+    indirect_is_self: bool = False
+
+    @property
+    def obj(self) -> Optional[str]:
+        """The head word of the direct object, if there is one."""
+        return self.direct[-1] if self.direct else None
+
+    @property
+    def target(self) -> Optional[str]:
+        """The head word of the indirect object, if there is one."""
+        return self.indirect[-1] if self.indirect else None
+
+
+def parse_phrase(verb: str, words: Iterable[str]) -> Phrase:
+    """Classify the words that follow a verb in one pass.
+
+    Arguments:
+     - verb(str):           The word the player used for the command.
+     - words(Iterable):     The rest of the statement's words, in order.
+
+    Returns:
+     - (Phrase):            The words sorted into their roles.
+
+    """
+    direct: list[str] = []
+    indirect: list[str] = []
+    particles: list[str] = []
+    preposition = None
+    direct_is_self = indirect_is_self = False
+    for word in words:
+        folded = word.casefold()
+        if folded in articles:
+            continue
+        if folded in prepositions:
+            if not direct:
+                particles.append(word)
+            elif preposition is None:
+                preposition = word
+            continue
+        if preposition is None:
+            direct.append(word)
+            direct_is_self = direct_is_self or folded in self_words
+        else:
+            indirect.append(word)
+            indirect_is_self = indirect_is_self or folded in self_words
+    return Phrase(
+        verb=verb,
+        direct=tuple(direct),
+        preposition=preposition,
+        indirect=tuple(indirect),
+        particles=tuple(particles),
+        direct_is_self=direct_is_self,
+        indirect_is_self=indirect_is_self,
+    )
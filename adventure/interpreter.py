@@ -1,21 +1,56 @@
 """Interpreter class for the adventure game."""
 
+from adventure.cache import CacheInfo, LRUCache
 from adventure.commands.command_list import CommandList
 from adventure.statement import Statement
 from adventure.exceptions import BadStatementError, CommandNotFoundError
 
-from adventure.defaults import DEFAULT_COMMANDS_FILE
+from adventure.defaults import DEFAULT_COMMANDS_FILE, DEFAULT_PARSE_CACHE_SIZE
 
 
 class Interpreter:
-    """Interpreter class handles both commands and statements."""
+    """Interpreter class handles both commands and statements.
 
-    def __init__(self, commands_file: str = DEFAULT_COMMANDS_FILE):
-        self.commands: CommandList = CommandList(commands_file)
+    Parsed statements are cached by their text with its spacing collapsed, so a
+    line the player has typed before is not tokenized or matched to a command
+    again. Set `cache_size` to 0 to parse every line from scratch. With
+    `strict`, every command's action is imported up front instead of on first
+    use.
+    """
+
+    def __init__(
+        self,
+        commands_file: str = DEFAULT_COMMANDS_FILE,
+        cache_size: int = DEFAULT_PARSE_CACHE_SIZE,
+        strict: bool = False,
+    ):
+        self.commands: CommandList = CommandList(commands_file, strict=strict)
         self.statements = []
+        # (number of commands, text with single spaces) -> ParsedStatement
+        self._parsed = LRUCache(maxsize=cache_size) if cache_size else None
 
     def prepare(self, stmt: str) -> Statement:
         """Intake a statement and make it ready for interpretation."""
+        # Lines that only differ in spacing split into the same tokens.
+        text = " ".join(stmt.split()) if stmt else ""
+        if self._parsed is None or not text:
+            return self._parse(stmt)
+        # Adding commands can change what an abbreviation means.
+        key = (len(self.commands), text)
+        parsed = self._parsed.get(key)
+        if parsed is None:
+            statement = self._parse(stmt)
+            self._parsed.put(key, statement.freeze())
+            return statement
+        return Statement.thaw(parsed._replace(stmt=stmt))
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit and miss statistics for the parsed statement cache."""
+        if self._parsed is None:
+            return CacheInfo(hits=0, misses=0, maxsize=0, currsize=0)
+        return self._parsed.info()
+
+    def _parse(self, stmt: str) -> Statement:
         try:
             statement = Statement(stmt, self.commands)
             # statement.verb = self.identify_verb(statement)
@@ -25,4 +60,4 @@ class Interpreter:
         except BadStatementError as e:
             raise BadStatementError from e
         except CommandNotFoundError as e:
-            raise CommandNotFoundError from e
+            raise CommandNotFoundError(suggestions=e.suggestions) from e
@@ -2,8 +2,8 @@
 
 from dataclasses import dataclass
 from typing import Dict, List
-from colorama import Fore, Style
 from adventure.items.item import Item
+from adventure.ui.colors import paint
 from adventure.exceptions import (
     ItemNotFoundError,
     ContainerNotFoundError,
@@ -143,7 +143,10 @@ class Hands(Container):
 class Inventory:
     """Defines the things that can hold things for the player."""
 
-    containers: List[Container] = []
+    containers: List[Container]
+
+    def __init__(self):
+        self.containers = []
 
     def get(self, name: str) -> Container:
         """Retrieve a named container from the Inventory.
@@ -172,7 +175,7 @@ class Inventory:
             )
         except ContainerNotFoundError:
             if not quiet:
-                print(Fore.CYAN + f"You add a {container.name} to your inventory.")
+                print(paint(f"You add a {container.name} to your inventory.", "cyan"))
             self.containers.append(container)
 
     def remove_container(self, name: str) -> Container:
@@ -238,16 +241,18 @@ class Inventory:
                 return True
             else:
                 print(
-                    Fore.LIGHTRED_EX
-                    + f"You cannot fit {item.name} in {container.name} right now."
-                    + Style.RESET_ALL
+                    paint(
+                        f"You cannot fit {item.name} in {container.name} right now.",
+                        "lightred_ex",
+                    )
                 )
                 return False
         except ContainerNotFoundError:
             print(
-                Fore.LIGHTRED_EX
-                + f"You seem to be unable to locate {container.short_desc}"
-                + Style.RESET_ALL
+                paint(
+                    f"You seem to be unable to locate {container.short_desc}",
+                    "lightred_ex",
+                )
             )
             return False
 
@@ -267,16 +272,18 @@ class Inventory:
                 container.insert(item)
                 return True
             print(
-                Fore.LIGHTRED_EX
-                + f"You can't seem to fit {item.name} into {container.name}"
-                + Style.RESET_ALL
+                paint(
+                    f"You can't seem to fit {item.name} into {container.name}",
+                    "lightred_ex",
+                )
             )
             return False
         except ContainerNotFoundError:
             print(
-                Fore.LIGHTRED_EX
-                + f"You seem to be unable to locate {container.short_desc}"
-                + Style.RESET_ALL
+                paint(
+                    f"You seem to be unable to locate {container.short_desc}",
+                    "lightred_ex",
+                )
             )
             return False
 
@@ -300,19 +307,18 @@ class Inventory:
                 dst_container.insert(item)
                 return True
             print(
-                Fore.LIGHTRED_EX
-                + f"You can't seem to fit {item.name} into {dst_container.name}"
-                + Style.RESET_ALL
+                paint(
+                    f"You can't seem to fit {item.name} into {dst_container.name}",
+                    "lightred_ex",
+                )
             )
             return False
         except ItemNotFoundError:
             print(
-                Fore.LIGHTRED_EX
-                + f"There's no {item_name} in {src_container.name}."
-                + Style.RESET_ALL
+                paint(f"There's no {item_name} in {src_container.name}.", "lightred_ex")
             )
         except ContainerNotFoundError as cnfe:
-            print(Fore.LIGHTRED_EX + f" {cnfe} " + Style.RESET_ALL)
+            print(paint(f" {cnfe} ", "lightred_ex"))
 
     def find_item(self, item_name: str) -> List[Dict[str, Item]]:
         """Search through all containers to find a named item."""
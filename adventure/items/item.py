@@ -1,15 +1,19 @@
 """adventure/item -- a class to handle things the player can pick up, move, or otherwise interact with."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from adventure.defaults import COMPACT_OBJECTS
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=COMPACT_OBJECTS)
 class Item:
     """Items are the nonliving things we encounter in the adventure."""
 
     name: str
     short_desc: str
     long_desc: str
+    # (room id, index in its contents) of a thing as the map loaded it; see
+    # adventure.save.
+    origin: tuple = field(default=None, repr=False, compare=False)
 
     def __str__(self):
         return f"{self.name} - {self.short_desc}"
@@ -28,7 +32,7 @@ class Item:
         return f"You examine the {self.name} closely: {self.long_desc}"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=COMPACT_OBJECTS)
 class HandheldItem(Item):
     """A handheld item is one that can be carried in the player's hands."""
 
@@ -44,7 +48,7 @@ class HandheldItem(Item):
         return f"You drop {self.name} on the ground."
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=COMPACT_OBJECTS)
 class ThrowableItem(HandheldItem):
     """A throwable item is one that can be thrown by the player."""
 
@@ -1,4 +1,5 @@
-import yaml
+from adventure.composite import composite_type, merge_bases
+from adventure.dao.doc_yaml import get_yaml_doc
 from adventure.items.item import Item, HandheldItem, ThrowableItem
 
 CLASS_MAP = {
@@ -9,21 +10,12 @@ CLASS_MAP = {
 
 def load_item_from_yaml(file_path: str) -> Item:
     """Load an item from a YAML file."""
-    with open(file_path, "r", encoding="utf8") as file:
-        data = yaml.safe_load(file)
+    return item_from_dict(get_yaml_doc(file_path))
 
-    base_classes = [Item]
-    for cls_name in data.get("classes", []):
-        if cls_name not in CLASS_MAP:
-            raise ValueError(f"Unknown item class: {cls_name}")
-        cls = CLASS_MAP[cls_name]
-        if cls:
-            for i, base in enumerate(base_classes):
-                if issubclass(cls, base):
-                    base_classes[i] = cls
-                    break
-            else:
-                base_classes.append(cls)
-    composite_item = type(data["name"].capitalize() + "Item", tuple(base_classes), {})
+
+def item_from_dict(data: dict) -> Item:
+    """Build an item from an already parsed item document."""
+    base_classes = merge_bases(Item, data.get("classes", []), CLASS_MAP, "item")
+    composite_item = composite_type(data["name"].capitalize() + "Item", base_classes)
     args = {key: value for key, value in data.items() if key != "classes"}
     return composite_item(**args)
@@ -0,0 +1,192 @@
+"""adventure/journal -- an append-only log of what changed in a game.
+
+Commands that change the game emit events: the player moved, a door was
+opened or closed, or an item moved between a room and a container. A game
+given a `Journal` writes each event as one line of compact JSON:
+
+    {"seq":3,"time":1760000000.125,"session":"1","event":"moved","source":1,"dest":2,"direction":"west"}
+
+so a journal can be read as a stream with `read_journal`, by tools as simple
+as `tail -f` and `jq`, without loading the game.
+
+`seq` numbers the events of each session from 1, so sessions must be named
+uniquely across everything writing to one file, e.g. after the process id.
+
+Lines are buffered and written in batches, and the file is only fsynced once
+per `sync_interval`, so keeping a journal costs little per command. Whoever
+owns a journal calls `flush_if_due` now and then, so events are written even
+while nothing new happens. A crash can lose the events of the last unwritten
+batch, and can leave a partial last line. Opening the journal again ends that
+line first, and `read_journal` leaves out any line it cannot decode.
+"""
+
+import json
+import os
+import time
+from typing import Iterator, NamedTuple, Optional
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_SYNC_INTERVAL = 1.0
+
+
+class Moved(NamedTuple):
+    """The player went from one room to another."""
+
+    source: int
+    dest: int
+    direction: str
+
+
+class DoorOpened(NamedTuple):
+    """A door in a wall of a room was opened."""
+
+    room: int
+    direction: str
+    door: str
+
+
+class DoorClosed(NamedTuple):
+    """A door in a wall of a room was closed."""
+
+    room: int
+    direction: str
+    door: str
+
+
+class ItemTransferred(NamedTuple):
+    """An item moved between two places; see `room_place` and `container_place`."""
+
+    item: str
+    source: str
+    dest: str
+
+
+# event class -> the name written in the journal
+EVENT_NAMES = {
+    Moved: "moved",
+    DoorOpened: "door_opened",
+    DoorClosed: "door_closed",
+    ItemTransferred: "item_transferred",
+}
+
+
+def room_place(room_id: int) -> str:
+    """How an item transfer names a room."""
+    return f"room/{room_id}"
+
+
+def container_place(name: str) -> str:
+    """How an item transfer names one of the player's containers."""
+    return f"inventory/{name}"
+
+
+class Journal:
+    """A buffered, append-only journal file.
+
+    Arguments:
+     - path(str):               The file to append events to.
+     - batch_size(int):         How many events to buffer before writing them.
+     - sync_interval(float):    The most seconds between writes, and between
+                                fsyncs. 0 writes and fsyncs every event.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.sync_interval = sync_interval
+        # session -> the seq of its last event
+        self.seqs: dict[str, int] = {}
+        self._buffer: list[str] = []
+        # Held open for appending until the journal is closed.
+        self._fh = open(path, "a", encoding="utf-8")
+        if _ends_mid_line(path):
+            # Cut off by a crash: end that line so the next event is on its own.
+            self._fh.write("\n")
+        self._last_sync = time.monotonic()
+
+    def append(self, event: NamedTuple, session: str = ""):
+        """Add an event to the journal."""
+        seq = self.seqs[session] = self.seqs.get(session, 0) + 1
+        record = {
+            "seq": seq,
+            "time": round(time.time(), 3),
+            "session": session,
+            "event": EVENT_NAMES[type(event)],
+        }
+        record.update(event._asdict())
+        self._buffer.append(json.dumps(record, separators=(",", ":")))
+        if (
+            len(self._buffer) >= self.batch_size
+            or time.monotonic() - self._last_sync >= self.sync_interval
+        ):
+            self.flush()
+
+    def flush_if_due(self):
+        """Write the buffered events if they have waited the sync interval."""
+        if self._buffer and time.monotonic() - self._last_sync >= self.sync_interval:
+            self.flush()
+
+    def flush(self, sync: bool = None):
+        """Write the buffered events.
+
+        They are fsynced too if `sync` is set, or by default if the sync
+        interval has passed.
+        """
+        if self._buffer:
+            self._fh.write("\n".join(self._buffer) + "\n")
+            self._buffer.clear()
+        self._fh.flush()
+        now = time.monotonic()
+        if sync or (sync is None and now - self._last_sync >= self.sync_interval):
+            os.fsync(self._fh.fileno())
+            self._last_sync = now
+
+    def close(self):
+        """Write and fsync anything buffered, and close the file."""
+        if self._fh.closed:
+            return
+        self.flush(sync=True)
+        self._fh.close()
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _ends_mid_line(path: str) -> bool:
+    with open(path, "rb") as fh:
+        if fh.seek(0, os.SEEK_END) == 0:
+            return False
+        fh.seek(-1, os.SEEK_END)
+        return fh.read(1) != b"\n"
+
+
+def read_journal(
+    path: str, session: Optional[str] = None, skipped: list = None
+) -> Iterator[dict]:
+    """Read the events in a journal, in order, optionally of one session only.
+
+    Lines that cannot be decoded, like one cut off by a crash, are left out,
+    and added to `skipped` if it is given.
+    """
+    with open(path, "r", encoding="utf-8", errors="replace") as fh:
+        for line in fh:
+            try:
+                if not line.endswith("\n"):
+                    # Cut off part way through writing.
+                    raise ValueError("unterminated line")
+                record = json.loads(line)
+                record_session = record["session"]
+            except (ValueError, TypeError, KeyError):
+                if skipped is not None:
+                    skipped.append(line)
+                continue
+            if session is None or record_session == session:
+                yield record
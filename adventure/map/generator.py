@@ -0,0 +1,321 @@
+"""adventure/map/generator -- write large procedural worlds for testing and benchmarks.
+
+    python -m adventure.map.generator OUT_DIR --rooms 10000 --topology grid
+
+A generated world is a complete data directory: a map plus its own rooms,
+walls, doors and things, in YAML or JSON, optionally with a compiled snapshot.
+Load it with `Map(base_data_dir=OUT_DIR, file_name=<returned map file>)`.
+"""
+
+import argparse
+import itertools
+import json
+import math
+import os
+import random
+from typing import Dict, List, Optional
+
+import yaml
+
+from adventure.map.direction import Direction
+
+TOPOLOGIES = ("grid", "random", "corridors")
+CORRIDOR_LENGTH = 100
+
+OPPOSITES = {
+    Direction.NORTH: Direction.SOUTH,
+    Direction.NORTHEAST: Direction.SOUTHWEST,
+    Direction.EAST: Direction.WEST,
+    Direction.SOUTHEAST: Direction.NORTHWEST,
+    Direction.SOUTH: Direction.NORTH,
+    Direction.SOUTHWEST: Direction.NORTHEAST,
+    Direction.WEST: Direction.EAST,
+    Direction.NORTHWEST: Direction.SOUTHEAST,
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+}
+CARDINALS = (Direction.NORTH, Direction.EAST, Direction.SOUTH, Direction.WEST)
+
+# A small vocabulary keeps the number of distinct composite room classes low.
+ADJECTIVES = ["damp", "dusty", "narrow", "wide", "cold", "dim", "quiet", "cramped"]
+NOUNS = ["chamber", "hall", "cell", "vault", "passage", "gallery", "alcove", "den"]
+
+WALLS = {
+    "gen_brick_wall": ("a brick wall", "Rows of old, soot-stained bricks."),
+    "gen_stone_wall": ("a stone wall", "Rough blocks of grey stone, tightly fitted."),
+    "gen_concrete_wall": ("a concrete wall", "A plain wall of poured concrete."),
+}
+DOORS = {
+    "gen_archway": ("archway", "a low stone archway", "An archway with no door."),
+    "gen_wooden_door": ("wooden_door", "a wooden door", "A door of heavy planks."),
+}
+THINGS = {
+    "gen_pebble": ("pebble", "a smooth pebble", "A small, smooth, grey pebble.", 0.1),
+    "gen_bottle": ("bottle", "an empty bottle", "A dusty glass bottle.", 0.5),
+    "gen_candle": ("candle", "a stub of candle", "A half burned tallow candle.", 0.2),
+}
+
+# room index -> {direction: room index}
+Links = List[Dict[Direction, int]]
+
+
+def generate_world(
+    base_dir: str,
+    rooms: int,
+    topology: str = "grid",
+    door_density: float = 1.0,
+    items_per_room: float = 0.5,
+    fmt: str = "yml",
+    seed: int = 0,
+    snapshot: bool = False,
+) -> str:
+    """Write a generated world into a data directory.
+
+    Arguments:
+     - base_dir(str):           The data directory to write the world into.
+     - rooms(int):              How many rooms to generate.
+     - topology(str):           "grid", "random" or "corridors".
+     - door_density(float):     The chance (0-1) that each optional connection
+                                is made. Every room can always be reached.
+     - items_per_room(float):   The average number of things in a room.
+     - fmt(str):                "yml" or "json".
+     - seed(int):               Seed for the random choices.
+     - snapshot(bool):          Also compile a snapshot of the world next to the map.
+
+    Returns:
+     - (str):                   The map file name, relative to `base_dir`.
+
+    Raises:
+     - (ValueError):            For an unknown topology or format, or no rooms.
+
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown topology: {topology}")
+    if fmt not in ("yml", "json"):
+        raise ValueError(f"Unknown data format: {fmt}")
+    if rooms < 1:
+        raise ValueError("A world needs at least one room.")
+    rng = random.Random(seed)
+    if topology == "grid":
+        links = _grid_links(rooms, door_density, rng)
+    elif topology == "random":
+        links = _random_links(rooms, door_density, rng)
+    else:
+        links = _corridor_links(rooms, door_density, rng)
+
+    dump = _dumper(fmt)
+    for kind in ("maps", "rooms", "walls", "doors", "things"):
+        os.makedirs(f"{base_dir}/{kind}", exist_ok=True)
+    _write_parts(base_dir, dump, fmt)
+
+    wall_types = sorted(WALLS)
+    door_types = sorted(DOORS)
+    thing_types = sorted(THINGS)
+    entries = []
+    for index, exits in enumerate(links):
+        wall_type = wall_types[index % len(wall_types)]
+        walls = []
+        for direction in sorted(set(CARDINALS) | set(exits)):
+            wall = {"name": direction.name.lower(), "type": wall_type}
+            if direction in exits:
+                wall["door"] = door_types[(index + exits[direction]) % len(door_types)]
+            walls.append(wall)
+        contains = []
+        for _ in range(_item_count(items_per_room, rng)):
+            contains.append(rng.choice(thing_types))
+        name = f"a {rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}"
+        dump(
+            {
+                "name": name,
+                "short_desc": name,
+                "long_desc": f"You stand in {name}, one of {rooms} rooms.",
+                "walls": walls,
+                "contains": contains,
+            },
+            f"{base_dir}/rooms/room_{index + 1}.{fmt}",
+        )
+        entries.append(
+            {
+                "id": index + 1,
+                "file": f"room_{index + 1}",
+                "exits": {
+                    direction.name.lower(): there + 1
+                    for direction, there in sorted(exits.items())
+                },
+            }
+        )
+
+    map_file = f"maps/{topology}_{rooms}.{fmt}"
+    dump(
+        {
+            "name": f"Generated {topology} world",
+            "description": f"A generated {topology} world of {rooms} rooms.",
+            "start_room": 1,
+            "rooms": entries,
+        },
+        f"{base_dir}/{map_file}",
+    )
+    if snapshot:
+        # Imported here; the map loader is not needed just to write files.
+        from adventure.map.map import Map
+
+        Map(
+            base_data_dir=base_dir,
+            file_name=map_file,
+            snapshot_file=snapshot_path(base_dir, map_file),
+        )
+    return map_file
+
+
+def snapshot_path(base_dir: str, map_file: str) -> str:
+    """Where `generate_world` writes the snapshot for a map."""
+    return f"{base_dir}/{os.path.splitext(map_file)[0]}.snapshot"
+
+
+def _link(links: Links, here: int, there: int, direction: Direction):
+    links[here][direction] = there
+    links[there][OPPOSITES[direction]] = here
+
+
+def _grid_links(rooms: int, density: float, rng: random.Random) -> Links:
+    """A square grid. Every row, and the first column, is always joined up."""
+    width = math.ceil(math.sqrt(rooms))
+    links: Links = [{} for _ in range(rooms)]
+    for index in range(rooms):
+        x, y = index % width, index // width
+        if x > 0:
+            _link(links, index, index - 1, Direction.WEST)
+        if y > 0 and (x == 0 or rng.random() < density):
+            _link(links, index, index - width, Direction.NORTH)
+    return links
+
+
+def _random_links(rooms: int, density: float, rng: random.Random) -> Links:
+    """A random spanning tree plus about `density` extra exits per room."""
+    links: Links = [{} for _ in range(rooms)]
+    for index in range(1, rooms):
+        # Try a few random earlier rooms, then the nearest one with a free side.
+        # The earlier rooms are only walked as far as needed.
+        candidates = itertools.chain(
+            [rng.randrange(index) for _ in range(8)], range(index - 1, -1, -1)
+        )
+        for other in candidates:
+            direction = _free_pair(links, index, other, rng)
+            if direction is not None:
+                _link(links, index, other, direction)
+                break
+    for _ in range(int(rooms * density)):
+        here, there = rng.randrange(rooms), rng.randrange(rooms)
+        if here == there or there in links[here].values():
+            continue
+        direction = _free_pair(links, here, there, rng)
+        if direction is not None:
+            _link(links, here, there, direction)
+    return links
+
+
+def _corridor_links(rooms: int, density: float, rng: random.Random) -> Links:
+    """East-west corridors joined end to end, with cross passages between them."""
+    links: Links = [{} for _ in range(rooms)]
+    for index in range(1, rooms):
+        if index % CORRIDOR_LENGTH:
+            _link(links, index, index - 1, Direction.WEST)
+        else:
+            # The start of each corridor is below the end of the last one.
+            _link(links, index, index - 1, Direction.UP)
+            continue
+        below = index - CORRIDOR_LENGTH
+        if below >= 0 and rng.random() < density:
+            _link(links, index, below, Direction.SOUTH)
+    return links
+
+
+def _free_pair(
+    links: Links, here: int, there: int, rng: random.Random
+) -> Optional[Direction]:
+    """A direction free in `here` whose opposite is free in `there`, or None."""
+    free = [
+        direction
+        for direction in OPPOSITES
+        if direction not in links[here] and OPPOSITES[direction] not in links[there]
+    ]
+    return rng.choice(free) if free else None
+
+
+def _item_count(mean: float, rng: random.Random) -> int:
+    """A whole number of items averaging `mean`."""
+    count = int(mean)
+    if rng.random() < mean - count:
+        count += 1
+    return count
+
+
+def _write_parts(base_dir: str, dump, fmt: str):
+    """Write the wall, door and thing types generated rooms are built from."""
+    for name, (short_desc, long_desc) in WALLS.items():
+        doc = {"name": name, "short_desc": short_desc, "long_desc": long_desc}
+        dump(doc, f"{base_dir}/walls/{name}.{fmt}")
+    for fname, (name, short_desc, long_desc) in DOORS.items():
+        doc = {"name": name, "short_desc": short_desc, "long_desc": long_desc}
+        dump(doc, f"{base_dir}/doors/{fname}.{fmt}")
+    for fname, (name, short_desc, long_desc, weight) in THINGS.items():
+        doc = {
+            "name": name,
+            "short_desc": short_desc,
+            "long_desc": long_desc,
+            "weight": weight,
+            "bulk": 1,
+            "classes": ["handheld", "throwable"],
+        }
+        dump(doc, f"{base_dir}/things/{fname}.{fmt}")
+
+
+def _dumper(fmt: str):
+    """A function that writes a document to a file in the given format."""
+    if fmt == "json":
+
+        def dump_json(doc, fname):
+            with open(fname, "w", encoding="utf-8") as fh:
+                json.dump(doc, fh, separators=(",", ":"))
+
+        return dump_json
+
+    try:
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+
+    def dump_yaml(doc, fname):
+        with open(fname, "w", encoding="utf-8") as fh:
+            yaml.dump(doc, fh, Dumper=Dumper, sort_keys=False)
+
+    return dump_yaml
+
+
+def main():
+    """Generate a world from the command line."""
+    args = argparse.ArgumentParser(description="Write a generated adventure world.")
+    args.add_argument("base_dir", help="the data directory to write the world into")
+    args.add_argument("--rooms", type=int, default=1000)
+    args.add_argument("--topology", choices=TOPOLOGIES, default="grid")
+    args.add_argument("--door-density", type=float, default=1.0)
+    args.add_argument("--items", type=float, default=0.5, help="average per room")
+    args.add_argument("--format", choices=["yml", "json"], default="yml")
+    args.add_argument("--seed", type=int, default=0)
+    args.add_argument("--snapshot", action="store_true", help="also compile it")
+    opts = args.parse_args()
+    map_file = generate_world(
+        opts.base_dir,
+        opts.rooms,
+        topology=opts.topology,
+        door_density=opts.door_density,
+        items_per_room=opts.items,
+        fmt=opts.format,
+        seed=opts.seed,
+        snapshot=opts.snapshot,
+    )
+    print(map_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,33 @@
 """adventure/map -- a class to handle the world in which the player roams."""
 
+import hashlib
 import os
 from dataclasses import dataclass, field
+from functools import partial
+from typing import Iterator
 from adventure.rooms.room import Room
-from adventure.rooms.room_loader import load_room_from_yaml
+from adventure.rooms.room_loader import (
+    DataFiles,
+    load_room_from_yaml,
+    read_room_docs,
+)
 from adventure.exceptions import BadYamlError
-from adventure.dao.doc_yaml import get_yaml_doc
+from adventure.dao.doc_yaml import get_yaml_doc, reserve_doc_cache
+from adventure.dao.parser import resolve_data_file
+from adventure.map.snapshot import (
+    DocRecorder,
+    SnapshotReader,
+    read_snapshot,
+    source_stamp,
+    write_snapshot,
+)
+from adventure.map.room_cache import (
+    EvictionPolicy,
+    RoomCache,
+    RoomState,
+    capture_state,
+    restore_state,
+)
 from adventure.defaults import DEFAULT_DATA_DIR
 
 
@@ -19,8 +41,23 @@ class Map:
     description: str = "A map of the adventure world."
     start_room: int = 1  # index of the starting room
     rooms: dict[str, Room] = field(default_factory=dict)
+    snapshot_file: str = field(default="")
+    lazy: bool = False
+    cache_size: int = 0
+    workers: int = 0
+    executor: str = "process"
 
-    def __init__(self, base_data_dir: str, file_name: str):
+    def __init__(
+        self,
+        base_data_dir: str,
+        file_name: str,
+        snapshot_file: str = "",
+        lazy: bool = False,
+        cache_size: int = 0,
+        eviction: EvictionPolicy = None,
+        workers: int = 0,
+        executor: str = "process",
+    ):
         if not os.path.isdir(base_data_dir):
             raise NotADirectoryError(f"Base data directory not found: {base_data_dir}")
         self.base_data_dir = base_data_dir
@@ -31,7 +68,55 @@ class Map:
             raise FileNotFoundError(f"Map file not found: {map_path}")
         self.file_name = map_path
         self.rooms = {}  # Initialize rooms as an empty dictionary
+        self.snapshot_file = snapshot_file
+        # A bounded room cache has to be able to build rooms again later.
+        self.lazy = lazy or cache_size > 0
+        self.cache_size = cache_size
+        if executor not in ("process", "thread"):
+            raise ValueError(f"Unknown room loading executor: {executor}")
+        self.workers = workers
+        self.executor = executor
+        # room id -> map entry, for rooms not built until first asked for
+        self._entries: dict[int, dict] = {}
+        # room id -> state as built, and as left when the room was evicted
+        self._pristine: dict[int, RoomState] = {}
+        self._saved: dict[int, RoomState] = {}
+        self._get_doc = get_yaml_doc
+        # Where this map's walls, doors and things were found.
+        self._data_files = DataFiles(base_data_dir)
+        self._fingerprint: bytes = None
+        recorder = None
+        if snapshot_file:
+            docs = read_snapshot(snapshot_file, map_path)
+            if docs is not None:
+                self._get_doc = SnapshotReader(docs)
+            else:
+                recorder = DocRecorder()
+                self._get_doc = recorder
         self.load_yaml()
+        if recorder is not None:
+            if self.lazy:
+                # A snapshot is only useful with every room in it, but a lazy
+                # map only needs their documents, not the rooms themselves.
+                for room_data in self._entries.values():
+                    read_room_docs(
+                        self._room_file(room_data),
+                        get_doc=recorder,
+                        data_files=self._data_files,
+                    )
+            write_snapshot(snapshot_file, map_path, recorder.docs)
+            # Rooms built later are read from their files like in any lazy
+            # map, so the recorded documents are not all kept.
+            self._get_doc = get_yaml_doc
+        if not self.lazy:
+            self._get_doc = get_yaml_doc
+        if cache_size:
+            self.rooms = RoomCache(
+                cache_size,
+                game_map=self,
+                policy=eviction,
+                on_evict=self._write_back,
+            )
 
     def __str__(self):
         return f"{self.name} - {self.description}"
@@ -51,17 +136,28 @@ class Map:
         """
         if room_index in self.rooms:
             return self.rooms[room_index]
+        if room_index in self._entries:
+            room = self._build_room(self._entries[room_index])
+            self.rooms[room_index] = room
+            return room
         raise IndexError("Room index out of bounds.")
 
     def load_yaml(self):
         """Load rooms from a YAML document.
 
+        In lazy mode the room entries are only indexed and checked for unique
+        IDs here; each room is built on the first `get_room` call for it.
+
+        With more than one worker the room files are read on a process pool
+        (or rooms built on a thread pool) while the ID checks and exits still
+        run in map order, so errors are the same as loading one at a time.
+
         Args:
          - yaml_doc (str): The path to the YAML document containing room definitions.
 
         """
         try:
-            map_data = get_yaml_doc(self.file_name)
+            map_data = self._get_doc(self.file_name)
         except BadYamlError as bye:
             raise bye from bye
 
@@ -70,18 +166,112 @@ class Map:
         self.start_room = map_data.get("start_room", 1)
 
         # Load room files listed in the map document
-        for room_data in map_data.get("rooms", []):
-            room = load_room_from_yaml(
-                f"{self.base_data_dir}/rooms/{room_data['file']}.yml"
-            )
+        room_entries = map_data.get("rooms", [])
+        if not self.lazy:
+            # Keep every room file cached for the next load of this map. Lazy
+            # maps read theirs as rooms are asked for, and may bound how many.
+            reserve_doc_cache(len(room_entries))
+        if self.lazy:
+            rooms = (None for _ in room_entries)
+        elif self.workers > 1 and not isinstance(self._get_doc, SnapshotReader):
+            rooms = self._load_rooms_parallel(room_entries)
+        else:
+            rooms = (self._build_room(room_data) for room_data in room_entries)
+        for room_data, room in zip(room_entries, rooms):
             if not room_data.get("id"):
                 raise ValueError(
                     "Room ID Unset: Each room in map YAML must have a unique 'id' field."
                 )
-            if room_data["id"] in self.rooms:
+            if room_data["id"] in self.rooms or room_data["id"] in self._entries:
                 raise ValueError(
                     f"Duplicate room id {room_data['id']} found in map YAML."
                 )
-            self.rooms[room_data["id"]] = room
-            room_exits = room_data.get("exits", {})
-            room.connect_exits(exit_map=room_exits)
+            if self.lazy:
+                self._entries[room_data["id"]] = room_data
+            else:
+                self.rooms[room_data["id"]] = room
+
+    def _room_file(self, room_data: dict) -> str:
+        """Get the path of the room file for a map entry."""
+        return resolve_data_file(f"{self.base_data_dir}/rooms/{room_data['file']}")
+
+    def _build_room(self, room_data: dict, get_doc=None) -> Room:
+        """Load the room for a map entry and connect its exits."""
+        room = load_room_from_yaml(
+            self._room_file(room_data),
+            get_doc=get_doc or self._get_doc,
+            data_files=self._data_files,
+        )
+        room.connect_exits(exit_map=room_data.get("exits", {}))
+        room.room_id = room_data.get("id")
+        for index, item in enumerate(room.contents):
+            item.origin = (room.room_id, index)
+        if self.cache_size:
+            self._pristine[room.room_id] = capture_state(room)
+            if room.room_id in self._saved:
+                restore_state(room, self._saved[room.room_id])
+        return room
+
+    def _load_rooms_parallel(self, room_entries: list[dict]) -> Iterator[Room]:
+        """Build the rooms for the map entries on a worker pool, in map order."""
+        # Imported here; most maps are loaded without a pool.
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        if self.executor == "thread":
+            pool = ThreadPoolExecutor(max_workers=self.workers)
+            try:
+                yield from pool.map(self._build_room, room_entries)
+            finally:
+                pool.shutdown(cancel_futures=True)
+            return
+        # Rooms are built from composite classes that cannot be pickled, so the
+        # worker processes only parse documents and the rooms are built here.
+        files = [self._room_file(room_data) for room_data in room_entries]
+        chunksize = max(1, len(files) // (self.workers * 8))
+        pool = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            read_docs = partial(read_room_docs, data_files=self._data_files)
+            all_docs = pool.map(read_docs, files, chunksize=chunksize)
+            for room_data, docs in zip(room_entries, all_docs):
+                if isinstance(self._get_doc, DocRecorder):
+                    self._get_doc.docs.update(docs)
+                yield self._build_room(room_data, SnapshotReader(docs, self._get_doc))
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    def _write_back(self, room_id: int, room: Room):
+        """Keep the state of an evicted room if the player changed it."""
+        state = capture_state(room)
+        if state.same_as(self._pristine.pop(room_id)):
+            self._saved.pop(room_id, None)
+        else:
+            self._saved[room_id] = state
+
+    def neighbours(self, room_id: int) -> list[int]:
+        """Get the IDs of the rooms the exits of a room lead to."""
+        if room_id in self._entries:
+            return list(self._entries[room_id].get("exits", {}).values())
+        room = self.rooms[room_id]
+        return [door.leads_to for door in room.get_doors() if door.leads_to]
+
+    def fingerprint(self) -> bytes:
+        """Get a digest of the map file and room files this map is loaded from.
+
+        It changes when any of those files is changed, moved or resized, so
+        it tells whether state recorded against this map, like a save, still
+        fits it. Worked out from the files the first time it is asked for.
+        """
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            files = [self.file_name] + [
+                self._room_file(room_data)
+                for room_data in get_yaml_doc(self.file_name).get("rooms", [])
+            ]
+            for fname in files:
+                try:
+                    stamp = source_stamp(fname)
+                except OSError:
+                    stamp = None
+                digest.update(repr((fname, stamp)).encode("utf-8"))
+            self._fingerprint = digest.digest()
+        return self._fingerprint
@@ -0,0 +1,248 @@
+"""adventure/map/overlay -- one player's changes to a map shared with others.
+
+A `WorldOverlay` wraps a loaded `Map` that many games share. Rooms got from
+the overlay are `RoomView`s: reading a room, its walls or its doors reads the
+shared map, while opening or closing a door, or taking things from or leaving
+things in a room, is kept in the overlay and never touches the shared map.
+Nothing is copied until it is changed, so an overlay only grows with what its
+player changed: a door's state, or the contents of a room things were moved
+in or out of.
+
+The methods that would change the shared map's layout, like `Door.connect` or
+`Room.add_wall`, are not available through the views: they raise
+`AttributeError` instead of changing the map under every other player.
+"""
+
+from collections.abc import MutableSequence
+from typing import Iterator
+from adventure.items.item import Item
+from adventure.map.map import Map
+from adventure.rooms.door import Door
+from adventure.rooms.room import Room
+from adventure.rooms.wall import Wall
+
+# room id, wall index, door index
+DoorKey = tuple[int, int, int]
+
+
+class WorldOverlay:
+    """A player's private changes over a shared map.
+
+    Anything not changed here, like the map's name or `neighbours`, is read
+    from the shared map.
+    """
+
+    def __init__(self, world: Map):
+        self.world = world
+        # door -> {attribute: value} where it differs from the shared door
+        self._doors: dict[DoorKey, dict[str, bool]] = {}
+        # room id -> the room's contents, once they were changed
+        self._contents: dict[int, list[Item]] = {}
+
+    def __getattr__(self, name: str):
+        return getattr(self.world, name)
+
+    def get_room(self, room_index: int) -> "RoomView":
+        """Get a room of the shared map as this player sees it."""
+        return RoomView(self.world.get_room(room_index), self)
+
+    def changed_rooms(self) -> set[int]:
+        """The IDs of the rooms with a door or contents changed by this player."""
+        return {key[0] for key in self._doors} | set(self._contents)
+
+    def changed_doors(self) -> dict[DoorKey, dict[str, bool]]:
+        """The door attributes this player changed, by door. Do not modify."""
+        return self._doors
+
+    def changed_contents(self) -> dict[int, list[Item]]:
+        """The contents of the rooms this player changed, by room. Do not modify."""
+        return self._contents
+
+    def reset(
+        self,
+        doors: dict[DoorKey, dict[str, bool]] = None,
+        contents: dict[int, list[Item]] = None,
+    ):
+        """Replace this player's changes, e.g. with ones restored from a save."""
+        self._doors = doors or {}
+        self._contents = contents or {}
+
+
+def _shared(view, target, name: str):
+    """Read an attribute of the shared object behind a view."""
+    if name in type(view).unshared:
+        raise AttributeError(
+            f"{type(view).__name__} has no '{name}': it would change the shared map."
+        )
+    return getattr(target, name)
+
+
+class _DoorState:
+    """A door attribute read from the overlay if it was changed, else the door."""
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, view: "DoorView", owner=None):
+        if view is None:
+            return self
+        state = view.overlay._doors.get(view.key)
+        if state and self.name in state:
+            return state[self.name]
+        return getattr(view.door, self.name)
+
+    def __set__(self, view: "DoorView", value: bool):
+        doors = view.overlay._doors
+        if value == getattr(view.door, self.name):
+            # Back as it is in the shared map, so there is nothing to keep.
+            state = doors.get(view.key)
+            if state:
+                state.pop(self.name, None)
+                if not state:
+                    del doors[view.key]
+        else:
+            doors.setdefault(view.key, {})[self.name] = value
+
+
+class DoorView:
+    """A shared door, with its open, locked and blocked state kept per player."""
+
+    __slots__ = ("door", "overlay", "key")
+
+    is_open = _DoorState()
+    is_locked = _DoorState()
+    is_blocked = _DoorState()
+
+    lock = Door.lock
+    unlock = Door.unlock
+    open = Door.open
+    close = Door.close
+    block = Door.block
+    unblock = Door.unblock
+    # Methods of the shared door that would change it for every player.
+    unshared = frozenset({"connect"})
+
+    def __init__(self, door: Door, overlay: WorldOverlay, key: DoorKey):
+        self.door = door
+        self.overlay = overlay
+        self.key = key
+
+    def __getattr__(self, name: str):
+        return _shared(self, self.door, name)
+
+    def __repr__(self):
+        return f"DoorView({self.door!r})"
+
+
+class WallView:
+    """A shared wall whose doors are `DoorView`s."""
+
+    __slots__ = ("wall", "doors")
+
+    has_door = Wall.has_door
+    get_door = Wall.get_door
+    unshared = frozenset({"add_door"})
+
+    def __init__(self, wall: Wall, overlay: WorldOverlay, key: tuple[int, int]):
+        self.wall = wall
+        self.doors = [
+            DoorView(door, overlay, key + (index,))
+            for index, door in enumerate(wall.doors)
+        ]
+
+    def __getattr__(self, name: str):
+        return _shared(self, self.wall, name)
+
+    def __repr__(self):
+        return f"WallView({self.wall!r})"
+
+
+class ContentsView(MutableSequence):
+    """The contents of a shared room, copied for the player on the first change."""
+
+    __slots__ = ("room", "overlay")
+
+    def __init__(self, room: Room, overlay: WorldOverlay):
+        self.room = room
+        self.overlay = overlay
+
+    def _items(self) -> list[Item]:
+        return self.overlay._contents.get(self.room.room_id, self.room.contents)
+
+    def _private(self) -> list[Item]:
+        contents = self.overlay._contents
+        if self.room.room_id not in contents:
+            contents[self.room.room_id] = list(self.room.contents)
+        return contents[self.room.room_id]
+
+    def __getitem__(self, index):
+        return self._items()[index]
+
+    def __len__(self) -> int:
+        return len(self._items())
+
+    def __iter__(self) -> Iterator[Item]:
+        return iter(self._items())
+
+    def __contains__(self, item) -> bool:
+        return item in self._items()
+
+    def __setitem__(self, index, item):
+        self._private()[index] = item
+
+    def __delitem__(self, index):
+        del self._private()[index]
+
+    def insert(self, index: int, value: Item):
+        self._private().insert(index, value)
+
+    def append(self, value: Item):
+        self._private().append(value)
+
+    def remove(self, value: Item):
+        self._private().remove(value)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, ContentsView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self._items())
+
+
+class RoomView:
+    """A room of a shared map as one player sees it.
+
+    Reads the same as a `Room`. Its walls are `WallView`s and its contents a
+    `ContentsView`, so changes made through it go to the overlay.
+    """
+
+    __slots__ = ("room", "walls", "contents")
+
+    get_walls = Room.get_walls
+    show_doors = Room.show_doors
+    get_doors = Room.get_doors
+    get_exits = Room.get_exits
+    get_door_wall = Room.get_door_wall
+    in_room = Room.in_room
+    unshared = frozenset({"add_wall", "add_door", "connect_exits"})
+
+    def __init__(self, room: Room, overlay: WorldOverlay):
+        self.room = room
+        self.walls = [
+            None if wall is None else WallView(wall, overlay, (room.room_id, index))
+            for index, wall in enumerate(room.walls)
+        ]
+        self.contents = ContentsView(room, overlay)
+
+    def __getattr__(self, name: str):
+        return _shared(self, self.room, name)
+
+    @property
+    def inhabitants(self) -> tuple:
+        """The shared room's inhabitants, which a player cannot change."""
+        return tuple(self.room.inhabitants)
+
+    def __repr__(self):
+        return f"RoomView({self.room.room_id}, {self.room.name!r})"
@@ -0,0 +1,172 @@
+"""adventure/map/room_cache -- keep only some of a map's rooms built at once.
+
+A `RoomCache` holds at most `maxsize` rooms. When it is full, its eviction
+policy picks a room to drop and the cache hands that room to an `on_evict`
+callback, which lets the map save whatever the player changed in it.
+"""
+
+from collections import OrderedDict, deque
+from collections.abc import MutableMapping
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+from adventure.rooms.room import Room
+
+
+class EvictionPolicy:
+    """Decides which cached room to drop when the cache is full."""
+
+    def touch(self, room_id: int):
+        """Note that a room was used."""
+
+    def forget(self, room_id: int):
+        """Note that a room left the cache."""
+
+    def victim(self, room_ids: Iterable[int], game_map) -> int:
+        """Pick one of `room_ids` to evict."""
+        raise NotImplementedError("This method should be implemented by subclasses.")
+
+
+class LRUEviction(EvictionPolicy):
+    """Evict the least recently used room."""
+
+    def __init__(self):
+        self._order: OrderedDict = OrderedDict()
+
+    def touch(self, room_id: int):
+        self._order[room_id] = None
+        self._order.move_to_end(room_id)
+
+    def forget(self, room_id: int):
+        self._order.pop(room_id, None)
+
+    def victim(self, room_ids: Iterable[int], game_map) -> int:
+        candidates = set(room_ids)
+        for room_id in self._order:
+            if room_id in candidates:
+                return room_id
+        return next(iter(candidates))
+
+
+class DistanceEviction(LRUEviction):
+    """Evict the room the most exits away from where the player is.
+
+    Rooms that cannot be reached at all go first; ties go to the least
+    recently used room.
+    """
+
+    def __init__(self, origin: Callable[[], Optional[int]]):
+        super().__init__()
+        self.origin = origin
+
+    def victim(self, room_ids: Iterable[int], game_map) -> int:
+        room_ids = set(room_ids)
+        origin = self.origin()
+        candidates = [
+            room_id
+            for room_id in self._order
+            if room_id in room_ids and room_id != origin
+        ]
+        if origin is None or not candidates:
+            return super().victim(room_ids, game_map)
+        # Search outwards only until every candidate is found, not the whole map.
+        distance = {origin: 0}
+        unfound = set(candidates)
+        queue = deque([origin])
+        while queue and unfound:
+            here = queue.popleft()
+            for there in game_map.neighbours(here):
+                if there not in distance:
+                    distance[there] = distance[here] + 1
+                    unfound.discard(there)
+                    queue.append(there)
+        farthest = float("inf")
+        return max(candidates, key=lambda room_id: distance.get(room_id, farthest))
+
+
+class RoomCache(MutableMapping):
+    """A bounded room id -> Room mapping with a pluggable eviction policy."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        game_map=None,
+        policy: EvictionPolicy = None,
+        on_evict: Callable[[int, Room], None] = None,
+    ):
+        if maxsize < 1:
+            raise ValueError("A room cache must hold at least one room.")
+        self.maxsize = maxsize
+        self.game_map = game_map
+        self.policy = policy or LRUEviction()
+        self.on_evict = on_evict
+        self.evictions = 0
+        self._rooms: dict[int, Room] = {}
+
+    def __getitem__(self, room_id: int) -> Room:
+        room = self._rooms[room_id]
+        self.policy.touch(room_id)
+        return room
+
+    def __setitem__(self, room_id: int, room: Room):
+        self._rooms[room_id] = room
+        self.policy.touch(room_id)
+        while len(self._rooms) > self.maxsize:
+            others = [other for other in self._rooms if other != room_id]
+            self.evict(self.policy.victim(others, self.game_map))
+
+    def __delitem__(self, room_id: int):
+        del self._rooms[room_id]
+        self.policy.forget(room_id)
+
+    def __contains__(self, room_id) -> bool:
+        return room_id in self._rooms
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._rooms)
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def evict(self, room_id: int):
+        """Drop a room from the cache, handing it to `on_evict` first."""
+        room = self._rooms[room_id]
+        if self.on_evict:
+            self.on_evict(room_id, room)
+        del self[room_id]
+        self.evictions += 1
+
+
+class RoomState(NamedTuple):
+    """What a player can change about a room: its doors and its contents."""
+
+    # (wall index, door index, is_open, is_locked, is_blocked) for each door
+    doors: tuple
+    contents: list
+
+    def same_as(self, other: "RoomState") -> bool:
+        """Check if two states would look the same to the player."""
+        mine = [item.name for item in self.contents]
+        theirs = [item.name for item in other.contents]
+        return self.doors == other.doors and mine == theirs
+
+
+def capture_state(room: Room) -> RoomState:
+    """Record the changeable state of a room."""
+    doors = []
+    for wall_index, wall in enumerate(room.walls):
+        if wall is None:
+            continue
+        for door_index, door in enumerate(wall.doors):
+            doors.append(
+                (wall_index, door_index, door.is_open, door.is_locked, door.is_blocked)
+            )
+    return RoomState(doors=tuple(doors), contents=list(room.contents))
+
+
+def restore_state(room: Room, state: RoomState):
+    """Put a room back into a recorded state."""
+    for wall_index, door_index, is_open, is_locked, is_blocked in state.doors:
+        door = room.walls[wall_index].doors[door_index]
+        door.is_open = is_open
+        door.is_locked = is_locked
+        door.is_blocked = is_blocked
+    room.contents = list(state.contents)
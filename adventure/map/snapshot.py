@@ -0,0 +1,101 @@
+"""adventure/map/snapshot -- a compiled, single file image of a map and its data files.
+
+A snapshot holds every parsed document a map needed when it was loaded: the
+map itself plus all of the rooms, walls, doors and things they refer to. It
+also records the modification time and size of each of those files so a stale
+snapshot can be detected and rebuilt.
+
+Snapshots are pickled, so only load snapshots that you built yourself.
+"""
+
+import os
+import pickle
+from typing import Callable, Dict, Optional
+from adventure.dao.doc_yaml import get_yaml_doc
+
+SNAPSHOT_VERSION = 1
+
+
+class DocRecorder:
+    """Read documents from disk and remember every one of them."""
+
+    def __init__(self, get_doc: Callable = get_yaml_doc):
+        self.get_doc = get_doc
+        self.docs: Dict[str, object] = {}
+
+    def __call__(self, fname: str):
+        doc = self.get_doc(fname)
+        self.docs[fname] = doc
+        return doc
+
+
+class SnapshotReader:
+    """Serve documents from a snapshot, falling back to disk for anything missing."""
+
+    def __init__(self, docs: Dict[str, object], get_doc: Callable = get_yaml_doc):
+        self.docs = docs
+        self.get_doc = get_doc
+
+    def __call__(self, fname: str):
+        if fname in self.docs:
+            return self.docs[fname]
+        return self.get_doc(fname)
+
+
+def source_stamp(fname: str) -> tuple[int, int]:
+    """Return the (mtime_ns, size) pair used to decide if a source file changed."""
+    stat = os.stat(fname)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def write_snapshot(snapshot_file: str, map_file: str, docs: Dict[str, object]):
+    """Write the documents read for a map out to a snapshot file.
+
+    Arguments:
+     - snapshot_file(str):  Where to write the snapshot.
+     - map_file(str):       The map file the documents were loaded for.
+     - docs(dict):          Parsed documents keyed by the path they were read from.
+
+    """
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "map_file": map_file,
+        "sources": {fname: source_stamp(fname) for fname in docs},
+        "docs": docs,
+    }
+    tmp_file = f"{snapshot_file}.tmp"
+    with open(tmp_file, "wb") as fh:
+        pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, snapshot_file)
+
+
+def read_snapshot(snapshot_file: str, map_file: str) -> Optional[Dict[str, object]]:
+    """Read the documents out of a snapshot if it is still fresh.
+
+    Arguments:
+     - snapshot_file(str):  The snapshot to read.
+     - map_file(str):       The map file the snapshot is expected to be built from.
+
+    Returns:
+     - (dict | None):       The documents keyed by path, or None if the snapshot
+                            is missing, unreadable or any source file changed.
+
+    """
+    try:
+        with open(snapshot_file, "rb") as fh:
+            payload = pickle.load(fh)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("version") != SNAPSHOT_VERSION:
+        return None
+    if payload.get("map_file") != map_file:
+        return None
+    for fname, stamp in payload.get("sources", {}).items():
+        try:
+            if source_stamp(fname) != tuple(stamp):
+                return None
+        except OSError:
+            return None
+    return payload.get("docs")
@@ -1,6 +1,6 @@
 """Player class for the adventure game."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from adventure.inventory import Inventory, Hands
 
@@ -11,7 +11,7 @@ class Player:
 
     name: str = "Player"
     description: str = "You look just like you always have."
-    inventory: Inventory = Inventory()
+    inventory: Inventory = field(default_factory=Inventory)
 
     def __post_init__(self):
         """Initialize the player's inventory with hands."""
@@ -0,0 +1,244 @@
+"""adventure/prefork -- serve from several worker processes sharing one loaded world.
+
+    python main.py --serve 4000 --prefork 4
+    kill -USR1 <parent pid>     # print each worker's shared and private memory
+
+The parent process loads the map and commands once, opens the listening
+socket, and forks the workers. Each worker runs a `GameServer` with many
+sessions on the socket it inherited, so the kernel hands each new connection
+to whichever worker accepts it first.
+
+After a fork the loaded world is shared with the parent until a process
+writes to the memory it is in. The garbage collector would write to every
+object it tracks as it scans them, so collection is turned off while loading
+and the loaded objects are moved out of its reach with `gc.freeze()` before
+forking. The parent restarts workers that exit, and on SIGINT or SIGTERM stops
+them all and waits for them.
+
+Linux only: workers are forked and memory is read from /proc.
+"""
+
+import asyncio
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+from typing import NamedTuple, Optional, TextIO
+
+from adventure.server import GameServer
+
+# A worker that exits sooner than this after starting is restarted only after
+# waiting this long, so a worker that cannot start does not fork in a loop.
+RESTART_DELAY = 1.0
+LISTEN_BACKLOG = 1024
+
+
+class MemoryUsage(NamedTuple):
+    """How much of a process's memory is shared with others, in kB."""
+
+    pid: int
+    rss: int
+    # Proportional set size: shared pages count divided by how many share them.
+    pss: int
+    shared: int
+    private: int
+
+
+def memory_usage(pid: int) -> Optional[MemoryUsage]:
+    """Read a process's memory use from /proc, or None if it cannot be read."""
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "r", encoding="utf-8") as fh:
+            lines = fh.readlines()
+    except OSError:
+        return None
+    fields = {}
+    for line in lines[1:]:
+        key, _, value = line.partition(":")
+        parts = value.split()
+        if parts:
+            fields[key] = int(parts[0])
+    if not fields:
+        # An exited process that has not been waited for yet.
+        return None
+    return MemoryUsage(
+        pid=pid,
+        rss=fields.get("Rss", 0),
+        pss=fields.get("Pss", 0),
+        shared=fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+        private=fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    )
+
+
+def format_memory(usages: list[MemoryUsage]) -> str:
+    """A table of memory use, one process per line."""
+    headings = ("rss kB", "pss kB", "shared kB", "private kB")
+    lines = [f"{'pid':>8} " + " ".join(f"{heading:>10}" for heading in headings)]
+    for usage in usages:
+        lines.append(
+            f"{usage.pid:>8} {usage.rss:>10} {usage.pss:>10} "
+            f"{usage.shared:>10} {usage.private:>10}"
+        )
+    return "\n".join(lines)
+
+
+class PreforkServer:
+    """A parent process that loads a world and supervises forked workers.
+
+    Arguments:
+     - server(GameServer):  What each worker serves. Loaded in the parent.
+     - workers(int):        How many worker processes to run.
+     - host(str), port(int):
+                            The address to listen on. Port 0 picks a free one.
+    """
+
+    def __init__(
+        self,
+        server: GameServer,
+        workers: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        if not hasattr(os, "fork"):
+            raise OSError("Pre-fork serving needs os.fork.")
+        self.server = server
+        self.workers = workers or os.cpu_count() or 1
+        self.host = host
+        self.port = port
+        # worker pid -> when it was started
+        self.pids: dict[int, float] = {}
+        self.stopping = False
+        self.sock: Optional[socket.socket] = None
+        # Where SIGUSR1 writes the memory report.
+        self.report: TextIO = sys.stderr
+
+    def start(self) -> int:
+        """Load the world, start listening and fork the workers. Returns the port.
+
+        The signal handlers `supervise` documents are installed first, so the
+        parent can be signalled as soon as it has started.
+        """
+        signal.signal(signal.SIGINT, lambda *_: self.stop())
+        signal.signal(signal.SIGTERM, lambda *_: self.stop())
+        signal.signal(
+            signal.SIGUSR1,
+            lambda *_: print(self.format_report() + "\n", file=self.report),
+        )
+        gc.disable()
+        try:
+            self.server.load()
+            self.sock = socket.create_server(
+                (self.host, self.port), backlog=LISTEN_BACKLOG
+            )
+            self.sock.setblocking(False)
+            self.port = self.sock.getsockname()[1]
+            gc.collect()
+            gc.freeze()
+        finally:
+            # What was loaded is frozen, so collecting no longer touches it.
+            gc.enable()
+        for _ in range(self.workers):
+            if self.stopping:
+                break
+            self._spawn()
+        return self.port
+
+    def _spawn(self):
+        # Anything still buffered would otherwise be written again by the worker.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            self._run_worker()
+        self.pids[pid] = time.monotonic()
+
+    def _run_worker(self):
+        """Serve in a forked worker until told to stop. Never returns."""
+        code = 0
+        try:
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(signum, signal.SIG_DFL)
+            # Only the parent reports memory; a stray SIGUSR1 must not kill a worker.
+            signal.signal(signal.SIGUSR1, signal.SIG_IGN)
+            asyncio.run(self._serve())
+        except SystemExit as exit_:
+            code = exit_.code if isinstance(exit_.code, int) else 1
+        except KeyboardInterrupt:
+            code = 1
+        except BaseException:  # pylint: disable=broad-except
+            # Otherwise a worker that cannot start is restarted with no word why.
+            print(
+                f"Worker {os.getpid()} failed:\n{traceback.format_exc()}",
+                file=sys.stderr,
+            )
+            code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)  # pylint: disable=protected-access
+
+    async def _serve(self):
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        await self.server.start(sock=self.sock)
+        try:
+            await stop.wait()
+        finally:
+            await self.server.close()
+
+    def supervise(self, report: TextIO = None):
+        """Wait on the workers, restarting any that exit, until `stop` is called.
+
+        SIGINT and SIGTERM stop the workers; SIGUSR1 writes a memory report,
+        followed by a blank line, to `report` (stderr by default).
+        """
+        if report is not None:
+            self.report = report
+        while self.pids:
+            try:
+                pid, _ = os.wait()
+            except ChildProcessError:
+                break
+            started = self.pids.pop(pid, None)
+            if started is None or self.stopping:
+                continue
+            if time.monotonic() - started < RESTART_DELAY:
+                time.sleep(RESTART_DELAY)
+            if not self.stopping:
+                self._spawn()
+        self.sock.close()
+
+    def stop(self):
+        """Ask every worker to finish its sessions and exit."""
+        self.stopping = True
+        for pid in list(self.pids):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def memory_report(self) -> list[MemoryUsage]:
+        """The memory use of the parent, then of each worker."""
+        pids = [os.getpid()] + sorted(self.pids)
+        return [usage for usage in map(memory_usage, pids) if usage is not None]
+
+    def format_report(self) -> str:
+        """The memory report as a table."""
+        return format_memory(self.memory_report())
+
+
+def serve_prefork(host: str, port: int, workers: int, server: GameServer = None):
+    """Run a pre-fork server until SIGINT or SIGTERM."""
+    prefork = PreforkServer(server or GameServer(), workers, host, port)
+    port = prefork.start()
+    print(
+        f"Serving the adventure on {host}:{port} with {prefork.workers} workers "
+        f"(parent pid {os.getpid()})",
+        flush=True,
+    )
+    prefork.supervise()
+    print("Server stopped")
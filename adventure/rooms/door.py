@@ -2,9 +2,13 @@
 
 from dataclasses import dataclass
 from adventure.items.item import Item
+from adventure.defaults import COMPACT_OBJECTS
 
+# Every DoorTemplate in use, so equal templates are shared.
+_DOOR_TEMPLATES: dict = {}
 
-@dataclass
+
+@dataclass(slots=COMPACT_OBJECTS)
 class Door(Item):
     """Doors are marvelous things."""
 
@@ -40,3 +44,57 @@ class Door(Item):
     def connect(self, room_id: int):
         """Set the room this door leads to."""
         self.leads_to = room_id
+
+
+@dataclass(frozen=True)
+class DoorTemplate:
+    """The parts of a door shared by every door of the same kind."""
+
+    name: str
+    short_desc: str
+    long_desc: str
+
+    @classmethod
+    def from_doc(cls, doc: dict) -> "DoorTemplate":
+        """Get the shared template for a door document."""
+        template = cls(
+            name=doc.get("name"),
+            short_desc=doc.get("short_desc"),
+            long_desc=doc.get("long_desc"),
+        )
+        return _DOOR_TEMPLATES.setdefault(template, template)
+
+
+class TemplateDoor(Door):
+    """A door that keeps only its own state and reads the rest from a template."""
+
+    __slots__ = ("template",)
+
+    def __init__(
+        self,
+        template: DoorTemplate,
+        is_open: bool = True,
+        is_locked: bool = False,
+        is_blocked: bool = False,
+        leads_to: int = None,
+    ):
+        self.template = template
+        self.is_open = is_open
+        self.is_locked = is_locked
+        self.is_blocked = is_blocked
+        self.leads_to = leads_to
+
+    @property
+    def name(self) -> str:
+        """The name of this kind of door."""
+        return self.template.name
+
+    @property
+    def short_desc(self) -> str:
+        """The short description of this kind of door."""
+        return self.template.short_desc
+
+    @property
+    def long_desc(self) -> str:
+        """The long description of this kind of door."""
+        return self.template.long_desc
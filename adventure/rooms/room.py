@@ -7,9 +7,10 @@ from adventure.rooms.door import Door
 from adventure.map.direction import Direction
 from adventure.items.item import Item
 from adventure.exceptions import ItemNotFoundError
+from adventure.defaults import COMPACT_OBJECTS
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=COMPACT_OBJECTS)
 class Room:
     """Define what it is that the player traverses."""
 
@@ -19,6 +20,7 @@ class Room:
     walls: List[Wall] = field(default_factory=list)
     contents: List[Item] = field(default_factory=list)
     inhabitants: List = field(default_factory=list)
+    room_id: int = None  # set by the Map the room belongs to
 
     def add_wall(self, wall: Wall, location: Direction):
         """Add a wall to the room."""
@@ -53,6 +55,14 @@ class Room:
                 doors.append(wall.doors[0])
         return doors
 
+    def get_door_wall(self, door: Door) -> Wall | None:
+        """Get the wall a door of this room is in, if any."""
+        for wall in self.get_walls():
+            # Equal doors can be on different walls, so look for this one.
+            if any(other is door for other in wall.doors):
+                return wall
+        return None
+
     def get_exits(self) -> List[Wall]:
         """Get a list of walls with doors."""
         exits = []
@@ -1,37 +1,112 @@
 """Module to load Room objects from YAML files."""
 
+from adventure.composite import composite_type, merge_bases
 from adventure.rooms.room import Room
-from adventure.rooms.wall import Wall
+from adventure.rooms.wall import TemplateWall, WallTemplate
 from adventure.map.direction import Direction
-from adventure.rooms.door import Door
+from adventure.rooms.door import DoorTemplate, TemplateDoor
 from adventure.dao.doc_yaml import get_yaml_doc
-from adventure.items.item_loader import load_item_from_yaml
+from adventure.dao.parser import find_data_file, resolve_data_file
+from adventure.items.item_loader import item_from_dict
 from adventure.defaults import DEFAULT_DATA_DIR
 from adventure.exceptions import BadYamlError
 
 CLASS_MAP = {}
 
 
-def load_room_from_yaml(file_path: str) -> Room:
-    """Load a room from a YAML file."""
-    data = get_yaml_doc(file_path)
+def data_file(kind: str, name: str, data_dir: str = DEFAULT_DATA_DIR) -> str:
+    """Get the path of a wall, door or thing data file from its name.
+
+    The file is looked for in `data_dir` first and then in the shipped data.
+    """
+    if data_dir != DEFAULT_DATA_DIR:
+        fname = find_data_file(f"{data_dir}/{kind}/{name}")
+        if fname:
+            return fname
+    return resolve_data_file(f"{DEFAULT_DATA_DIR}/{kind}/{name}")
+
+
+class DataFiles:
+    """Finds the data files of walls, doors and things, looking for each once.
+
+    A map keeps one for its data directory, so its rooms do not look for the
+    same few files on disk again for every wall, door and thing they have.
+    """
+
+    def __init__(self, data_dir: str = DEFAULT_DATA_DIR):
+        self.data_dir = data_dir
+        # (kind, name) -> path
+        self._paths: dict[tuple[str, str], str] = {}
+
+    def __call__(self, kind: str, name: str) -> str:
+        """Get the path of a data file, as `data_file` does."""
+        path = self._paths.get((kind, name))
+        if path is None:
+            path = self._paths[(kind, name)] = data_file(kind, name, self.data_dir)
+        return path
+
+
+def read_room_docs(
+    file_path: str,
+    get_doc=get_yaml_doc,
+    data_dir: str = DEFAULT_DATA_DIR,
+    data_files: DataFiles = None,
+) -> dict:
+    """Read a room document and every document it refers to, without building it.
+
+    Returns:
+     - (dict):  The parsed documents keyed by path, ready to be served back to
+                `load_room_from_yaml` through its `get_doc` argument.
+
+    """
+    find = data_files or DataFiles(data_dir)
+    data = get_doc(file_path)
+    docs = {file_path: data}
+    if not data:
+        return docs
+    for direction in data.get("walls") or []:
+        fname = find("walls", direction["type"])
+        docs[fname] = get_doc(fname)
+        if direction.get("door") is not None:
+            fname = find("doors", direction["door"])
+            docs[fname] = get_doc(fname)
+    for item_data in data.get("contains") or []:
+        fname = find("things", item_data)
+        docs[fname] = get_doc(fname)
+    return docs
+
+
+def load_room_from_yaml(
+    file_path: str,
+    get_doc=get_yaml_doc,
+    data_dir: str = DEFAULT_DATA_DIR,
+    data_files: DataFiles = None,
+) -> Room:
+    """Load a room from a YAML file.
+
+    Arguments:
+     - file_path(str):      The path to the room document.
+     - get_doc(callable):   Reads a data file and returns its parsed document.
+                            Every wall, door and thing the room refers to is
+                            read through this as well.
+     - data_dir(str):       Where to look for walls, doors and things before
+                            falling back to the shipped data directory.
+     - data_files(DataFiles):
+                            Finds those files instead, remembering where they
+                            were found. A new one for `data_dir` if not given.
+
+    Returns:
+     - (Room):              The room, its walls, doors and contents.
+
+    """
+    find = data_files or DataFiles(data_dir)
+    data = get_doc(file_path)
     if not data:
         raise BadYamlError(f"Failed to load or parse YAML file: {file_path}")
 
-    base_classes = [Room]
-    for cls_name in data.get("classes", []):
-        if cls_name not in CLASS_MAP:
-            raise ValueError(f"Unknown room class: {cls_name}")
-        cls = CLASS_MAP[cls_name]
-        if cls:
-            for i, base in enumerate(base_classes):
-                if issubclass(cls, base):
-                    base_classes[i] = cls
-                    break
-            else:
-                base_classes.append(cls)
-    composite_item = type(
-        data["name"].capitalize().replace(" ", "_") + "Room", tuple(base_classes), {}
+    base_classes = merge_bases(Room, data.get("classes", []), CLASS_MAP, "room")
+    composite_item = composite_type(
+        data["name"].capitalize().replace(" ", "_") + "Room", base_classes
     )
     args = {
         key: value
@@ -41,27 +116,17 @@ def load_room_from_yaml(file_path: str) -> Room:
     room = composite_item(**args)
     for direction in data.get("walls"):
         location = Direction.from_string(direction["name"])
-        wall_dict = get_yaml_doc(f"{DEFAULT_DATA_DIR}/walls/{direction['type']}.yml")
-        wall = Wall(
-            location=location,
-            name=f"{location.name} wall",
-            short_desc=wall_dict["short_desc"],
-            long_desc=wall_dict["long_desc"],
-            doors=[],
+        wall_dict = get_doc(find("walls", direction["type"]))
+        wall = TemplateWall(
+            template=WallTemplate.from_doc(wall_dict), location=location, doors=[]
         )
         if direction.get("door") is not None:
-            door_dict = get_yaml_doc(
-                f"{DEFAULT_DATA_DIR}/doors/{direction['door']}.yml"
-            )
-            door = Door(
-                name=door_dict.get("name"),
-                short_desc=door_dict.get("short_desc"),
-                long_desc=door_dict.get("long_desc"),
-            )
+            door_dict = get_doc(find("doors", direction["door"]))
+            door = TemplateDoor(template=DoorTemplate.from_doc(door_dict))
             wall.add_door(door)
         room.add_wall(wall=wall, location=location)
     if data.get("contains") is not None:
         for item_data in data.get("contains", []):
-            item = load_item_from_yaml(f"{DEFAULT_DATA_DIR}/things/{item_data}.yml")
+            item = item_from_dict(get_doc(find("things", item_data)))
             room.contents.append(item)
     return room
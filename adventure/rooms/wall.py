@@ -4,9 +4,13 @@ from dataclasses import dataclass
 from adventure.items.item import Item
 from adventure.map.direction import Direction
 from adventure.rooms.door import Door
+from adventure.defaults import COMPACT_OBJECTS
 
+# Every WallTemplate in use, so equal templates are shared.
+_WALL_TEMPLATES: dict = {}
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=COMPACT_OBJECTS)
 class Wall(Item):
     """This is what a wall looks like."""
 
@@ -26,3 +30,43 @@ class Wall(Item):
         if self.has_door():
             return self.doors[0]
         return None
+
+
+@dataclass(frozen=True)
+class WallTemplate:
+    """The parts of a wall shared by every wall of the same type."""
+
+    short_desc: str
+    long_desc: str
+
+    @classmethod
+    def from_doc(cls, doc: dict) -> "WallTemplate":
+        """Get the shared template for a wall type document."""
+        template = cls(short_desc=doc["short_desc"], long_desc=doc["long_desc"])
+        return _WALL_TEMPLATES.setdefault(template, template)
+
+
+class TemplateWall(Wall):
+    """A wall that keeps only its location and doors; the rest is in a template."""
+
+    __slots__ = ("template",)
+
+    def __init__(self, template: WallTemplate, location: Direction, doors: list[Door]):
+        self.template = template
+        self.location = location
+        self.doors = doors
+
+    @property
+    def name(self) -> str:
+        """Walls are named after the side of the room they are on."""
+        return f"{self.location.name} wall"
+
+    @property
+    def short_desc(self) -> str:
+        """The short description of this type of wall."""
+        return self.template.short_desc
+
+    @property
+    def long_desc(self) -> str:
+        """The long description of this type of wall."""
+        return self.template.long_desc
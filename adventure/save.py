@@ -0,0 +1,412 @@
+"""adventure/save -- save and restore a game in a compact binary file.
+
+    saves = SaveFile("player.sav")
+    saves.save(game)            # the first save writes the whole game
+    ...
+    saves.save(game)            # later ones append only what changed since
+    ...
+    saves.restore(game)         # or restore_game(game, "player.sav")
+
+A save only holds what the player changed from the world as `Map` loaded it:
+the room the player is in, the doors whose state differs (kept by the game's
+`WorldOverlay`), the contents of rooms things were moved in or out of, and the
+player's containers. Things are saved as where they were when the world was
+loaded (`Item.origin`), so restoring looks them up in the loaded map instead
+of reading any data files.
+
+The file starts with `MAGIC` and the world's `Map.fingerprint`, so a save is
+refused by a world whose map or room files changed since, where the things
+it names by origin may be different or gone. Then comes a series of records:
+a full record, followed by the delta records of later saves. Each record is its kind, its
+length, its body and a CRC32 of the body. Numbers are unsigned LEB128
+varints. A record cut short by a crash fails its length or CRC check and is
+ignored, along with anything after it, so restoring gives the last complete
+save.
+"""
+
+import os
+import zlib
+from typing import NamedTuple, Optional
+
+from adventure.inventory import Container, Hands, Inventory
+from adventure.items.item import Item
+
+MAGIC = b"ADVSAVE\x02"
+FULL = 0
+DELTA = 1
+
+# The door attributes a save keeps, in bit order.
+DOOR_ATTRIBUTES = ("is_open", "is_locked", "is_blocked")
+
+# (room id, index), as in Item.origin
+Origin = tuple[int, int]
+
+
+class SaveState(NamedTuple):
+    """What a save holds, with things given by their origin."""
+
+    room_id: int
+    # (room id, wall index, door index) -> {attribute: value}
+    doors: dict
+    # room id -> tuple of origins
+    contents: dict
+    # tuple of (name, short_desc, capacity, tuple of origins)
+    inventory: tuple
+
+
+def capture(game) -> SaveState:
+    """What would be saved of a game right now."""
+    overlay = game.map
+    return SaveState(
+        room_id=game.current_loc.room_id,
+        doors={key: dict(state) for key, state in overlay.changed_doors().items()},
+        contents={
+            room_id: tuple(_origin(item) for item in items)
+            for room_id, items in overlay.changed_contents().items()
+        },
+        inventory=tuple(
+            (
+                container.name,
+                container.short_desc,
+                container.capacity,
+                tuple(_origin(item) for item in container.contents),
+            )
+            for container in game.player.inventory.containers
+        ),
+    )
+
+
+def _origin(item: Item) -> Origin:
+    if item.origin is None:
+        raise ValueError(
+            f"{item.name} was not loaded with the map and cannot be saved."
+        )
+    return item.origin
+
+
+class SaveFile:
+    """A save file that later saves add only their changes to.
+
+    The first `save` through a SaveFile replaces the file with a full record;
+    each later one appends a delta record against the save before it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._last: Optional[SaveState] = None
+
+    def save(self, game, full: bool = False) -> int:
+        """Save a game, and return how many bytes were written.
+
+        With `full`, write a full record and start the file again.
+        """
+        state = capture(game)
+        if full or self._last is None:
+            header = _Writer()
+            header.data += MAGIC
+            header.blob(game.map.fingerprint())
+            data = bytes(header.data) + _record(FULL, _encode_full(state))
+            mode = "wb"
+        else:
+            data = _record(DELTA, _encode_delta(self._last, state))
+            mode = "ab"
+        with open(self.path, mode) as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        self._last = state
+        return len(data)
+
+    def restore(self, game):
+        """Put a game back as it was at the last save in this file.
+
+        Later saves through this SaveFile carry on from the restored state.
+        """
+        state = read_save(self.path, game.map.fingerprint())
+        restore_state(game, state)
+        self._last = state
+
+
+def read_save(path: str, fingerprint: bytes = None) -> SaveState:
+    """Read a save file into the state of its last complete save.
+
+    Arguments:
+     - path(str):           The save file.
+     - fingerprint(bytes):  If given, the `Map.fingerprint` of the world the
+                            save is for; a save made in another is refused.
+
+    Raises:
+     - (ValueError):    If the file is not a save file, or not one of this world.
+
+    """
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"Not an adventure save file: {path}")
+    reader = _Reader(data, len(MAGIC))
+    try:
+        saved_in = reader.blob()
+    except EOFError as err:
+        raise ValueError(f"No complete save in: {path}") from err
+    if fingerprint is not None and saved_in != fingerprint:
+        raise ValueError(f"The save {path} was made in a different world.")
+    state = None
+    while not reader.at_end():
+        record = reader.record()
+        if record is None:
+            break
+        kind, body = record
+        if kind == FULL:
+            state = _decode_full(_Reader(body))
+        elif kind == DELTA and state is not None:
+            state = _apply_delta(state, _Reader(body))
+        else:
+            raise ValueError(f"Bad record in save file: {path}")
+    if state is None:
+        raise ValueError(f"No complete save in: {path}")
+    return state
+
+
+def restore_game(game, path: str):
+    """Put a game back as it was when it was saved.
+
+    Raises:
+     - (ValueError):    If the save was not made in the world the game plays.
+
+    """
+    restore_state(game, read_save(path, game.map.fingerprint()))
+
+
+def restore_state(game, state: SaveState):
+    """Put a game into a saved state."""
+    world = game.map.world
+    rooms: dict = {}
+
+    def thing(origin: Origin) -> Item:
+        room_id, index = origin
+        if room_id not in rooms:
+            rooms[room_id] = world.get_room(room_id).contents
+        return rooms[room_id][index]
+
+    game.map.reset(
+        doors={key: dict(values) for key, values in state.doors.items()},
+        contents={
+            room_id: [thing(origin) for origin in origins]
+            for room_id, origins in state.contents.items()
+        },
+    )
+    inventory = Inventory()
+    for name, short_desc, capacity, origins in state.inventory:
+        if name == "hands":
+            container = Hands()
+        else:
+            container = Container(name, short_desc, capacity, [])
+        container.contents = [thing(origin) for origin in origins]
+        inventory.containers.append(container)
+    game.player.inventory = inventory
+    game.current_loc = game.map.get_room(state.room_id)
+
+
+# A record body, by section: the room id; the doors; the room contents; and
+# the inventory. A full record has every door and room the player changed. A
+# delta record has the doors and rooms that changed since the last save, with
+# a door mask of 0 for a door back as it was loaded, and the whole inventory
+# only if it changed.
+
+
+def _encode_full(state: SaveState) -> bytes:
+    writer = _Writer()
+    writer.uint(state.room_id)
+    _write_doors(writer, state.doors)
+    _write_contents(writer, state.contents)
+    _write_inventory(writer, state.inventory)
+    return bytes(writer.data)
+
+
+def _decode_full(reader: "_Reader") -> SaveState:
+    room_id = reader.uint()
+    doors = _read_doors(reader)
+    contents = _read_contents(reader)
+    inventory = _read_inventory(reader)
+    return SaveState(room_id, doors, contents, inventory)
+
+
+def _encode_delta(last: SaveState, state: SaveState) -> bytes:
+    writer = _Writer()
+    writer.uint(state.room_id)
+    doors = {
+        key: values
+        for key, values in state.doors.items()
+        if last.doors.get(key) != values
+    }
+    doors.update({key: {} for key in last.doors if key not in state.doors})
+    _write_doors(writer, doors)
+    _write_contents(
+        writer,
+        {
+            room_id: origins
+            for room_id, origins in state.contents.items()
+            if last.contents.get(room_id) != origins
+        },
+    )
+    if state.inventory == last.inventory:
+        writer.uint(0)
+    else:
+        writer.uint(1)
+        _write_inventory(writer, state.inventory)
+    return bytes(writer.data)
+
+
+def _apply_delta(last: SaveState, reader: "_Reader") -> SaveState:
+    room_id = reader.uint()
+    doors = dict(last.doors)
+    for key, values in _read_doors(reader).items():
+        if values:
+            doors[key] = values
+        else:
+            doors.pop(key, None)
+    contents = dict(last.contents)
+    contents.update(_read_contents(reader))
+    inventory = _read_inventory(reader) if reader.uint() else last.inventory
+    return SaveState(room_id, doors, contents, inventory)
+
+
+def _write_doors(writer: "_Writer", doors: dict):
+    writer.uint(len(doors))
+    for (room_id, wall, door), values in doors.items():
+        writer.uint(room_id)
+        writer.uint(wall)
+        writer.uint(door)
+        mask = 0
+        for bit, name in enumerate(DOOR_ATTRIBUTES):
+            if name in values:
+                mask |= 1 << bit
+                if values[name]:
+                    mask |= 1 << (bit + len(DOOR_ATTRIBUTES))
+        writer.uint(mask)
+
+
+def _read_doors(reader: "_Reader") -> dict:
+    doors = {}
+    for _ in range(reader.uint()):
+        key = (reader.uint(), reader.uint(), reader.uint())
+        mask = reader.uint()
+        doors[key] = {
+            name: bool(mask & (1 << (bit + len(DOOR_ATTRIBUTES))))
+            for bit, name in enumerate(DOOR_ATTRIBUTES)
+            if mask & (1 << bit)
+        }
+    return doors
+
+
+def _write_origins(writer: "_Writer", origins: tuple):
+    writer.uint(len(origins))
+    for room_id, index in origins:
+        writer.uint(room_id)
+        writer.uint(index)
+
+
+def _read_origins(reader: "_Reader") -> tuple:
+    return tuple((reader.uint(), reader.uint()) for _ in range(reader.uint()))
+
+
+def _write_contents(writer: "_Writer", contents: dict):
+    writer.uint(len(contents))
+    for room_id, origins in contents.items():
+        writer.uint(room_id)
+        _write_origins(writer, origins)
+
+
+def _read_contents(reader: "_Reader") -> dict:
+    return {reader.uint(): _read_origins(reader) for _ in range(reader.uint())}
+
+
+def _write_inventory(writer: "_Writer", inventory: tuple):
+    writer.uint(len(inventory))
+    for name, short_desc, capacity, origins in inventory:
+        writer.text(name)
+        writer.text(short_desc)
+        writer.uint(capacity)
+        _write_origins(writer, origins)
+
+
+def _read_inventory(reader: "_Reader") -> tuple:
+    return tuple(
+        (reader.text(), reader.text(), reader.uint(), _read_origins(reader))
+        for _ in range(reader.uint())
+    )
+
+
+def _record(kind: int, body: bytes) -> bytes:
+    writer = _Writer()
+    writer.uint(kind)
+    writer.uint(len(body))
+    writer.data += body
+    writer.data += zlib.crc32(body).to_bytes(4, "little")
+    return bytes(writer.data)
+
+
+class _Writer:
+    def __init__(self):
+        self.data = bytearray()
+
+    def uint(self, value: int):
+        while value > 0x7F:
+            self.data.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.data.append(value)
+
+    def blob(self, value: bytes):
+        self.uint(len(value))
+        self.data += value
+
+    def text(self, value: str):
+        self.blob(value.encode("utf-8"))
+
+
+class _Reader:
+    def __init__(self, data: bytes, pos: int = 0):
+        self.data = data
+        self.pos = pos
+
+    def at_end(self) -> bool:
+        return self.pos >= len(self.data)
+
+    def uint(self) -> int:
+        value = shift = 0
+        while True:
+            if self.pos >= len(self.data):
+                raise EOFError("Save record ended early.")
+            byte = self.data[self.pos]
+            self.pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def blob(self) -> bytes:
+        length = self.uint()
+        if self.pos + length > len(self.data):
+            raise EOFError("Save record ended early.")
+        value = self.data[self.pos : self.pos + length]
+        self.pos += length
+        return bytes(value)
+
+    def text(self) -> str:
+        return self.blob().decode("utf-8")
+
+    def record(self) -> Optional[tuple[int, bytes]]:
+        """The next record's kind and body, or None if it is incomplete."""
+        try:
+            kind = self.uint()
+            length = self.uint()
+        except EOFError:
+            return None
+        end = self.pos + length
+        if end + 4 > len(self.data):
+            return None
+        body = self.data[self.pos : end]
+        if zlib.crc32(body) != int.from_bytes(self.data[end : end + 4], "little"):
+            return None
+        self.pos = end + 4
+        return kind, body
@@ -0,0 +1,279 @@
+"""adventure/server -- host many players in one process over TCP.
+
+    python main.py --serve 4000
+    nc localhost 4000
+
+Every connection is a session with its own `Game`, played through `Game.step`.
+The protocol is plain lines: each line a client sends is a statement, and the
+server answers with the output followed by a "> " prompt. The session ends when
+the player quits or the client disconnects.
+
+Lines a client sends wait in a small queue for their session. When the queue
+is full the session stops reading from its socket, so a client sending faster
+than its commands are played is slowed down by TCP instead of filling memory.
+Replies are likewise not sent faster than the client reads them. The map and
+commands are loaded once and shared by every session's game, and a game is only built once
+its session sends a first statement, so idle connections cost little more
+than their socket.
+"""
+
+import asyncio
+import contextlib
+import os
+import signal
+import socket
+from typing import Optional
+
+from adventure.defaults import DEFAULT_COMMANDS_FILE, DEFAULT_DATA_DIR, DEFAULT_MAP_FILE
+from adventure.game import Game
+from adventure.interpreter import Interpreter
+from adventure.journal import Journal
+from adventure.map.map import Map
+from adventure.ui.baseui import BaseUI
+from adventure.ui.prompt import Prompt
+
+DEFAULT_QUEUE_SIZE = 8
+# Longest line a client may send, in bytes.
+MAX_LINE = 4096
+PROMPT = "> "
+# Shortest wait between checks that the journal is due to be written.
+MIN_FLUSH_INTERVAL = 0.1
+
+
+class AsyncUI(BaseUI):
+    """A UI that writes messages to a client's stream.
+
+    Writing never blocks; the session waits for the stream to drain after each
+    reply. Input is read by the session, not through the UI.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+
+    def display_message(self, message: str, color: str = None):
+        if not self.writer.is_closing():
+            self.writer.write(f"{message}\n".encode("utf-8"))
+
+    def get_input(self, prompt: str = "") -> str:
+        raise RuntimeError("A server session reads input asynchronously.")
+
+    def show_color(self, msg: str, color: str) -> str:
+        return msg
+
+    def prompt(self):
+        """Ask the client for the next statement."""
+        if not self.writer.is_closing():
+            self.writer.write(PROMPT.encode("utf-8"))
+
+    async def drain(self):
+        """Wait until the client has taken most of what was written."""
+        with contextlib.suppress(ConnectionError):
+            await self.writer.drain()
+
+
+class Session:
+    """One connected player."""
+
+    def __init__(
+        self,
+        server: "GameServer",
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.ui = AsyncUI(writer)
+        self.game = None
+        # Statements read but not yet played. None marks the end of input.
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=server.queue_size)
+
+    async def run(self):
+        """Greet the player, then play their statements until they leave."""
+        self.ui.display_message(self.server.messages.get("greeting", ""))
+        self.ui.display_message(self.server.messages.get("opening", ""))
+        self.ui.prompt()
+        await self.ui.drain()
+        reading = asyncio.create_task(self._read())
+        try:
+            await self._play()
+        finally:
+            reading.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await reading
+
+    async def _read(self):
+        """Queue the client's lines, waiting while the queue is full."""
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                await self.queue.put(line.decode("utf-8", errors="replace").strip())
+        except (ConnectionError, ValueError):
+            # A reset connection, or a line longer than MAX_LINE.
+            pass
+        await self.queue.put(None)
+
+    async def _play(self):
+        while True:
+            stmt = await self.queue.get()
+            if stmt is None:
+                return
+            if stmt:
+                if self.game is None:
+                    self.game = self.server.new_game(self.ui)
+                self._reply(self.game.step(stmt))
+                if not self.game.is_running:
+                    self.ui.display_message(self.server.messages.get("farewell", ""))
+                    await self.ui.drain()
+                    return
+            self.ui.prompt()
+            await self.ui.drain()
+            # Let other sessions play before this one's next statement.
+            await asyncio.sleep(0)
+
+    def _reply(self, result):
+        if result.output:
+            self.ui.display_message(result.output)
+        if result.suggestions:
+            words = " or ".join(f"'{word}'" for word in result.suggestions)
+            self.ui.display_message(
+                self.server.messages.get("did_you_mean", "").format(words=words)
+            )
+
+
+class GameServer:
+    """An asyncio TCP server giving each connection its own game.
+
+    Arguments:
+     - base_data_dir, map_file_name, cmd_file_name:
+                            The world every session plays, as for `Game`.
+     - queue_size(int):     How many statements a session may have waiting.
+     - journal_file(str):   If set, append every session's events to this
+                            journal. Sessions are named "<pid>.<number>".
+    """
+
+    def __init__(
+        self,
+        base_data_dir: str = DEFAULT_DATA_DIR,
+        map_file_name: str = DEFAULT_MAP_FILE,
+        cmd_file_name: str = DEFAULT_COMMANDS_FILE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        journal_file: str = "",
+    ):
+        self.base_data_dir = base_data_dir
+        self.map_file_name = map_file_name
+        self.cmd_file_name = cmd_file_name
+        self.queue_size = queue_size
+        self.journal_file = journal_file
+        self.journal: Optional[Journal] = None
+        self._games = 0
+        self.sessions: set[asyncio.Task] = set()
+        self.messages: dict = {}
+        # Loaded when the server starts and shared by every session's game.
+        self.world: Optional[Map] = None
+        self.interpreter: Optional[Interpreter] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._flushing: Optional[asyncio.Task] = None
+
+    def new_game(self, ui: BaseUI) -> Game:
+        """Build the game for a session."""
+        self._games += 1
+        return Game(
+            base_data_dir=self.base_data_dir,
+            map_file_name=self.map_file_name,
+            cmd_file_name=self.cmd_file_name,
+            ui=ui,
+            world=self.world,
+            interpreter=self.interpreter,
+            journal=self.journal,
+            session=f"{os.getpid()}.{self._games}",
+        )
+
+    def load(self):
+        """Load the map, commands and messages every session shares."""
+        prompt = Prompt()
+        prompt.load()
+        self.messages = prompt.msg
+        self.world = Map(base_data_dir=self.base_data_dir, file_name=self.map_file_name)
+        self.interpreter = Interpreter(f"{self.base_data_dir}/{self.cmd_file_name}")
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = 0, sock: socket.socket = None
+    ) -> int:
+        """Start listening, and return the port. Port 0 picks a free one.
+
+        With `sock`, accept connections on that listening socket instead.
+        Loads the shared data first if `load` was not called.
+        """
+        if self.world is None:
+            self.load()
+        if self.journal_file:
+            # Opened here, not in load, so each pre-fork worker has its own.
+            self.journal = Journal(self.journal_file)
+            self._flushing = asyncio.create_task(self._flush_journal())
+        if sock is not None:
+            self._server = await asyncio.start_server(
+                self._connected, sock=sock, limit=MAX_LINE
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self._connected, host, port, limit=MAX_LINE
+            )
+        return self._server.sockets[0].getsockname()[1]
+
+    async def _flush_journal(self):
+        """Write the journal's waiting events even while no one is playing."""
+        interval = max(self.journal.sync_interval, MIN_FLUSH_INTERVAL)
+        while True:
+            await asyncio.sleep(interval)
+            self.journal.flush_if_due()
+
+    async def _connected(self, reader, writer):
+        task = asyncio.current_task()
+        self.sessions.add(task)
+        try:
+            await Session(self, reader, writer).run()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.sessions.discard(task)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def close(self):
+        """Stop accepting connections and end every session."""
+        if self._server is not None:
+            self._server.close()
+        for task in list(self.sessions):
+            task.cancel()
+        await asyncio.gather(*self.sessions, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+        if self._flushing is not None:
+            self._flushing.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flushing
+            self._flushing = None
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+
+async def serve(host: str, port: int, server: GameServer = None):
+    """Run a server until SIGINT or SIGTERM, then shut it down cleanly."""
+    server = server or GameServer()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    port = await server.start(host, port)
+    print(f"Serving the adventure on {host}:{port}")
+    try:
+        await stop.wait()
+    finally:
+        await server.close()
+        print("Server stopped")
@@ -0,0 +1,82 @@
+"""adventure/startup -- measure how long the game takes to import.
+
+Runs a fresh interpreter with `python -X importtime` and reads back the time
+each module took, so heavy imports that creep into startup can be found.
+"""
+
+import os
+import subprocess
+import sys
+from typing import NamedTuple
+
+# The game's entry point, which imports the game itself.
+STARTUP_MODULE = "main"
+# The directory holding the adventure package.
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ImportTime(NamedTuple):
+    """How long one module took to import, in microseconds."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def measure_imports(module: str = STARTUP_MODULE) -> list[ImportTime]:
+    """Import a module in a fresh interpreter and time every import it makes.
+
+    Returns:
+     - (list[ImportTime]):  One entry per module, in the order they finished.
+
+    Raises:
+     - (RuntimeError):      If the module cannot be imported.
+
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (PROJECT_DIR, env.get("PYTHONPATH")) if path
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Could not import {module}:\n{result.stderr}")
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times.append(
+            ImportTime(
+                module=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(name) - len(name.lstrip()) - 1) // 2,
+            )
+        )
+    return times
+
+
+def total_us(times: list[ImportTime], module: str = STARTUP_MODULE) -> int:
+    """The cumulative import time of one module."""
+    for entry in times:
+        if entry.module == module:
+            return entry.cumulative_us
+    raise KeyError(f"{module} was not imported.")
+
+
+def format_report(times: list[ImportTime], limit: int = 25) -> str:
+    """A table of the slowest imports, slowest first."""
+    lines = [f"{'self ms':>9} {'total ms':>9}  module"]
+    for entry in sorted(times, key=lambda entry: -entry.cumulative_us)[:limit]:
+        lines.append(
+            f"{entry.self_us / 1000:9.1f} {entry.cumulative_us / 1000:9.1f}  "
+            f"{'  ' * entry.depth}{entry.module}"
+        )
+    return "\n".join(lines)
@@ -1,9 +1,21 @@
 """Statement processing for the adventure game."""
 
-from typing import Union
+from typing import NamedTuple, Union
 from adventure.commands.command import Command
 from adventure.commands.command_list import CommandList
 from adventure.exceptions import BadStatementError, CommandNotFoundError
+from adventure.grammar import Phrase, parse_phrase
+
+
+class ParsedStatement(NamedTuple):
+    """The parts of a statement that do not change between uses."""
+
+    stmt: str
+    verb: Command
+    action: str
+    tokens: tuple
+    args: tuple
+    phrase: Phrase
 
 
 class Statement:
@@ -18,22 +30,30 @@ class Statement:
         try:
             self.verb: Command = self.identify_verb(self.tokens, cmd_list)
         except CommandNotFoundError as e:
-            raise CommandNotFoundError from e
+            raise CommandNotFoundError(suggestions=e.suggestions) from e
         if not self.verb:
-            raise CommandNotFoundError("No valid command found.")
+            raise CommandNotFoundError(
+                "No valid command found.",
+                suggestions=cmd_list.suggest(self.tokens[0]),
+            )
         # self.object: list[str] = self.identify_objects(self.tokens)
         # self.mods: list[str] = self.identify_modifiers(self.tokens)
         # Probably deprecated
         self.args: list[str] = self.identify_args()
+        self.phrase: Phrase = parse_phrase(self.action, self.args)
 
     def identify_verb(
         self, tokens: list[str], commands: CommandList
     ) -> Union[Command, None]:
         """Identify the verb in the statement.
 
+        Any token that is a command name or alias is the verb. Failing that, the
+        first token may be an abbreviation of just one command ("exa" for
+        examine).
+
         Args:
             tokens (list[str]): The list of tokens from the statement.
-            commands (list[str]): The list of available command names and aliases.
+            commands (CommandList): The available commands, indexed by name and alias.
 
         Returns:
             Union[str, None]: The token with a valid command name or
@@ -45,13 +65,42 @@ class Statement:
         if not commands:
             raise CommandNotFoundError("No commands available to match verb")
         for token in tokens:
-            for command in commands:
-                if token == command.name or token in command.aliases:
-                    self.action = token
-                    return command
-        return None
+            command = commands.find(token)
+            if command is not None:
+                self.action = token
+                return command
+        command = commands.find_prefix(tokens[0])
+        if command is not None:
+            self.action = tokens[0]
+        return command
 
     def identify_args(self) -> list[str]:
         """Separate the args from the verb in the statement."""
         self.args = [token for token in self.tokens if token != self.action]
         return self.args
+
+    def freeze(self) -> ParsedStatement:
+        """Record the parse of this statement so it can be reused."""
+        return ParsedStatement(
+            stmt=self.stmt,
+            verb=self.verb,
+            action=self.action,
+            tokens=tuple(self.tokens),
+            args=tuple(self.args),
+            phrase=self.phrase,
+        )
+
+    @classmethod
+    def thaw(cls, parsed: ParsedStatement) -> "Statement":
+        """Make a new Statement from a recorded parse, without parsing again.
+
+        The token and argument lists are new, so commands may change them.
+        """
+        statement = cls.__new__(cls)
+        statement.stmt = parsed.stmt
+        statement.verb = parsed.verb
+        statement.action = parsed.action
+        statement.tokens = list(parsed.tokens)
+        statement.args = list(parsed.args)
+        statement.phrase = parsed.phrase
+        return statement
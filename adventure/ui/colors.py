@@ -0,0 +1,25 @@
+"""adventure/ui/colors -- color text for the console without importing colorama early.
+
+colorama is imported the first time some text is colored, so modules that
+only sometimes print in color do not pay for it at startup.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _colorama():
+    import colorama  # pylint: disable=import-outside-toplevel
+
+    return colorama
+
+
+def paint(message: str, color: str) -> str:
+    """Return the message in a colorama foreground color, e.g. "red" or "lightred_ex"."""
+    colorama = _colorama()
+    return getattr(colorama.Fore, color.upper()) + message + colorama.Style.RESET_ALL
+
+
+def init_console():
+    """Set up the terminal for colored output."""
+    _colorama().init()
@@ -1,12 +1,12 @@
 """ConsoleUI class for displaying messages and getting input in a console environment.
 
 This class inherits from BaseUI and implements methods for console interaction.
+readchar and colorama are only imported once a ConsoleUI is in use.
 """
 
 import textwrap
-import readchar
-from colorama import init, Fore, Style
 from adventure.ui.baseui import BaseUI
+from adventure.ui.colors import init_console, paint
 from adventure.defaults import DEFAULT_CONSOLE_WIDTH
 
 
@@ -16,7 +16,7 @@ class ConsoleUI(BaseUI):
     def __init__(self):
         """Initialize the console UI."""
         # Colorama
-        init()
+        init_console()
         self.width = DEFAULT_CONSOLE_WIDTH
         self.wrapper = textwrap.TextWrapper(width=self.width)
 
@@ -29,6 +29,8 @@ class ConsoleUI(BaseUI):
 
     def get_input(self, prompt: str = "") -> str:
         """Read text-based commands from the user, handling special keys."""
+        import readchar  # pylint: disable=import-outside-toplevel
+
         print("> ", end="", flush=True)
         chars = []
         while True:
@@ -53,7 +55,6 @@ class ConsoleUI(BaseUI):
         if not msg:
             raise ValueError("Message cannot be empty.")
         if color in ["red", "yellow", "green", "blue", "magenta"]:
-            color_func = getattr(Fore, color.upper(), None)
-            return color_func + msg + Style.RESET_ALL
+            return paint(msg, color)
         else:
             return msg
@@ -2,7 +2,7 @@
 
 from typing import Dict
 from dataclasses import dataclass, field
-import yaml
+from adventure.dao.doc_yaml import get_yaml_doc
 from adventure.ui.baseui import BaseUI
 
 
@@ -15,8 +15,7 @@ class Prompt:
 
     def load(self):
         """load the prompts from the YAML source."""
-        stream = open("adventure/data/messages/prompts.yml", "r", encoding="UTF-8")
-        self.msg = yaml.safe_load(stream)
+        self.msg = get_yaml_doc("adventure/data/messages/prompts.yml")
 
     def read_input(self):
         """Read text-based commands from the user."""
@@ -32,9 +31,11 @@ class Prompt:
         else:
             print(message)
 
-    def show(self, prompt_name: str, color: str = None):
-        """Display a prompt to the user."""
+    def show(self, prompt_name: str, color: str = None, **values):
+        """Display a prompt to the user, filling in any named values."""
         message = self.msg.get(prompt_name)
+        if values:
+            message = message.format(**values)
         self.display(message, color)
 
     def prepare(self, prompt_name: str, color: str = None):
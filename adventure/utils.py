@@ -7,18 +7,15 @@ https://towardsdatascience.com/how-to-add-an-escape-hatch-to-your-python-run-in-
 
 # Base Library Packages
 import _thread
-
-# Third Party Packages
 from functools import wraps
-from pynput import keyboard
 
-from colorama import Fore, Style
+from adventure.ui.colors import paint
 
 
 def escape_hatch(
     start_message="",
     end_message="",
-    keyboard_key=keyboard.Key.esc,
+    keyboard_key=None,
     # key_string="Esc",
 ):
     """Function to decorate API calls as an escape hatch
@@ -27,24 +24,26 @@ def escape_hatch(
       end_message (str): end message to show decorator end
       method: method to be decorated - the inner function
       keyboard_key (keyboard.Key or keyboard.KeyCode):
-    interrupt key to listen for, in our case is the escape key
+    interrupt key to listen for, the escape key if not given
       key_string (str): string representation of key to print in message"""
 
     def decorate(func):
-        def keyboard_handler(key, escape_key=keyboard_key):
-            if key == escape_key:
-                print(
-                    Fore.LIGHTRED_EX
-                    + "    Program terminated by user"
-                    + Style.RESET_ALL
-                )
-                _thread.interrupt_main()
-
         @wraps(func)
         def wrapper(*args, **kwargs):
+            # Third Party Packages, imported here: pynput needs a display or
+            # input device to load, so wait until an escape hatch is used.
+            from pynput import keyboard
+
+            escape_key = keyboard_key or keyboard.Key.esc
+
+            def keyboard_handler(key):
+                if key == escape_key:
+                    print(paint("    Program terminated by user", "lightred_ex"))
+                    _thread.interrupt_main()
+
             # Handle keyboard interrupts by user
             with keyboard.Listener(on_press=keyboard_handler):
-                print(Fore.LIGHTGREEN_EX + start_message + Style.RESET_ALL)
+                print(paint(start_message, "lightgreen_ex"))
                 # print(
                 #    f"    Press '{key_string}' any time to terminate the program",
                 # )
@@ -52,7 +51,7 @@ def escape_hatch(
                 result = func(*args, **kwargs)
 
                 # Print message after API response received
-                print(Fore.LIGHTRED_EX + end_message + Style.RESET_ALL)
+                print(paint(end_message, "lightred_ex"))
             return result
 
         return wrapper
@@ -0,0 +1 @@
+"""Benchmarks for the adventure game. Run them from the repository root."""
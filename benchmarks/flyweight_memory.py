@@ -0,0 +1,102 @@
+"""Measure the memory saved by sharing wall and door templates.
+
+    python -m benchmarks.flyweight_memory --rooms 5000
+
+"Plain" rooms are built the way the room loader used to build them: every
+wall and door document parsed again and its descriptions copied onto each
+Wall and Door. "Template" rooms come from the room loader as it is now.
+"""
+
+import argparse
+from functools import partial
+import glob
+import gc
+import tempfile
+import tracemalloc
+
+from adventure.composite import composite_type
+from adventure.dao.doc_yaml import invalidate_doc_cache
+from adventure.dao.parser import parse_file
+from adventure.items.item_loader import item_from_dict
+from adventure.map.direction import Direction
+from adventure.map.generator import generate_world
+from adventure.rooms.door import Door
+from adventure.rooms.room import Room
+from adventure.rooms.room_loader import data_file, load_room_from_yaml
+from adventure.rooms.wall import Wall
+
+
+def load_plain_room(file_path: str, data_dir: str) -> Room:
+    """Build a room's walls and doors without templates."""
+    data = parse_file(file_path)
+    room_cls = composite_type(
+        data["name"].capitalize().replace(" ", "_") + "Room", (Room,)
+    )
+    room = room_cls(
+        name=data["name"], short_desc=data["short_desc"], long_desc=data["long_desc"]
+    )
+    for direction in data["walls"]:
+        location = Direction.from_string(direction["name"])
+        wall_dict = parse_file(data_file("walls", direction["type"], data_dir))
+        wall = Wall(
+            location=location,
+            name=f"{location.name} wall",
+            short_desc=wall_dict["short_desc"],
+            long_desc=wall_dict["long_desc"],
+            doors=[],
+        )
+        if direction.get("door") is not None:
+            door_dict = parse_file(data_file("doors", direction["door"], data_dir))
+            wall.add_door(
+                Door(
+                    name=door_dict["name"],
+                    short_desc=door_dict["short_desc"],
+                    long_desc=door_dict["long_desc"],
+                )
+            )
+        room.add_wall(wall=wall, location=location)
+    for item_data in data.get("contains") or []:
+        room.contents.append(
+            item_from_dict(parse_file(data_file("things", item_data, data_dir)))
+        )
+    return room
+
+
+def bytes_per_room(loader, files: list[str]) -> float:
+    """Average traced memory held by each room built with `loader`."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    rooms = [loader(fname) for fname in files]
+    # Only count what the rooms themselves hold on to.
+    invalidate_doc_cache()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del rooms
+    return held / len(files)
+
+
+def main():
+    """Write a world and compare the memory its rooms hold either way."""
+    args = argparse.ArgumentParser(description=__doc__)
+    args.add_argument("--rooms", type=int, default=5000)
+    opts = args.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generate_world(tmp, opts.rooms)
+        files = sorted(glob.glob(f"{tmp}/rooms/*.yml"))
+        # Create the composite room classes up front so neither side pays for them.
+        for fname in files:
+            load_room_from_yaml(fname, data_dir=tmp)
+        plain = bytes_per_room(partial(load_plain_room, data_dir=tmp), files)
+        shared = bytes_per_room(partial(load_room_from_yaml, data_dir=tmp), files)
+        print(f"Bytes per room over {opts.rooms} rooms:")
+        print(f"  plain     {plain:10.0f}")
+        print(
+            f"  template  {shared:10.0f}  ({100 * (plain - shared) / plain:.0f}% less)"
+        )
+
+
+if __name__ == "__main__":
+    main()
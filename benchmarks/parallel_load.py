@@ -0,0 +1,43 @@
+"""Measure the speedup from loading map rooms on a worker pool.
+
+python -m benchmarks.parallel_load --rooms 50000 --workers 1 2 4 8
+"""
+
+import argparse
+import tempfile
+import time
+
+from adventure.dao.doc_yaml import invalidate_doc_cache
+from adventure.map.generator import generate_world
+from adventure.map.map import Map
+
+
+def time_load(base_dir: str, map_file: str, workers: int, executor: str) -> float:
+    """Seconds taken to load a map with nothing cached."""
+    invalidate_doc_cache()
+    start = time.perf_counter()
+    Map(base_data_dir=base_dir, file_name=map_file, workers=workers, executor=executor)
+    return time.perf_counter() - start
+
+
+def main():
+    """Write a world and load it with a growing number of workers."""
+    args = argparse.ArgumentParser(description=__doc__)
+    args.add_argument("--rooms", type=int, default=50000)
+    args.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args.add_argument("--executor", choices=["process", "thread"], default="process")
+    args.add_argument("--format", choices=["yml", "json"], default="yml")
+    opts = args.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        map_file = generate_world(tmp, opts.rooms, fmt=opts.format)
+        baseline = None
+        print(f"Loading a {opts.rooms} room map ({opts.executor} pool):")
+        for workers in opts.workers:
+            seconds = time_load(tmp, map_file, workers, opts.executor)
+            baseline = baseline or seconds
+            print(f"  {workers:3} workers {seconds:8.3f}s  x{baseline / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Compare the parser backends on a large generated world.
+
+python -m benchmarks.parser_backends --rooms 5000
+"""
+
+import argparse
+import glob
+import tempfile
+import time
+
+from adventure.dao import parser
+from adventure.dao.doc_yaml import invalidate_doc_cache
+from adventure.map.generator import generate_world
+from adventure.map.map import Map
+
+
+def time_parse(files: list[str], backend: str) -> float:
+    """Seconds taken to parse every file with one backend."""
+    start = time.perf_counter()
+    for fname in files:
+        parser.parse_file(fname, backend=backend)
+    return time.perf_counter() - start
+
+
+def time_map_load(base_dir: str, map_file: str) -> float:
+    """Seconds taken to load a map with nothing cached."""
+    invalidate_doc_cache()
+    start = time.perf_counter()
+    Map(base_data_dir=base_dir, file_name=map_file)
+    return time.perf_counter() - start
+
+
+def main():
+    """Write a world in YAML and JSON and time reading it with each backend."""
+    args = argparse.ArgumentParser(description=__doc__)
+    args.add_argument("--rooms", type=int, default=5000)
+    opts = args.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        yaml_map = generate_world(f"{tmp}/yml", opts.rooms, fmt="yml")
+        json_map = generate_world(f"{tmp}/json", opts.rooms, fmt="json")
+        yaml_files = glob.glob(f"{tmp}/yml/**/*.yml", recursive=True)
+        json_files = glob.glob(f"{tmp}/json/**/*.json", recursive=True)
+
+        print(f"Parsing {len(yaml_files)} files:")
+        for backend in ("yaml", "cyaml"):
+            if backend in parser.BACKENDS:
+                print(f"  {backend:6} {time_parse(yaml_files, backend):8.3f}s")
+            else:
+                print(f"  {backend:6} unavailable (PyYAML built without libyaml)")
+        print(f"  {'json':6} {time_parse(json_files, 'json'):8.3f}s")
+
+        print(f"Loading a {opts.rooms} room map:")
+        print(f"  yml    {time_map_load(f'{tmp}/yml', yaml_map):8.3f}s")
+        print(f"  json   {time_map_load(f'{tmp}/json', json_map):8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
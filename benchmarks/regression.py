@@ -0,0 +1,91 @@
+"""Run the benchmark suite and compare it with a saved baseline.
+
+    python -m benchmarks.regression --save          # record a new baseline
+    python -m benchmarks.regression                 # fail on regressions
+    python -m benchmarks.regression --threshold 25  # ...of more than 25%
+
+Baselines are kept in benchmarks/baselines, one directory per kind of
+machine, and a run is compared with the latest one saved on the same kind.
+Timings only compare on the same host, so baselines are not checked in: each
+developer or CI runner records its own with --save. A run fails if there is
+no such baseline, or if the baseline is missing any of the benchmarks run, so
+new benchmarks need a new baseline. The threshold can also be set with
+ADVENTURE_BENCHMARK_THRESHOLD. Needs the pytest-benchmark plugin.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import tempfile
+from typing import Optional
+
+import pytest
+from pytest_benchmark.utils import get_machine_id
+
+SUITE = "tests/benchmarks"
+BASELINES = "benchmarks/baselines"
+DEFAULT_THRESHOLD = 10
+
+
+def latest_baseline() -> Optional[str]:
+    """The newest baseline saved on this kind of machine, if there is one."""
+    saved = sorted(glob.glob(f"{BASELINES}/{get_machine_id()}/*.json"))
+    return saved[-1] if saved else None
+
+
+def benchmark_names(json_file: str) -> set[str]:
+    """The full names of the benchmarks in a pytest-benchmark JSON file."""
+    with open(json_file, "r", encoding="utf-8") as fh:
+        return {bench["fullname"] for bench in json.load(fh)["benchmarks"]}
+
+
+def pytest_args(save: bool, threshold: int, metric: str) -> list[str]:
+    """The pytest command line for a baseline or a comparison run."""
+    args = [SUITE, "--benchmark-only", f"--benchmark-storage={BASELINES}"]
+    if save:
+        return args + ["--benchmark-save=baseline"]
+    return args + [
+        "--benchmark-compare",
+        f"--benchmark-compare-fail={metric}:{threshold}%",
+    ]
+
+
+def main():
+    """Run the suite, saving a baseline or comparing with the last one."""
+    args = argparse.ArgumentParser(description="Check the benchmarks for regressions.")
+    args.add_argument("--save", action="store_true", help="save a new baseline")
+    args.add_argument(
+        "--threshold",
+        type=int,
+        default=int(os.environ.get("ADVENTURE_BENCHMARK_THRESHOLD", DEFAULT_THRESHOLD)),
+        help="the slowdown, in whole percent, that counts as a regression",
+    )
+    args.add_argument("--metric", choices=["min", "mean", "median"], default="median")
+    opts, extra = args.parse_known_args()
+    pytest_argv = pytest_args(opts.save, opts.threshold, opts.metric) + extra
+    if opts.save:
+        sys.exit(pytest.main(pytest_argv))
+    baseline = latest_baseline()
+    if baseline is None:
+        sys.exit(
+            f"No baseline for {get_machine_id()} in {BASELINES}; "
+            "record one on this host with --save first."
+        )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results = os.path.join(tmp_dir, "results.json")
+        code = pytest.main(pytest_argv + [f"--benchmark-json={results}"])
+        if code != 0:
+            sys.exit(code)
+        missing = benchmark_names(results) - benchmark_names(baseline)
+    if missing:
+        sys.exit(
+            f"{len(missing)} benchmarks are not in {baseline}, so were not "
+            "compared; record a new baseline with --save:\n  "
+            + "\n  ".join(sorted(missing))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Compare the memory held per room with and without __slots__.
+
+    python -m benchmarks.slots_memory --rooms 5000
+
+Whether rooms, walls, doors and items use __slots__ is fixed when they are
+imported, so each build mode is measured in its own interpreter.
+"""
+
+import argparse
+import glob
+import gc
+import os
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+
+from adventure.map.generator import generate_world
+
+
+def measure(base_dir: str, map_file: str) -> float:
+    """Average traced memory held by each room of a loaded map."""
+    # Imported here so ADVENTURE_COMPACT is read by the measuring interpreter.
+    from adventure.dao.doc_yaml import invalidate_doc_cache
+    from adventure.map.map import Map
+    from adventure.rooms.room_loader import load_room_from_yaml
+
+    # Create the composite classes up front so only the objects are counted.
+    for fname in glob.glob(f"{base_dir}/rooms/*.yml"):
+        load_room_from_yaml(fname, data_dir=base_dir)
+    invalidate_doc_cache()
+    gc.collect()
+    tracemalloc.start()
+    game_map = Map(base_data_dir=base_dir, file_name=map_file)
+    invalidate_doc_cache()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return held / len(game_map.rooms)
+
+
+def run_mode(base_dir: str, map_file: str, compact: bool) -> float:
+    """Measure one build mode in a fresh interpreter."""
+    env = dict(os.environ, ADVENTURE_COMPACT="1" if compact else "0")
+    out = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.slots_memory",
+            "--measure",
+            base_dir,
+            map_file,
+        ],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(out.stdout)
+
+
+def main():
+    """Write a world and measure the bytes per room in each build mode."""
+    args = argparse.ArgumentParser(description=__doc__)
+    args.add_argument("--rooms", type=int, default=5000)
+    args.add_argument("--measure", nargs=2, metavar=("BASE_DIR", "MAP_FILE"))
+    opts = args.parse_args()
+    if opts.measure:
+        print(measure(*opts.measure))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        map_file = generate_world(tmp, opts.rooms)
+        plain = run_mode(tmp, map_file, compact=False)
+        compact = run_mode(tmp, map_file, compact=True)
+        print(f"Bytes per room over {opts.rooms} rooms:")
+        print(f"  __dict__  {plain:10.0f}")
+        print(
+            f"  __slots__ {compact:10.0f}  ({100 * (plain - compact) / plain:.0f}% less)"
+        )
+
+
+if __name__ == "__main__":
+    main()
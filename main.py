@@ -1,21 +1,109 @@
 """Main runner of the adventure game."""
 
+import argparse
+import os
 import sys
 from adventure.game import Game
+from adventure.journal import Journal
+from adventure.startup import format_report, measure_imports
 from adventure.defaults import DEFAULT_DATA_DIR, DEFAULT_MAP_FILE, DEFAULT_COMMANDS_FILE
 
 
 def main():
     """The main thing."""
+    args = argparse.ArgumentParser(description="Play the adventure game.")
+    args.add_argument(
+        "--strict",
+        action="store_true",
+        help="import every command's action at startup to check it exists",
+    )
+    args.add_argument(
+        "--import-times",
+        action="store_true",
+        help="show how long the game's modules take to import, then exit",
+    )
+    args.add_argument(
+        "--batch",
+        nargs="+",
+        metavar="SCRIPT",
+        help="run scripts of commands ('-' for stdin) and print JSON lines",
+    )
+    args.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="with --batch, run the scripts on this many processes",
+    )
+    args.add_argument(
+        "--serve",
+        type=int,
+        metavar="PORT",
+        help="host a game for every client connecting to this TCP port",
+    )
+    args.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="with --serve, the address to listen on",
+    )
+    args.add_argument(
+        "--prefork",
+        type=int,
+        metavar="WORKERS",
+        help="with --serve, load the world once and fork this many worker processes",
+    )
+    args.add_argument(
+        "--journal",
+        metavar="FILE",
+        help="append the changes made while playing to this journal file",
+    )
+    args.add_argument(
+        "--save",
+        metavar="FILE",
+        help="let the 'save' and 'restore' commands keep the game in this file",
+    )
+    opts = args.parse_args()
+    if opts.import_times:
+        print(format_report(measure_imports()))
+        return
+    if opts.batch:
+        # Imported here, like the other modes, so playing never loads them.
+        from adventure.batch import BatchOptions, run_batch
+
+        run_batch(
+            opts.batch,
+            BatchOptions(DEFAULT_DATA_DIR, DEFAULT_MAP_FILE, DEFAULT_COMMANDS_FILE),
+            workers=opts.workers,
+        )
+        return
+    if opts.serve is not None:
+        import asyncio
+        from adventure.server import GameServer, serve
+
+        server = GameServer(journal_file=opts.journal or "")
+        if opts.prefork:
+            from adventure.prefork import serve_prefork
+
+            serve_prefork(opts.host, opts.serve, opts.prefork, server)
+        else:
+            asyncio.run(serve(opts.host, opts.serve, server))
+        return
+    journal = Journal(opts.journal) if opts.journal else None
     game: Game = Game(
         base_data_dir=DEFAULT_DATA_DIR,
         map_file_name=DEFAULT_MAP_FILE,
         cmd_file_name=DEFAULT_COMMANDS_FILE,
+        strict=opts.strict,
+        journal=journal,
+        session=str(os.getpid()),
+        save_file=opts.save or "",
     )
     try:
         game.run()
     except KeyboardInterrupt:
         sys.exit(0)
+    finally:
+        if journal is not None:
+            journal.close()
 
 
 if __name__ == "__main__":
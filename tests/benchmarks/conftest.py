@@ -0,0 +1,62 @@
+"""Shared fixtures for the benchmark suite.
+
+The benchmarks only run with `--benchmark-only`, which is how
+`python -m benchmarks.regression` runs them; a plain `pytest` run skips them.
+"""
+
+import pytest
+
+from adventure.commands.command_list import CommandList
+from adventure.map.generator import generate_world
+from adventure.map.map import Map
+from adventure.player.player import Player
+
+TEST_DATA_DIR = "tests/data"
+COMMANDS_FILE = "adventure/data/commands.yml"
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the benchmarks unless they were asked for."""
+    if config.getoption("benchmark_only", default=False):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with --benchmark-only")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
+
+
+class Session:
+    """The parts of a Game the command actions use."""
+
+    def __init__(self, game_map: Map, player: Player):
+        self.map = game_map
+        self.player = player
+        self.current_loc = game_map.get_room(game_map.start_room)
+
+    def emit(self, event):
+        """Events are not journaled in the benchmarks."""
+
+
+@pytest.fixture(scope="session")
+def commands() -> CommandList:
+    """The shipped command list."""
+    return CommandList(COMMANDS_FILE)
+
+
+@pytest.fixture
+def player() -> Player:
+    """A player with empty hands."""
+    return Player()
+
+
+@pytest.fixture
+def session(player) -> Session:
+    """A fresh copy of the test map with the player standing in room one."""
+    return Session(Map(base_data_dir=TEST_DATA_DIR, file_name="test_map.yml"), player)
+
+
+@pytest.fixture
+def two_rooms(player, tmp_path) -> Session:
+    """A generated world of two rooms, joined east to west."""
+    map_file = generate_world(str(tmp_path), 2, items_per_room=0)
+    return Session(Map(base_data_dir=str(tmp_path), file_name=map_file), player)
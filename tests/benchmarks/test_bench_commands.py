@@ -0,0 +1,51 @@
+"""Benchmarks for dispatching the common command actions."""
+
+import pytest
+
+from adventure.grammar import parse_phrase
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_move(benchmark, commands, two_rooms):
+    """Walk from one room to the other and back."""
+    move = commands.get_command("move")
+    start = two_rooms.current_loc
+    east = parse_phrase("go", ["east"])
+    west = parse_phrase("go", ["to", "the", "west"])
+
+    def there_and_back():
+        move.do_action(two_rooms, east)
+        return move.do_action(two_rooms, west)
+
+    assert benchmark(there_and_back).startswith("You go through")
+    assert two_rooms.current_loc is start
+
+
+def test_look_around(benchmark, commands, session):
+    """Look around the room."""
+    look = commands.get_command("look")
+    around = parse_phrase("look", [])
+    assert "Doors:" in benchmark(look.do_action, session, around)
+
+
+def test_look_at(benchmark, commands, session):
+    """Look at something in the room."""
+    look = commands.get_command("look")
+    at_rock = parse_phrase("look", ["at", "rock"])
+    assert "[rock]" in benchmark(look.do_action, session, at_rock)
+
+
+def test_pick_and_drop(benchmark, commands, session):
+    """Pick the rock up and drop it again."""
+    pick = commands.get_command("pick")
+    drop = commands.get_command("drop")
+    pick_up = parse_phrase("pick", ["up", "rock"])
+    drop_rock = parse_phrase("drop", ["rock"])
+
+    def pick_and_drop():
+        pick.do_action(session, pick_up)
+        return drop.do_action(session, drop_rock)
+
+    assert benchmark(pick_and_drop).startswith("You dropped:")
+    assert [item.name for item in session.current_loc.contents] == ["rock"]
@@ -0,0 +1,31 @@
+"""Benchmarks for playing statements through Game.step."""
+
+import pytest
+
+from adventure.game import Game
+
+pytest.importorskip("pytest_benchmark")
+
+TEST_DATA_DIR = "tests/data"
+
+# Looks around and walks between the first two rooms of the test map.
+STATEMENTS = ["look", "go west", "look at the door", "go east", "inventory"] * 20
+
+
+@pytest.fixture
+def game() -> Game:
+    """A game of the test map, without a UI."""
+    return Game(TEST_DATA_DIR, "test_map.yml", "test_commands.yml")
+
+
+def test_step(benchmark, game):
+    """Play the statements one step at a time."""
+    results = benchmark(lambda: [game.step(text) for text in STATEMENTS])
+    assert len(results) == len(STATEMENTS)
+
+
+def test_step_many(benchmark, game):
+    """Play the same statements as one batch."""
+    results = benchmark(game.step_many, STATEMENTS)
+    assert len(results) == len(STATEMENTS)
+    assert not any(result.error for result in results)
@@ -0,0 +1,77 @@
+"""Benchmarks for containers and inventories holding many items."""
+
+import pytest
+
+from adventure.inventory import Container, Inventory
+from adventure.items.item import HandheldItem
+
+pytest.importorskip("pytest_benchmark")
+
+ITEMS = 1000
+
+
+def make_items(count: int) -> list[HandheldItem]:
+    """Numbered pebbles."""
+    return [
+        HandheldItem(
+            name=f"pebble_{index}",
+            short_desc="a pebble",
+            long_desc="A small grey pebble.",
+            weight=0.1,
+            bulk=1,
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def sack() -> Container:
+    """A container holding many items."""
+    return Container(
+        name="sack", short_desc="a sack", capacity=ITEMS * 2, contents=make_items(ITEMS)
+    )
+
+
+@pytest.fixture
+def inventory(sack) -> Inventory:
+    """An inventory with a full sack and an empty bag."""
+    inv = Inventory()
+    inv.containers = [
+        sack,
+        Container(name="bag", short_desc="a bag", capacity=ITEMS * 2, contents=[]),
+    ]
+    return inv
+
+
+def test_container_get(benchmark, sack):
+    """Find the last item in a full container."""
+    assert benchmark(sack.get, f"pebble_{ITEMS - 1}").name == f"pebble_{ITEMS - 1}"
+
+
+def test_container_insert_remove(benchmark, sack):
+    """Put an item into a full container and take it out again."""
+    extra = make_items(1)[0]
+
+    def insert_remove():
+        sack.insert(extra)
+        return sack.remove(extra)
+
+    assert benchmark(insert_remove) is extra
+    assert len(sack.contents) == ITEMS
+
+
+def test_inventory_find_item(benchmark, inventory):
+    """Search every container for an item."""
+    found = benchmark(inventory.find_item, f"pebble_{ITEMS - 1}")
+    assert found[0]["where"] == "sack"
+
+
+def test_inventory_swap(benchmark, inventory):
+    """Move an item from one container to another and back."""
+    name = f"pebble_{ITEMS // 2}"
+
+    def swap_and_back():
+        inventory.swap_container_item(source="sack", dest="bag", item_name=name)
+        return inventory.swap_container_item(source="bag", dest="sack", item_name=name)
+
+    assert benchmark(swap_and_back)
@@ -0,0 +1,40 @@
+"""Benchmarks for loading maps of several sizes."""
+
+import pytest
+
+from adventure.dao.doc_yaml import invalidate_doc_cache
+from adventure.map.generator import generate_world
+from adventure.map.map import Map
+
+pytest.importorskip("pytest_benchmark")
+
+WORLD_SIZES = [100, 1000, 3000]
+
+
+@pytest.fixture(scope="module", params=WORLD_SIZES)
+def world(request, tmp_path_factory):
+    """A generated grid world: (data directory, map file, rooms)."""
+    base_dir = str(tmp_path_factory.mktemp(f"world_{request.param}"))
+    return base_dir, generate_world(base_dir, request.param), request.param
+
+
+def test_map_load(benchmark, world):
+    """Load a map with nothing cached."""
+    base_dir, map_file, rooms = world
+    game_map = benchmark.pedantic(
+        Map,
+        kwargs={"base_data_dir": base_dir, "file_name": map_file},
+        setup=invalidate_doc_cache,
+        rounds=3,
+    )
+    assert len(game_map.rooms) == rooms
+
+
+def test_map_load_cached(benchmark, world):
+    """Load a map again with its documents in the document cache."""
+    base_dir, map_file, rooms = world
+    Map(base_data_dir=base_dir, file_name=map_file)
+    game_map = benchmark.pedantic(
+        Map, kwargs={"base_data_dir": base_dir, "file_name": map_file}, rounds=3
+    )
+    assert len(game_map.rooms) == rooms
@@ -0,0 +1,52 @@
+"""Benchmarks for saving and restoring a game with many changes."""
+
+import pytest
+
+from adventure.game import Game
+from adventure.interpreter import Interpreter
+from adventure.map.generator import generate_world
+from adventure.map.map import Map
+from adventure.save import SaveFile, restore_game
+
+pytest.importorskip("pytest_benchmark")
+
+ROOMS = 1000
+
+
+@pytest.fixture(scope="module")
+def played(tmp_path_factory):
+    """A game that moved a thing out of, and closed a door in, every room."""
+    base_dir = str(tmp_path_factory.mktemp("world"))
+    map_file = generate_world(base_dir, ROOMS, items_per_room=1)
+    world = Map(base_data_dir=base_dir, file_name=map_file)
+    interpreter = Interpreter("adventure/data/commands.yml")
+    game = Game(base_dir, map_file, "", world=world, interpreter=interpreter)
+    for room_id in range(1, ROOMS):
+        room = game.map.get_room(room_id)
+        if room.contents:
+            thing = room.contents[0]
+            room.contents.remove(thing)
+            game.map.get_room(room_id + 1).contents.append(thing)
+        room.get_doors()[0].close()
+    return game
+
+
+def test_save(benchmark, played, tmp_path):
+    """Write a full save."""
+    saves = SaveFile(str(tmp_path / "game.sav"))
+    assert benchmark(saves.save, played, full=True) > 0
+
+
+def test_restore(benchmark, played, tmp_path):
+    """Restore the save into a new game of the same world."""
+    path = str(tmp_path / "game.sav")
+    SaveFile(path).save(played)
+    game = Game(
+        played.base_data_dir,
+        "",
+        "",
+        world=played.map.world,
+        interpreter=played.interpreter,
+    )
+    benchmark(restore_game, game, path)
+    assert len(game.map.changed_rooms()) >= ROOMS - 1
@@ -0,0 +1,75 @@
+"""Benchmarks for turning player input into statements."""
+
+import random
+import string
+
+import pytest
+
+from adventure.commands.command import Command
+from adventure.commands.command_list import CommandList
+from adventure.interpreter import Interpreter
+from adventure.statement import Statement
+
+pytest.importorskip("pytest_benchmark")
+
+COMMANDS_FILE = "adventure/data/commands.yml"
+STATEMENTS = ["look", "go west", "pick up the rock", "throw rock at the north wall"]
+
+
+@pytest.mark.parametrize("text", STATEMENTS)
+def test_statement(benchmark, commands, text):
+    """Build a Statement from a line of input."""
+    stmt = benchmark(Statement, text, commands)
+    assert stmt.verb
+
+
+@pytest.mark.parametrize("cache_size", [0, 256], ids=["uncached", "cached"])
+def test_interpreter_prepare(benchmark, cache_size):
+    """Prepare a mix of statements through the Interpreter."""
+    interpreter = Interpreter(commands_file=COMMANDS_FILE, cache_size=cache_size)
+
+    def prepare_all():
+        return [interpreter.prepare(text) for text in STATEMENTS]
+
+    prepared = benchmark(prepare_all)
+    assert [stmt.verb.name for stmt in prepared] == ["look", "move", "pick", "throw"]
+
+
+@pytest.fixture(scope="module")
+def many_commands():
+    """A command list with thousands of made up verbs, and each verb's name."""
+    rng = random.Random(0)
+    cmd_list = CommandList()
+    while len(cmd_list) < 3000:
+        name, alias = (
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+            for _ in range(2)
+        )
+        if cmd_list.has_command(name) or cmd_list.has_command(alias):
+            continue
+        cmd_list.add_command(
+            Command(
+                name=name,
+                desc="A made up verb.",
+                help_text="",
+                aliases=[alias],
+                action_path="adventure.commands.look.look",
+            )
+        )
+    return cmd_list, [cmd.name for cmd in cmd_list]
+
+
+def test_find_prefix(benchmark, many_commands):
+    """Resolve abbreviated verbs among thousands."""
+    cmd_list, names = many_commands
+    prefixes = [name[:-1] for name in names[:100]]
+    found = benchmark(lambda: [cmd_list.find_prefix(prefix) for prefix in prefixes])
+    assert sum(cmd is not None for cmd in found) > 90
+
+
+def test_suggest(benchmark, many_commands):
+    """Suggest verbs for misspellings among thousands."""
+    cmd_list, names = many_commands
+    typos = [name[0] + name[2:] for name in names[:100]]
+    found = benchmark(lambda: [cmd_list.suggest(typo) for typo in typos])
+    assert all(name in suggestions for name, suggestions in zip(names, found))
@@ -0,0 +1,50 @@
+"""Unit tests for running scripts of commands in batch mode."""
+
+import io
+import json
+
+import pytest
+
+from adventure.batch import BatchOptions, run_batch, run_lines
+
+TEST_OPTIONS = BatchOptions("tests/data", "test_map.yml", "test_commands.yml")
+SCRIPT = ["look", "", "# go nowhere", "go west", "dance", "lok"]
+
+
+class TestBatch:
+    """Test batch runs."""
+
+    def test_run_lines(self):
+        """Each statement gives a record; blank lines and comments are skipped."""
+        records = list(run_lines(SCRIPT, TEST_OPTIONS, script="test"))
+        assert [record["line"] for record in records] == [1, 4, 5, 6]
+        look, move, dance, lok = records
+        assert look["output"].startswith("This room looks like it is the first room.")
+        assert look["error"] is None
+        assert move["output"] == "You go through the opening to Room Two."
+        assert move["room_id"] == 2
+        assert move["command"] == "move"
+        assert dance["error"] == "CommandNotFoundError"
+        assert lok["suggestions"] == ["look"]
+
+    def test_command_errors_are_recorded(self):
+        """A command that raises does not stop the script."""
+        records = list(run_lines(["go sideways", "look"], TEST_OPTIONS))
+        assert records[0]["error"] is not None
+        assert records[1]["error"] is None
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_run_batch(self, tmp_path, workers):
+        """Scripts write JSON lines in order, and a summary to stderr."""
+        scripts = []
+        for name in ["first", "second", "third"]:
+            script = tmp_path / f"{name}.txt"
+            script.write_text("\n".join(SCRIPT), encoding="utf-8")
+            scripts.append(str(script))
+        out, err = io.StringIO(), io.StringIO()
+        commands = run_batch(scripts, TEST_OPTIONS, workers=workers, out=out, err=err)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert commands == len(records) == 12
+        assert [record["script"] for record in records[::4]] == scripts
+        assert "12 commands from 3 scripts" in err.getvalue()
+        assert "commands/s" in err.getvalue()
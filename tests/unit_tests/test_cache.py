@@ -0,0 +1,44 @@
+"""Unit tests for the LRU cache."""
+
+import pytest
+
+from adventure.cache import LRUCache
+
+
+class TestLRUCache:
+    """Test the LRUCache class."""
+
+    def test_bad_size(self):
+        """A cache must hold at least one entry."""
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=0)
+
+    def test_eviction_order(self):
+        """The least recently used entry is evicted first."""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert "b" not in cache
+        assert cache.keys() == ["a", "c"]
+
+    def test_info(self):
+        """Hits and misses are counted."""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("z")
+        info = cache.info()
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 1, 2, 1)
+
+    def test_invalidate(self):
+        """Invalidating removes one key, or everything."""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.invalidate("a")
+        assert "a" not in cache
+        cache.invalidate()
+        assert len(cache) == 0
+        assert cache.info().hits == 0
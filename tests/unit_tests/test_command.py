@@ -2,6 +2,7 @@
 
 import pytest
 from adventure.commands.command import Command
+from adventure.commands.move import move
 from adventure.exceptions import CommandNotFoundError
 
 
@@ -39,7 +40,7 @@ class TestCommand:
         assert str(hop_cmd) == "hop - A sudden motion forward"
 
     def test_command_init_fail(self):
-        """Test a bad action path for a command init."""
+        """Test a bad action path for a strict command init."""
         with pytest.raises(CommandNotFoundError):
             Command(
                 name="slide",
@@ -47,8 +48,27 @@ class TestCommand:
                 help_text="for stealing home base",
                 aliases=[],
                 action_path="adventure.commands.move.slide",
+                strict=True,
             )
 
+    def test_command_lazy_action(self):
+        """Test a missing action function is only found on first use."""
+        cmd = Command(
+            name="slide",
+            desc="running and coming to a stop on your knees",
+            help_text="for stealing home base",
+            aliases=[],
+            action_path="adventure.commands.move.slide",
+        )
+        with pytest.raises(CommandNotFoundError):
+            cmd.do_action(None)
+
+    def test_command_action_imported_on_first_use(self, hop_cmd):
+        """Test the action is imported when the command is first used."""
+        assert hop_cmd._action is None
+        assert hop_cmd.action is move
+        assert hop_cmd._action is move
+
     def test_command_init_bad_import_action(self):
         """Test an action path that cannot be resolved."""
         with pytest.raises(ImportError):
@@ -61,6 +81,14 @@ class TestCommand:
             )
 
     def test_command_init_no_action_path(self):
+        with pytest.raises(ValueError):
+            Command(
+                name="rock",
+                desc="flailing around to your favorite music",
+                help_text="purely for show",
+                aliases=[],
+                action_path="rock",
+            )
         with pytest.raises(ValueError):
             Command(
                 name="rock",
@@ -0,0 +1,108 @@
+"""Unit tests for the CommandList module."""
+
+import pytest
+
+from adventure.commands.command import Command
+from adventure.commands.command_list import CommandList
+from adventure.exceptions import CommandAliasCollisionError, CommandNotFoundError
+
+TEST_COMMANDS = "tests/data/test_commands.yml"
+
+
+def make_command(name: str, aliases: list[str]) -> Command:
+    """A command that moves the player."""
+    return Command(
+        name=name,
+        desc=f"{name} somewhere",
+        help_text=f"Use '{name} <direction>'.",
+        aliases=aliases,
+        action_path="adventure.commands.move.move",
+    )
+
+
+class TestCommandList:
+    """Test looking up commands by name and alias."""
+
+    @pytest.fixture
+    def cmd_list(self):
+        """The test command list."""
+        return CommandList(commands_yml_file=TEST_COMMANDS)
+
+    @pytest.mark.parametrize(
+        "word,expected", [("move", "move"), ("Walk", "move"), ("INV", "inventory")]
+    )
+    def test_lookup_ignores_case(self, cmd_list, word, expected):
+        """Names and aliases are found whatever their case."""
+        assert cmd_list.get_command(word).name == expected
+        assert cmd_list.has_command(word)
+
+    def test_unknown_command(self, cmd_list):
+        """Unknown words are not commands."""
+        assert cmd_list.find("dance") is None
+        assert not cmd_list.has_command("dance")
+        with pytest.raises(CommandNotFoundError):
+            cmd_list.get_command("dance")
+
+    def test_add_command_updates_index(self, cmd_list):
+        """Added commands can be found straight away."""
+        hop = make_command("hop", ["skip"])
+        cmd_list.add_command(hop)
+        assert cmd_list.find("SKIP") is hop
+        assert len(cmd_list) == 6
+
+    def test_alias_collision(self, cmd_list):
+        """A command cannot take a word another command already uses."""
+        with pytest.raises(CommandAliasCollisionError):
+            cmd_list.add_command(make_command("hop", ["Go"]))
+        assert cmd_list.find("hop") is None
+        assert cmd_list.get_command("go").name == "move"
+
+    def test_alias_collision_on_load(self, tmp_path):
+        """Collisions in a commands file are found when it is loaded."""
+        commands_file = tmp_path / "commands.yml"
+        commands_file.write_text(
+            "- name: move\n"
+            "  aliases: [go]\n"
+            "  action: adventure.commands.move.move\n"
+            "- name: leave\n"
+            "  aliases: [GO]\n"
+            "  action: adventure.commands.move.move\n",
+            encoding="utf-8",
+        )
+        with pytest.raises(CommandAliasCollisionError):
+            CommandList(commands_yml_file=str(commands_file))
+
+    def test_find_prefix(self, cmd_list):
+        """Abbreviations find a command only when just one command fits."""
+        assert cmd_list.find_prefix("INVEN").name == "inventory"
+        assert cmd_list.find_prefix("gra").name == "pick"
+        assert cmd_list.find_prefix("he").name == "help"
+        assert cmd_list.find_prefix("g") is None
+
+    def test_suggest(self, cmd_list):
+        """Misspelled words suggest the nearest command words."""
+        assert cmd_list.suggest("lok") == ["look"]
+        assert cmd_list.suggest("Graab") == ["grab"]
+        assert cmd_list.suggest("xyzzy") == []
+
+    def test_many_verbs(self):
+        """Matching works the same with thousands of verbs."""
+        cmd_list = CommandList()
+        for number in range(3000):
+            cmd_list.add_command(make_command(f"verb{number}", [f"alias{number}x"]))
+        assert cmd_list.find("VERB2999").name == "verb2999"
+        assert cmd_list.find_prefix("alias1234").name == "verb1234"
+        assert cmd_list.find_prefix("verb123") is None
+        assert "verb2999" in cmd_list.suggest("verb2999z")
+
+    def test_strict_load(self, tmp_path):
+        """Strict loading imports every action and reports missing ones."""
+        commands_file = tmp_path / "commands.yml"
+        commands_file.write_text(
+            "- name: slide\n  action: adventure.commands.move.slide\n",
+            encoding="utf-8",
+        )
+        lazy = CommandList(commands_yml_file=str(commands_file))
+        assert lazy.find("slide") is not None
+        with pytest.raises(CommandNotFoundError):
+            CommandList(commands_yml_file=str(commands_file), strict=True)
@@ -0,0 +1,60 @@
+"""Unit tests for the composite class registry."""
+
+import pytest
+
+from adventure.composite import composite_type, composite_type_count, merge_bases
+from adventure.defaults import COMPACT_OBJECTS
+from adventure.items.item import Item, HandheldItem, ThrowableItem
+from adventure.items.item_loader import CLASS_MAP, load_item_from_yaml
+from adventure.rooms.room_loader import load_room_from_yaml
+
+ROCK_FILE = "adventure/data/things/start_rock.yml"
+
+
+class TestComposite:
+    """Test the composite class registry."""
+
+    def test_merge_bases(self):
+        """Subclasses replace their bases rather than being added beside them."""
+        assert merge_bases(Item, [], CLASS_MAP, "item") == (Item,)
+        assert merge_bases(Item, ["handheld", "throwable"], CLASS_MAP, "item") == (
+            ThrowableItem,
+        )
+
+    def test_merge_bases_unknown_class(self):
+        """Unknown class names are rejected."""
+        with pytest.raises(ValueError):
+            merge_bases(Item, ["edible"], CLASS_MAP, "item")
+
+    def test_composite_type_shared(self):
+        """The same name and bases give back the same class."""
+        cls = composite_type("PebbleItem", (HandheldItem,))
+        assert cls is composite_type("PebbleItem", (HandheldItem,))
+        assert cls is not composite_type("PebbleItem", (ThrowableItem,))
+        assert issubclass(cls, HandheldItem)
+
+    def test_loaded_items_share_a_class(self):
+        """Loading the same thing twice does not create another class."""
+        first = load_item_from_yaml(ROCK_FILE)
+        count = composite_type_count()
+        second = load_item_from_yaml(ROCK_FILE)
+        assert type(first) is type(second)
+        assert composite_type_count() == count
+
+    def test_loaded_rooms_share_a_class(self):
+        """Loading the same room twice does not create another class."""
+        first = load_room_from_yaml("tests/data/rooms/room_one.yml")
+        count = composite_type_count()
+        second = load_room_from_yaml("tests/data/rooms/room_one.yml")
+        assert type(first) is type(second)
+        assert first == second
+        assert composite_type_count() == count
+
+    @pytest.mark.skipif(not COMPACT_OBJECTS, reason="built without __slots__")
+    def test_composite_type_keeps_slots(self):
+        """Composites of slotted classes do not get a __dict__ back."""
+        rock = load_item_from_yaml(ROCK_FILE)
+        room = load_room_from_yaml("tests/data/rooms/room_one.yml")
+        assert not hasattr(rock, "__dict__")
+        assert not hasattr(room, "__dict__")
+        assert not hasattr(room.walls[0], "__dict__")
@@ -0,0 +1,131 @@
+"""Unit tests for playing the game from code with Game.step."""
+
+import gc
+import tracemalloc
+
+import pytest
+
+from adventure.game import Game
+from adventure.interpreter import Interpreter
+from adventure.map.map import Map
+
+# Games made by the stress test, and the most memory each may take, in bytes.
+MANY_GAMES = 3000
+GAME_MEMORY_BUDGET = 8 * 1024
+
+
+@pytest.fixture
+def game():
+    """A game of the test map without a UI."""
+    return Game("tests/data", "test_map.yml", "test_commands.yml")
+
+
+class TestStep:
+    """Test Game.step and Game.step_many."""
+
+    def test_step(self, game):
+        """A step reports the command, its output and where the player is."""
+        result = game.step("go west")
+        assert result.input == "go west"
+        assert result.command == "move"
+        assert result.output == "You go through the opening to Room Two."
+        assert result.error is None
+        assert result.room_id == 2
+        assert result.elapsed >= 0
+
+    def test_step_needs_no_ui(self, game, capsys):
+        """Printed output is captured into the result, not shown."""
+        result = game.step("look")
+        assert game.ui is None
+        assert result.output.startswith("This room looks like it is the first room.")
+        assert capsys.readouterr().out == ""
+
+    @pytest.mark.parametrize(
+        "text, error",
+        [("", "BadStatementError"), ("dance", "CommandNotFoundError")],
+    )
+    def test_step_errors(self, game, text, error):
+        """Statements that cannot be played give the kind of error."""
+        result = game.step(text)
+        assert result.error == error
+        assert result.command is None
+        assert (
+            result.output
+            == game.prompt.msg[
+                "bad_statement" if error == "BadStatementError" else "unknown_action"
+            ]
+        )
+        assert result.room_id == 1
+
+    def test_step_suggestions(self, game):
+        """A misspelled verb gives suggestions."""
+        assert game.step("lok").suggestions == ("look",)
+
+    def test_command_error(self, game):
+        """A command that raises is reported, and the game goes on."""
+        result = game.step("go sideways")
+        assert result.error is not None
+        assert game.is_running
+
+    def test_step_many(self, game):
+        """step_many gives the same results as stepping one at a time."""
+        texts = ["look", "go west", "go south", "dance"]
+        many = game.step_many(texts)
+        other = Game("tests/data", "test_map.yml", "test_commands.yml")
+        single = [other.step(text) for text in texts]
+        assert [r._replace(elapsed=0) for r in many] == [
+            r._replace(elapsed=0) for r in single
+        ]
+        assert many[-1].room_id == 2
+
+    def test_step_many_stops_when_game_ends(self, game):
+        """Nothing more is played once the game ends."""
+        game.is_running = False
+        assert not game.step_many(["look"])
+
+
+class TestManyGames:
+    """Test many games played in one process."""
+
+    def test_players_are_separate(self):
+        """Each game has its own player, inventory and hands."""
+        first = Game("tests/data", "test_map.yml", "test_commands.yml")
+        second = Game("tests/data", "test_map.yml", "test_commands.yml")
+        assert first.player is not second.player
+        assert first.player.inventory.containers is not (
+            second.player.inventory.containers
+        )
+        assert first.step("pick rock").output == "You pick up rock."
+        assert first.player.inventory.holding("rock")
+        assert not second.player.inventory.holding("rock")
+
+    def test_stress(self):
+        """Thousands of games can share a world, each with its own state."""
+        world = Map(base_data_dir="tests/data", file_name="test_map.yml")
+        interpreter = Interpreter("tests/data/test_commands.yml")
+        gc.collect()
+        tracemalloc.start()
+        try:
+            games = [
+                Game(
+                    "tests/data",
+                    "test_map.yml",
+                    "test_commands.yml",
+                    world=world,
+                    interpreter=interpreter,
+                )
+                for _ in range(MANY_GAMES)
+            ]
+            for game in games[::2]:
+                game.step("pick rock")
+                game.step("go west")
+            used, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert used / MANY_GAMES < GAME_MEMORY_BUDGET
+        for number, game in enumerate(games):
+            moved = number % 2 == 0
+            assert game.player.inventory.holding("rock") == moved
+            assert game.current_loc.room_id == (2 if moved else 1)
+            assert len(game.current_loc.contents) == 1
+        assert [item.name for item in world.get_room(1).contents] == ["rock"]
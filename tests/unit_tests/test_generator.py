@@ -0,0 +1,90 @@
+"""Unit tests for the procedural world generator."""
+
+import os
+import random
+import time
+from collections import deque
+
+import pytest
+
+from adventure.map.generator import (
+    TOPOLOGIES,
+    _random_links,
+    generate_world,
+    snapshot_path,
+)
+from adventure.map.map import Map
+from adventure.map.snapshot import read_snapshot
+
+
+def reachable(game_map: Map) -> set:
+    """The ids of every room that can be reached from the start room."""
+    seen = {game_map.start_room}
+    queue = deque([game_map.start_room])
+    while queue:
+        for there in game_map.neighbours(queue.popleft()):
+            if there not in seen:
+                seen.add(there)
+                queue.append(there)
+    return seen
+
+
+class TestGenerator:
+    """Test writing and loading generated worlds."""
+
+    @pytest.mark.parametrize("topology", TOPOLOGIES)
+    def test_generated_world_loads(self, tmp_path, topology):
+        """Every topology loads, and every room can be reached from the start."""
+        map_file = generate_world(str(tmp_path), 150, topology=topology)
+        game_map = Map(base_data_dir=str(tmp_path), file_name=map_file)
+        assert len(game_map.rooms) == 150
+        assert reachable(game_map) == set(range(1, 151))
+
+    def test_large_random_world(self):
+        """Linking a random world takes time in proportion to its rooms."""
+        start = time.perf_counter()
+        links = _random_links(40000, 1.0, random.Random(1))
+        assert time.perf_counter() - start < 5
+        assert all(links[index] for index in range(40000))
+
+    def test_exits_have_doors(self, tmp_path):
+        """Each exit of a generated room is a door leading to the same room."""
+        map_file = generate_world(str(tmp_path), 20, topology="random", seed=3)
+        game_map = Map(base_data_dir=str(tmp_path), file_name=map_file)
+        for room_id, room in game_map.rooms.items():
+            doors = sorted(door.leads_to for door in room.get_doors())
+            assert doors == sorted(game_map.neighbours(room_id))
+
+    def test_json_world(self, tmp_path):
+        """A world can be written as JSON instead of YAML."""
+        map_file = generate_world(str(tmp_path), 10, fmt="json", items_per_room=2)
+        assert map_file.endswith(".json")
+        assert os.path.isfile(tmp_path / "rooms" / "room_1.json")
+        game_map = Map(base_data_dir=str(tmp_path), file_name=map_file)
+        assert len(game_map.rooms) == 10
+        assert len(game_map.get_room(1).contents) == 2
+
+    def test_same_seed_same_world(self, tmp_path):
+        """Generation is repeatable for a given seed."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        map_file = generate_world(str(first), 30, topology="random", seed=7)
+        generate_world(str(second), 30, topology="random", seed=7)
+        assert (first / map_file).read_text() == (second / map_file).read_text()
+
+    def test_snapshot(self, tmp_path):
+        """The generator can also compile a snapshot of the world."""
+        map_file = generate_world(str(tmp_path), 10, snapshot=True)
+        snapshot_file = snapshot_path(str(tmp_path), map_file)
+        docs = read_snapshot(snapshot_file, f"{tmp_path}/{map_file}")
+        assert f"{tmp_path}/rooms/room_1.yml" in docs
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"topology": "maze"}, {"fmt": "xml"}, {"rooms": 0}],
+    )
+    def test_bad_arguments(self, tmp_path, kwargs):
+        """Unknown topologies and formats, and empty worlds, are refused."""
+        kwargs.setdefault("rooms", 10)
+        with pytest.raises(ValueError):
+            generate_world(str(tmp_path), **kwargs)
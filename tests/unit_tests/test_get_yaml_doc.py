@@ -1,5 +1,7 @@
+import os
+
 import pytest
-from adventure.dao.doc_yaml import get_yaml_doc
+from adventure.dao.doc_yaml import get_yaml_doc, doc_cache_info, invalidate_doc_cache
 from adventure.exceptions import EmptyFileError, BadYamlError
 
 
@@ -45,3 +47,36 @@ class TestGetYamlDoc:
         with pytest.raises(BadYamlError):
             get_yaml_doc(str(fname))
         fname.unlink(missing_ok=True)
+
+    def test_get_yaml_doc_cached(self):
+        """Test that a second read of an unchanged doc comes from the cache."""
+        invalidate_doc_cache()
+        get_yaml_doc(str(self.fname))
+        get_yaml_doc(str(self.fname))
+        info = doc_cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+        assert info.hit_rate == 0.5
+
+    def test_get_yaml_doc_returns_copies(self):
+        """Test that changing a returned doc does not change the cached one."""
+        doc = get_yaml_doc(str(self.fname))
+        doc["key"] = "changed"
+        assert get_yaml_doc(str(self.fname)).get("key") == "value"
+
+    def test_get_yaml_doc_reread_on_change(self):
+        """Test that a changed file is read again."""
+        get_yaml_doc(str(self.fname))
+        with open(self.fname, "w", encoding="utf-8") as fh:
+            fh.write("key: other\n")
+        stat = os.stat(self.fname)
+        os.utime(self.fname, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert get_yaml_doc(str(self.fname)).get("key") == "other"
+
+    def test_invalidate_doc_cache(self):
+        """Test that an invalidated doc is read from disk again."""
+        get_yaml_doc(str(self.fname))
+        invalidate_doc_cache(str(self.fname))
+        misses = doc_cache_info().misses
+        get_yaml_doc(str(self.fname))
+        assert doc_cache_info().misses == misses + 1
@@ -0,0 +1,62 @@
+"""Unit tests for sorting statement words into their roles."""
+
+import pytest
+
+from adventure.grammar import Phrase, parse_phrase
+
+
+class TestGrammar:
+    """Test parse_phrase."""
+
+    def test_no_words(self):
+        """A bare verb has no objects."""
+        phrase = parse_phrase("look", [])
+        assert phrase == Phrase(verb="look")
+        assert phrase.obj is None
+        assert phrase.target is None
+
+    @pytest.mark.parametrize(
+        "words,direct,particles",
+        [
+            (["north"], ("north",), ()),
+            (["to", "the", "north"], ("north",), ("to",)),
+            (["at", "the", "rock"], ("rock",), ("at",)),
+            (["around"], (), ("around",)),
+            (["up", "rock"], ("up", "rock"), ()),
+        ],
+    )
+    def test_direct_object(self, words, direct, particles):
+        """Articles are dropped and leading prepositions kept as particles."""
+        phrase = parse_phrase("go", words)
+        assert phrase.direct == direct
+        assert phrase.particles == particles
+        assert phrase.preposition is None
+
+    def test_indirect_object(self):
+        """A preposition after the direct object starts the indirect object."""
+        phrase = parse_phrase("throw", "the rock at the north wall".split())
+        assert phrase.direct == ("rock",)
+        assert phrase.preposition == "at"
+        assert phrase.indirect == ("north", "wall")
+        assert (phrase.obj, phrase.target) == ("rock", "wall")
+
+    @pytest.mark.parametrize(
+        "words,direct_is_self,indirect_is_self",
+        [
+            (["at", "me"], True, False),
+            (["Myself"], True, False),
+            (["rock", "at", "I"], False, True),
+            (["rock", "at", "wall"], False, False),
+        ],
+    )
+    def test_self_reference(self, words, direct_is_self, indirect_is_self):
+        """Words naming the player are flagged whatever their case."""
+        phrase = parse_phrase("look", words)
+        assert phrase.direct_is_self == direct_is_self
+        assert phrase.indirect_is_self == indirect_is_self
+
+    def test_phrase_is_immutable(self):
+        """Commands cannot change the phrase they are given."""
+        phrase = parse_phrase("look", ["rock"])
+        with pytest.raises(AttributeError):
+            phrase.direct = ()
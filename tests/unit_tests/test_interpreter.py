@@ -49,6 +49,20 @@ class TestInterpreter:
         with pytest.raises(CommandNotFoundError):
             interpreter.prepare(statement)
 
+    def test_prepare_abbreviated_verb(self, interpreter: Interpreter):
+        """Test that an unambiguous abbreviation of a verb is accepted."""
+        stmt_obj = interpreter.prepare("inven")
+        assert stmt_obj.verb.name == "inventory"
+        stmt_obj = interpreter.prepare("snat sword")
+        assert stmt_obj.verb.name == "pick"
+        assert stmt_obj.args == ["sword"]
+
+    def test_unknown_command_suggestions(self, interpreter: Interpreter):
+        """Test that a misspelled verb suggests what the player meant."""
+        with pytest.raises(CommandNotFoundError) as excinfo:
+            interpreter.prepare("lokk around")
+        assert excinfo.value.suggestions == ["look"]
+
     def test_prepare_bad_statement(self, interpreter: Interpreter):
         """Test handling of a bad statement."""
         statement = ""
@@ -60,3 +74,73 @@ class TestInterpreter:
         assert isinstance(interpreter.commands, CommandList)
         for cmd in interpreter.commands:
             assert isinstance(cmd, Command)
+
+
+class TestParseCache:
+    """Test the cache of parsed statements."""
+
+    @pytest.fixture
+    def interpreter(self):
+        """Fixture to create an Interpreter instance."""
+        return Interpreter(commands_file=f"{TEST_DIR}/{TEST_COMMANDS_FILE}")
+
+    def test_repeated_statement_hits_cache(self, interpreter: Interpreter):
+        """Test that a repeated line is served from the cache."""
+        first = interpreter.prepare("go north")
+        second = interpreter.prepare("go north")
+        assert second.verb is first.verb
+        assert second.args == ["north"]
+        info = interpreter.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+        assert info.hit_rate == 0.5
+
+    def test_spacing_hits_cache(self, interpreter: Interpreter):
+        """Test that a line differing only in spacing is served from the cache."""
+        interpreter.prepare("go north")
+        statement = interpreter.prepare("  go   north ")
+        assert statement.args == ["north"]
+        assert statement.stmt == "  go   north "
+        assert interpreter.cache_info().hits == 1
+        interpreter.prepare("go North")
+        assert interpreter.cache_info().misses == 2
+
+    def test_cached_args_are_fresh(self, interpreter: Interpreter):
+        """Test that a command changing its args does not change the cache."""
+        first = interpreter.prepare("pick up sword")
+        first.args.remove("up")
+        first.tokens.pop()
+        second = interpreter.prepare("pick up sword")
+        assert second.args == ["up", "sword"]
+        assert second.tokens == ["pick", "up", "sword"]
+        assert second.args is not first.args
+
+    def test_errors_are_not_cached(self, interpreter: Interpreter):
+        """Test that unknown commands raise every time."""
+        for _ in range(2):
+            with pytest.raises(CommandNotFoundError):
+                interpreter.prepare("unknowncmd arg1")
+        assert interpreter.cache_info().currsize == 0
+
+    def test_new_commands_reparse(self, interpreter: Interpreter):
+        """Test that adding a command is seen by later statements."""
+        assert interpreter.prepare("sna").verb.name == "pick"
+        interpreter.commands.add_command(
+            Command(
+                name="snap",
+                desc="Snap your fingers",
+                help_text="Use 'snap'.",
+                aliases=[],
+                action_path="adventure.commands.look.look",
+            )
+        )
+        with pytest.raises(CommandNotFoundError):
+            interpreter.prepare("sna")
+
+    def test_cache_disabled(self):
+        """Test that a cache size of 0 parses every line."""
+        interpreter = Interpreter(
+            commands_file=f"{TEST_DIR}/{TEST_COMMANDS_FILE}", cache_size=0
+        )
+        interpreter.prepare("look")
+        assert interpreter.prepare("look").verb.name == "look"
+        assert interpreter.cache_info().hits == 0
@@ -0,0 +1,128 @@
+"""Unit tests for the event journal."""
+
+import time
+
+import pytest
+
+from adventure.commands.close import close
+from adventure.commands.drop import drop
+from adventure.commands.open import open_cmd
+from adventure.game import Game
+from adventure.grammar import parse_phrase
+from adventure.journal import Journal, Moved, read_journal
+
+
+class TestJournal:
+    """Test writing and reading journals."""
+
+    def test_batches(self, tmp_path):
+        """Events are written once a batch is full, and the rest on close."""
+        path = tmp_path / "journal.jsonl"
+        journal = Journal(str(path), batch_size=3, sync_interval=60)
+        for dest in range(2, 7):
+            journal.append(Moved(source=1, dest=dest, direction="west"), "one")
+        assert len(path.read_text().splitlines()) == 3
+        journal.close()
+        records = list(read_journal(str(path)))
+        assert [record["seq"] for record in records] == [1, 2, 3, 4, 5]
+        assert records[0]["event"] == "moved"
+        assert records[0]["dest"] == 2
+        assert records[0]["session"] == "one"
+
+    def test_sync_interval(self, tmp_path):
+        """With no sync interval every event is written straight away."""
+        path = tmp_path / "journal.jsonl"
+        with Journal(str(path), sync_interval=0) as journal:
+            journal.append(Moved(1, 2, "west"))
+            assert path.read_text().count("\n") == 1
+
+    def test_read_cut_off(self, tmp_path):
+        """A partly written last line is left out, and sessions can be picked."""
+        path = tmp_path / "journal.jsonl"
+        with Journal(str(path)) as journal:
+            journal.append(Moved(1, 2, "west"), "one")
+            journal.append(Moved(2, 1, "east"), "two")
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write('{"seq":3,"ev')
+        assert len(list(read_journal(str(path)))) == 2
+        assert [r["dest"] for r in read_journal(str(path), session="two")] == [1]
+
+    def test_reopen_after_crash(self, tmp_path):
+        """Events appended after a cut off line are still read back."""
+        path = tmp_path / "journal.jsonl"
+        with Journal(str(path)) as journal:
+            journal.append(Moved(1, 2, "west"), "one")
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write('{"seq":2,"ev')
+        with Journal(str(path)) as journal:
+            journal.append(Moved(2, 1, "east"), "two")
+        skipped = []
+        records = list(read_journal(str(path), skipped=skipped))
+        assert [record["dest"] for record in records] == [2, 1]
+        assert skipped == ['{"seq":2,"ev\n']
+
+    def test_seq_per_session(self, tmp_path):
+        """Each session numbers its own events."""
+        path = tmp_path / "journal.jsonl"
+        with Journal(str(path)) as journal:
+            journal.append(Moved(1, 2, "west"), "one")
+            journal.append(Moved(1, 2, "west"), "two")
+            journal.append(Moved(2, 1, "east"), "one")
+        records = list(read_journal(str(path)))
+        assert [(r["session"], r["seq"]) for r in records] == [
+            ("one", 1),
+            ("two", 1),
+            ("one", 2),
+        ]
+
+    def test_flush_if_due(self, tmp_path):
+        """Waiting events are written once the interval passes, with no new ones."""
+        path = tmp_path / "journal.jsonl"
+        with Journal(str(path), sync_interval=0.05) as journal:
+            journal.append(Moved(1, 2, "west"))
+            journal.flush_if_due()
+            assert path.read_text() == ""
+            time.sleep(0.06)
+            journal.flush_if_due()
+            assert path.read_text().count("\n") == 1
+
+    def test_unknown_event(self, tmp_path):
+        """Only the known kinds of event can be journaled."""
+        with Journal(str(tmp_path / "journal.jsonl")) as journal:
+            with pytest.raises(KeyError):
+                journal.append(("not", "an", "event"))
+
+    def test_game_events(self, tmp_path):
+        """Commands that change the game emit events."""
+        path = tmp_path / "journal.jsonl"
+        with Journal(str(path)) as journal:
+            game = Game(
+                "tests/data",
+                "test_map.yml",
+                "test_commands.yml",
+                journal=journal,
+                session="s1",
+            )
+            game.step("pick rock")
+            close(game, parse_phrase("close", ["west"]))
+            open_cmd(game, parse_phrase("open", ["opening"]))
+            game.step("go west")
+            drop(game, parse_phrase("drop", ["rock"]))
+            game.step("look")
+        records = list(read_journal(str(path), session="s1"))
+        assert [record["event"] for record in records] == [
+            "item_transferred",
+            "door_closed",
+            "door_opened",
+            "moved",
+            "item_transferred",
+        ]
+        picked, closed, _, moved, dropped = records
+        assert (picked["item"], picked["source"], picked["dest"]) == (
+            "rock",
+            "room/1",
+            "inventory/hands",
+        )
+        assert (closed["room"], closed["direction"]) == (1, "west")
+        assert (moved["source"], moved["dest"], moved["direction"]) == (1, 2, "west")
+        assert dropped["dest"] == "room/2"
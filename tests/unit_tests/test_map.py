@@ -1,7 +1,13 @@
 """Unit tests for the Map class."""
 
+import os
+from collections import Counter
+
 import pytest
 
+from adventure.cache import LRUCache
+from adventure.dao import doc_yaml, parser
+from adventure.map.generator import generate_world
 from adventure.map.map import Map
 from adventure.exceptions import BadYamlError
 
@@ -59,3 +65,134 @@ class TestMap:
         """Test loading a map with a room missing an ID."""
         with pytest.raises(ValueError):
             Map(file_name="test_map_unset_room_id.yml", base_data_dir=TEST_DATA_DIR)
+
+
+class TestLazyMap:
+    """Test the lazy loading mode of the Map class."""
+
+    def test_lazy_map_builds_no_rooms(self, monkeypatch):
+        """Test that a lazy map does not load any room files up front."""
+
+        def no_rooms(*args, **kwargs):
+            raise AssertionError("No rooms should be loaded yet.")
+
+        monkeypatch.setattr("adventure.map.map.load_room_from_yaml", no_rooms)
+        game_map = Map(base_data_dir=TEST_DATA_DIR, file_name="test_map.yml", lazy=True)
+        assert game_map.name == "Test Map"
+        assert game_map.start_room == 1
+        assert len(game_map.rooms) == 0
+
+    def test_lazy_map_matches_eager(self):
+        """Test that rooms built on demand match the eagerly loaded ones."""
+        eager = Map(base_data_dir=TEST_DATA_DIR, file_name="test_map.yml")
+        lazy = Map(base_data_dir=TEST_DATA_DIR, file_name="test_map.yml", lazy=True)
+        for room_id in (2, 1, 3):
+            assert repr(lazy.get_room(room_id)) == repr(eager.get_room(room_id))
+        assert lazy.get_room(2) is lazy.get_room(2)
+        assert len(lazy.rooms) == 3
+        with pytest.raises(IndexError):
+            lazy.get_room(4)
+
+    def test_lazy_map_connects_exits(self):
+        """Test that exits are connected when a room is built."""
+        game_map = Map(base_data_dir=TEST_DATA_DIR, file_name="test_map.yml", lazy=True)
+        room = game_map.get_room(1)
+        assert room.get_doors()[0].leads_to == 2
+        assert len(game_map.rooms) == 1
+
+    def test_lazy_map_bad_room_ids(self):
+        """Test that duplicate and unset room IDs are still rejected."""
+        with pytest.raises(ValueError):
+            Map(
+                file_name="test_map_duplicate.yml",
+                base_data_dir=TEST_DATA_DIR,
+                lazy=True,
+            )
+        with pytest.raises(ValueError):
+            Map(
+                file_name="test_map_unset_room_id.yml",
+                base_data_dir=TEST_DATA_DIR,
+                lazy=True,
+            )
+
+    def test_lazy_map_snapshot(self, tmp_path):
+        """Test that a lazy map writes and then uses a complete snapshot."""
+        snapshot_file = str(tmp_path / "test_map.snapshot")
+        first = Map(
+            base_data_dir=TEST_DATA_DIR,
+            file_name="test_map.yml",
+            snapshot_file=snapshot_file,
+            lazy=True,
+        )
+        assert len(first.rooms) == 0
+        second = Map(
+            base_data_dir=TEST_DATA_DIR,
+            file_name="test_map.yml",
+            snapshot_file=snapshot_file,
+            lazy=True,
+        )
+        assert second.get_room(3).name == "Room Three"
+
+    def test_data_files_found_once(self, monkeypatch):
+        """Each wall, door and thing file is looked for once per map."""
+        looked_for = Counter()
+        isfile = os.path.isfile
+
+        def counting_isfile(path):
+            looked_for[path] += 1
+            return isfile(path)
+
+        monkeypatch.setattr(parser.os.path, "isfile", counting_isfile)
+        Map(base_data_dir=TEST_DATA_DIR, file_name="test_map.yml")
+        parts = {
+            path: count
+            for path, count in looked_for.items()
+            if "/rooms/" not in path and path.count("/") > 1
+        }
+        assert parts
+        assert set(parts.values()) == {1}
+
+    def test_room_files_stay_cached(self, monkeypatch, tmp_path):
+        """A map with more rooms than the document cache holds is cached whole."""
+        monkeypatch.setattr(doc_yaml, "DEFAULT_DOC_CACHE_SIZE", 16)
+        monkeypatch.setattr(doc_yaml, "_doc_cache", LRUCache(maxsize=16))
+        map_file = generate_world(str(tmp_path), 50)
+        Map(base_data_dir=str(tmp_path), file_name=map_file)
+        misses = doc_yaml.doc_cache_info().misses
+        Map(base_data_dir=str(tmp_path), file_name=map_file)
+        assert doc_yaml.doc_cache_info().misses == misses
+
+
+class TestParallelMap:
+    """Test loading map rooms on a worker pool."""
+
+    @pytest.mark.parametrize("executor", ["process", "thread"])
+    def test_parallel_map_matches_serial(self, executor):
+        """Test that rooms loaded in parallel match the serially loaded ones."""
+        serial = Map(base_data_dir=TEST_DATA_DIR, file_name="test_map.yml")
+        parallel = Map(
+            base_data_dir=TEST_DATA_DIR,
+            file_name="test_map.yml",
+            workers=2,
+            executor=executor,
+        )
+        assert list(parallel.rooms) == [1, 2, 3]
+        for room_id in (1, 2, 3):
+            assert repr(parallel.get_room(room_id)) == repr(serial.get_room(room_id))
+
+    @pytest.mark.parametrize("executor", ["process", "thread"])
+    def test_parallel_map_bad_room_ids(self, executor):
+        """Test that duplicate and unset room IDs are still rejected."""
+        for file_name in ("test_map_duplicate.yml", "test_map_unset_room_id.yml"):
+            with pytest.raises(ValueError):
+                Map(
+                    file_name=file_name,
+                    base_data_dir=TEST_DATA_DIR,
+                    workers=2,
+                    executor=executor,
+                )
+
+    def test_unknown_executor(self):
+        """Test that only process and thread pools are accepted."""
+        with pytest.raises(ValueError):
+            Map(base_data_dir=TEST_DATA_DIR, file_name="test_map.yml", executor="gpu")
@@ -0,0 +1,92 @@
+"""Unit tests for abbreviation and misspelling matching of verbs."""
+
+import pytest
+
+from adventure.commands.matching import SpellingIndex, VerbTrie, edit_distance
+
+
+class TestVerbTrie:
+    """Test resolving verb prefixes."""
+
+    @pytest.fixture
+    def trie(self):
+        """A trie of a few verbs."""
+        trie = VerbTrie()
+        for word, command in [
+            ("examine", "examine"),
+            ("search", "search"),
+            ("swap", "swap"),
+            ("scan", "look"),
+            ("look", "look"),
+        ]:
+            trie.insert(word, command)
+        return trie
+
+    @pytest.mark.parametrize(
+        "prefix,expected",
+        [
+            ("exa", "examine"),
+            ("examine", "examine"),
+            ("se", "search"),
+            ("sw", "swap"),
+            ("lo", "look"),
+            ("s", None),  # too short
+            ("examined", None),
+            ("xyz", None),
+        ],
+    )
+    def test_unique_prefix(self, trie, prefix, expected):
+        """Only prefixes of a single command's verbs match."""
+        assert trie.unique_prefix(prefix) == expected
+
+    def test_ambiguous_prefix(self):
+        """A prefix shared by two commands matches neither."""
+        trie = VerbTrie()
+        trie.insert("throw", "throw")
+        trie.insert("thrust", "thrust")
+        assert trie.unique_prefix("thr") is None
+        assert trie.unique_prefix("thro") == "throw"
+
+
+class TestSpellingIndex:
+    """Test finding words by edit distance."""
+
+    @pytest.mark.parametrize(
+        "first,second,distance",
+        [
+            ("look", "look", 0),
+            ("look", "lock", 1),
+            ("examine", "exmaine", 2),
+            ("", "go", 2),
+        ],
+    )
+    def test_edit_distance(self, first, second, distance):
+        """Levenshtein distance counts insertions, deletions and substitutions."""
+        assert edit_distance(first, second) == distance
+        assert edit_distance(second, first) == distance
+
+    def test_edit_distance_limit(self):
+        """A limited distance stops counting past the limit."""
+        assert edit_distance("examine", "exmaine", limit=2) == 2
+        assert edit_distance("examine", "look", limit=2) == 3
+        assert edit_distance("examine", "exam", limit=1) == 2
+
+    def test_search(self):
+        """Words within the distance are found, closest first."""
+        index = SpellingIndex()
+        for word in ["look", "lock", "block", "examine", "go", "look"]:
+            index.insert(word)
+        assert index.search("lok", 1) == [(1, "lock"), (1, "look")]
+        assert index.search("blok", 2) == [(1, "block"), (2, "lock"), (2, "look")]
+        assert index.search("zzzzzz", 2) == []
+
+    def test_search_limited_to_index_distance(self):
+        """Searches cannot reach further than the index was built for."""
+        index = SpellingIndex(max_distance=1)
+        index.insert("examine")
+        assert index.search("exmaine", 2) == []
+        assert index.search("examin", 2) == [(1, "examine")]
+
+    def test_search_empty(self):
+        """An empty index finds nothing."""
+        assert SpellingIndex().search("look", 2) == []
@@ -0,0 +1,85 @@
+"""Unit tests for per-player overlays over a shared map."""
+
+import pytest
+
+from adventure.game import Game
+from adventure.map.map import Map
+from adventure.map.overlay import WorldOverlay
+
+
+@pytest.fixture
+def world() -> Map:
+    """The test map, to be shared."""
+    return Map(base_data_dir="tests/data", file_name="test_map.yml")
+
+
+def new_game(world: Map) -> Game:
+    """A game of the test map playing in `world`."""
+    return Game("tests/data", "test_map.yml", "test_commands.yml", world=world)
+
+
+class TestOverlay:
+    """Test reading and changing a shared map through overlays."""
+
+    def test_reads_fall_through(self, world):
+        """A room view reads the same as the shared room."""
+        overlay = WorldOverlay(world)
+        room = overlay.get_room(1)
+        shared = world.get_room(1)
+        assert room.name == shared.name
+        assert room.room_id == 1
+        assert room.show_doors() == shared.show_doors()
+        assert [item.name for item in room.contents] == ["rock"]
+        assert room.in_room("rock")[0]["what"] is shared.contents[0]
+        assert overlay.start_room == world.start_room
+        assert not overlay.changed_rooms()
+
+    def test_contents_copy_on_write(self, world):
+        """Moving things in a room changes only that player's copy."""
+        first, second = WorldOverlay(world), WorldOverlay(world)
+        rock = first.get_room(1).contents[0]
+        first.get_room(1).contents.remove(rock)
+        first.get_room(2).contents.append(rock)
+        assert len(first.get_room(1).contents) == 0
+        assert len(first.get_room(2).contents) == 2
+        assert first.changed_rooms() == {1, 2}
+        assert [item.name for item in second.get_room(1).contents] == ["rock"]
+        assert world.get_room(1).contents == [rock]
+        assert not second.changed_rooms()
+
+    def test_layout_is_shared_only(self, world):
+        """Methods that would change the shared map are not offered by the views."""
+        room = WorldOverlay(world).get_room(1)
+        door = room.get_doors()[0]
+        leads_to = world.get_room(1).get_doors()[0].leads_to
+        with pytest.raises(AttributeError):
+            door.connect(99)
+        with pytest.raises(AttributeError):
+            room.get_walls()[0].add_door(door)
+        with pytest.raises(AttributeError):
+            room.connect_exits({"west": 99})
+        assert door.leads_to == leads_to
+        assert world.get_room(1).get_doors()[0].leads_to == leads_to
+
+    def test_door_state(self, world):
+        """Doors opened or closed by one player stay open for the others."""
+        first, second = WorldOverlay(world), WorldOverlay(world)
+        door = first.get_room(1).get_doors()[0]
+        door.close()
+        assert not first.get_room(1).get_doors()[0].is_open
+        assert second.get_room(1).get_doors()[0].is_open
+        assert world.get_room(1).get_doors()[0].is_open
+        assert first.changed_rooms() == {1}
+        door.open()
+        assert not first.changed_rooms()
+
+    def test_games_share_a_world(self, world):
+        """Games in one world play apart from each other."""
+        first, second = new_game(world), new_game(world)
+        first.current_loc.get_doors()[0].close()
+        assert first.step("go west").output.startswith("The opening is closed.")
+        assert second.step("go west").room_id == 2
+        assert first.step("pick rock").output == "You pick up rock."
+        assert len(first.current_loc.contents) == 0
+        assert len(world.get_room(1).contents) == 1
+        assert first.map.world is second.map.world is world
@@ -0,0 +1,59 @@
+"""Unit tests for the data file parser backends."""
+
+import pytest
+
+from adventure.dao import parser
+from adventure.dao.doc_yaml import get_yaml_doc
+from adventure.exceptions import BadYamlError
+
+
+class TestParser:
+    """Test parser backend selection and the JSON format."""
+
+    def test_backend_by_extension(self):
+        """YAML files use the fastest YAML loader and JSON files the JSON one."""
+        expected = "cyaml" if parser.FastSafeLoader is not None else "yaml"
+        assert parser.backend_for("rooms/start_room.yml").name == expected
+        assert parser.backend_for("rooms/start_room.YAML").name == expected
+        assert parser.backend_for("rooms/start_room.json").name == "json"
+
+    @pytest.mark.parametrize("backend", sorted(parser.BACKENDS))
+    def test_backends_agree(self, backend, tmp_path):
+        """Every backend reads the same document."""
+        fname = tmp_path / "doc"
+        fname.write_text('{"name": "rock", "bulk": 1}', encoding="utf-8")
+        assert parser.parse_file(str(fname), backend=backend) == {
+            "name": "rock",
+            "bulk": 1,
+        }
+
+    def test_json_data_file(self, tmp_path):
+        """JSON files can be read through get_yaml_doc."""
+        fname = tmp_path / "thing.json"
+        fname.write_text('{"name": "rock", "classes": ["handheld"]}', encoding="utf-8")
+        assert get_yaml_doc(str(fname)) == {"name": "rock", "classes": ["handheld"]}
+
+    def test_bad_json_data_file(self, tmp_path):
+        """A broken JSON file raises BadYamlError."""
+        fname = tmp_path / "thing.json"
+        fname.write_text('{"name": ', encoding="utf-8")
+        with pytest.raises(BadYamlError):
+            get_yaml_doc(str(fname))
+
+    def test_resolve_data_file(self, tmp_path):
+        """Data files named without an extension prefer YAML, then JSON."""
+        stem = str(tmp_path / "room")
+        assert parser.resolve_data_file(stem) == f"{stem}.yml"
+        (tmp_path / "room.json").write_text("{}", encoding="utf-8")
+        assert parser.resolve_data_file(stem) == f"{stem}.json"
+        (tmp_path / "room.yml").write_text("---", encoding="utf-8")
+        assert parser.resolve_data_file(stem) == f"{stem}.yml"
+
+    def test_register_backend(self, monkeypatch):
+        """New backends can be registered for an extension."""
+        monkeypatch.setattr(parser, "BACKENDS", dict(parser.BACKENDS))
+        monkeypatch.setattr(
+            parser, "EXTENSION_BACKENDS", dict(parser.EXTENSION_BACKENDS)
+        )
+        parser.register_backend("lines", lambda stream: stream.read().split(), ".txt")
+        assert parser.backend_for("notes.TXT").name == "lines"
@@ -0,0 +1,136 @@
+"""Unit tests for the pre-fork server."""
+
+import gc
+import os
+import re
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+from adventure.prefork import MemoryUsage, PreforkServer, format_memory, memory_usage
+from adventure.server import GameServer
+from adventure.startup import PROJECT_DIR
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="pre-fork serving needs Linux"
+)
+
+
+def read_report(server: subprocess.Popen) -> list[int]:
+    """Ask the server for a memory report and return the worker pids in it."""
+    server.send_signal(signal.SIGUSR1)
+    assert server.stderr.readline().split()[0] == "pid"
+    pids = []
+    for line in iter(server.stderr.readline, ""):
+        if not line.strip():
+            break
+        pids.append(int(line.split()[0]))
+    # The parent comes first.
+    return pids[1:]
+
+
+class TestPrefork:
+    """Test memory reports and a running pre-fork server."""
+
+    def test_memory_usage(self):
+        """A process's memory is read from /proc."""
+        usage = memory_usage(os.getpid())
+        assert usage.rss > 0
+        assert usage.shared + usage.private == pytest.approx(usage.rss, abs=8)
+        assert memory_usage(-1) is None
+        table = format_memory([usage, MemoryUsage(2, 10, 5, 6, 4)])
+        assert table.splitlines()[0].split()[0] == "pid"
+        assert table.splitlines()[2].split() == ["2", "10", "5", "6", "4"]
+
+    def test_failed_start(self):
+        """Garbage collection is turned back on if the world cannot be loaded."""
+
+        class BrokenServer(GameServer):
+            """A server whose world fails to load."""
+
+            def load(self):
+                raise FileNotFoundError("no map")
+
+        handlers = {
+            signum: signal.getsignal(signum)
+            for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGUSR1)
+        }
+        try:
+            with pytest.raises(FileNotFoundError):
+                PreforkServer(BrokenServer(), workers=1).start()
+            assert gc.isenabled()
+        finally:
+            for signum, handler in handlers.items():
+                signal.signal(signum, handler)
+
+    def test_server(self):
+        """Workers serve games, are restarted if they die, and stop cleanly."""
+        server = subprocess.Popen(
+            [sys.executable, "main.py", "--serve", "0", "--prefork", "2"],
+            cwd=PROJECT_DIR,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            port = int(re.search(r":(\d+) with", server.stdout.readline()).group(1))
+            with socket.create_connection(("127.0.0.1", port), timeout=10) as client:
+                stream = client.makefile("rwb")
+                stream.write(b"look\n")
+                stream.flush()
+                while not stream.readline().startswith(b"> This room"):
+                    pass
+            workers = read_report(server)
+            assert len(workers) == 2
+            # Workers ignore memory report requests instead of dying of them.
+            os.kill(workers[1], signal.SIGUSR1)
+            assert workers[1] in read_report(server)
+            os.kill(workers[0], signal.SIGKILL)
+            for _ in range(50):
+                time.sleep(0.1)
+                replaced = read_report(server)
+                if workers[0] not in replaced and len(replaced) == 2:
+                    break
+            else:
+                pytest.fail("A killed worker was not restarted.")
+            server.send_signal(signal.SIGTERM)
+            assert server.wait(timeout=10) == 0
+            assert server.stdout.read().strip() == "Server stopped"
+        finally:
+            if server.poll() is None:
+                server.kill()
+                server.wait()
+
+    def test_worker_failure_logged(self, tmp_path):
+        """A worker that cannot start says why before it is restarted."""
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "main.py",
+                "--serve",
+                "0",
+                "--prefork",
+                "1",
+                "--journal",
+                str(tmp_path / "missing" / "journal.jsonl"),
+            ],
+            cwd=PROJECT_DIR,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            assert server.stdout.readline().startswith("Serving")
+            assert server.stderr.readline().startswith("Worker ")
+            lines = iter(server.stderr.readline, "")
+            assert any(line.startswith("FileNotFoundError") for line in lines)
+            server.send_signal(signal.SIGTERM)
+            assert server.wait(timeout=10) == 0
+        finally:
+            if server.poll() is None:
+                server.kill()
+                server.wait()
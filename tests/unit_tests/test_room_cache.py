@@ -0,0 +1,123 @@
+"""Unit tests for the bounded room cache."""
+
+import pytest
+
+from adventure.map.map import Map
+from adventure.map.room_cache import DistanceEviction, LRUEviction, RoomCache
+from adventure.items.item import Item
+
+TEST_DATA_DIR = "tests/data"
+
+
+class TestRoomCache:
+    """Test the RoomCache class and its eviction policies."""
+
+    def test_cache_size(self):
+        """A room cache must hold at least one room."""
+        with pytest.raises(ValueError):
+            RoomCache(maxsize=0)
+
+    def test_lru_eviction(self):
+        """The least recently used room is evicted and handed to on_evict."""
+        evicted = []
+        cache = RoomCache(
+            maxsize=2,
+            policy=LRUEviction(),
+            on_evict=lambda room_id, room: evicted.append(room_id),
+        )
+        cache[1] = "one"
+        cache[2] = "two"
+        assert cache[1] == "one"
+        cache[3] = "three"
+        assert evicted == [2]
+        assert sorted(cache) == [1, 3]
+        assert cache.evictions == 1
+
+    def test_distance_eviction(self):
+        """The room farthest from the player is evicted first."""
+        game_map = Map(base_data_dir=TEST_DATA_DIR, file_name="test_map.yml", lazy=True)
+        policy = DistanceEviction(origin=lambda: 3)
+        cache = RoomCache(maxsize=2, game_map=game_map, policy=policy)
+        cache[1] = "one"
+        cache[2] = "two"
+        cache[1]
+        cache[3] = "three"
+        assert sorted(cache) == [2, 3]
+
+    def test_distance_search_stops_early(self):
+        """The search for distances stops once every cached room is found."""
+
+        class Corridor:
+            """Rooms 1 to 100 in a line, counting the rooms searched."""
+
+            searched = 0
+
+            def neighbours(self, room_id):
+                self.searched += 1
+                return [
+                    other for other in (room_id - 1, room_id + 1) if 0 < other <= 100
+                ]
+
+        corridor = Corridor()
+        cache = RoomCache(
+            maxsize=2, game_map=corridor, policy=DistanceEviction(origin=lambda: 1)
+        )
+        cache[2] = "two"
+        cache[3] = "three"
+        cache[1] = "one"
+        assert sorted(cache) == [1, 2]
+        assert corridor.searched <= 3
+
+
+class TestMapRoomCache:
+    """Test a Map that keeps a bounded number of rooms."""
+
+    @pytest.fixture
+    def game_map(self):
+        """A three room map that keeps only one room built."""
+        return Map(base_data_dir=TEST_DATA_DIR, file_name="test_map.yml", cache_size=1)
+
+    def test_map_cache_is_bounded(self, game_map):
+        """Only cache_size rooms stay built."""
+        assert game_map.lazy
+        for room_id in (1, 2, 3, 1):
+            assert game_map.get_room(room_id).room_id == room_id
+            assert len(game_map.rooms) == 1
+
+    def test_changed_room_restored(self, game_map):
+        """Doors and contents changed in an evicted room come back."""
+        room = game_map.get_room(1)
+        room.get_doors()[0].close()
+        rock = room.contents.pop()
+        game_map.get_room(2).contents.append(rock)
+        game_map.get_room(3).contents.append(
+            Item(name="key", short_desc="", long_desc="")
+        )
+        room = game_map.get_room(1)
+        assert not room.get_doors()[0].is_open
+        assert room.contents == []
+        assert [item.name for item in game_map.get_room(2).contents] == ["rock", "rock"]
+        assert [item.name for item in game_map.get_room(3).contents] == ["rock", "key"]
+
+    def test_unchanged_room_not_saved(self, game_map):
+        """Rooms left as they were built are not kept once evicted."""
+        room = game_map.get_room(1)
+        room.get_doors()[0].close()
+        game_map.get_room(2)
+        room = game_map.get_room(1)
+        room.get_doors()[0].open()
+        game_map.get_room(2)
+        assert 1 not in game_map._saved
+
+    def test_snapshot_keeps_no_states(self, tmp_path):
+        """Building a snapshot does not keep the state of every room."""
+        game_map = Map(
+            base_data_dir=TEST_DATA_DIR,
+            file_name="test_map.yml",
+            snapshot_file=str(tmp_path / "test_map.snapshot"),
+            cache_size=1,
+        )
+        assert not game_map._pristine
+        game_map.get_room(1)
+        game_map.get_room(2)
+        assert list(game_map._pristine) == [2]
@@ -0,0 +1,151 @@
+"""Unit tests for saving and restoring games."""
+
+import shutil
+
+import pytest
+
+from adventure.commands.save import restore_game as restore_cmd, save_game
+from adventure.game import Game
+from adventure.items.item import Item
+from adventure.map.map import Map
+from adventure.save import MAGIC, SaveFile, capture, read_save, restore_game
+
+
+@pytest.fixture
+def world() -> Map:
+    """The test map."""
+    return Map(base_data_dir="tests/data", file_name="test_map.yml")
+
+
+def new_game(world: Map = None) -> Game:
+    """A game of the test map."""
+    return Game("tests/data", "test_map.yml", "test_commands.yml", world=world)
+
+
+def play(game: Game):
+    """Pick up the rock, close the door behind you and go west."""
+    game.step("pick rock")
+    game.step("go west")
+    game.map.get_room(1).get_doors()[0].close()
+
+
+class TestSave:
+    """Test save files."""
+
+    def test_round_trip(self, tmp_path, world):
+        """A restored game is in the same state as the one saved."""
+        game = new_game(world)
+        play(game)
+        path = str(tmp_path / "game.sav")
+        SaveFile(path).save(game)
+        restored = new_game(world)
+        restore_game(restored, path)
+        assert capture(restored) == capture(game)
+        assert restored.current_loc.room_id == 2
+        assert restored.player.inventory.holding("rock")
+        assert not restored.map.get_room(1).get_doors()[0].is_open
+        assert len(restored.map.get_room(1).contents) == 0
+
+    def test_restore_into_another_world(self, tmp_path, world):
+        """Things are found by where they were loaded, in any copy of the world."""
+        game = new_game(world)
+        play(game)
+        path = str(tmp_path / "game.sav")
+        SaveFile(path).save(game)
+        restored = new_game()
+        restore_game(restored, path)
+        assert capture(restored) == capture(game)
+
+    def test_incremental(self, tmp_path, world):
+        """Later saves only append what changed."""
+        game = new_game(world)
+        path = tmp_path / "game.sav"
+        saves = SaveFile(str(path))
+        full = saves.save(game)
+        play(game)
+        saves.save(game)
+        game.map.get_room(1).get_doors()[0].open()
+        small = saves.save(game)
+        assert small < full
+        assert path.stat().st_size == len(path.read_bytes())
+        state = read_save(str(path))
+        assert state == capture(game)
+        assert not state.doors
+        assert saves.save(game, full=True) == path.stat().st_size
+
+    def test_cut_off_save(self, tmp_path, world):
+        """A save cut short restores as the save before it."""
+        game = new_game(world)
+        path = tmp_path / "game.sav"
+        saves = SaveFile(str(path))
+        saves.save(game)
+        before = capture(game)
+        play(game)
+        saves.save(game)
+        path.write_bytes(path.read_bytes()[:-2])
+        assert read_save(str(path)) == before
+
+    def test_not_a_save(self, tmp_path):
+        """Other files are refused."""
+        path = tmp_path / "game.sav"
+        path.write_bytes(b"not a save")
+        with pytest.raises(ValueError):
+            read_save(str(path))
+        path.write_bytes(MAGIC)
+        with pytest.raises(ValueError):
+            read_save(str(path))
+
+    def test_unsaveable_thing(self, tmp_path, world):
+        """Things that did not come from the map cannot be saved."""
+        game = new_game(world)
+        game.current_loc.contents.append(
+            Item(name="ghost", short_desc="a ghost", long_desc="Boo.")
+        )
+        with pytest.raises(ValueError):
+            SaveFile(str(tmp_path / "game.sav")).save(game)
+
+    def test_other_world_refused(self, tmp_path):
+        """A save is refused once the world's room files have changed."""
+        shutil.copytree("tests/data", tmp_path / "data")
+        game = Game(str(tmp_path / "data"), "test_map.yml", "test_commands.yml")
+        play(game)
+        path = str(tmp_path / "game.sav")
+        SaveFile(path).save(game)
+        room = tmp_path / "data" / "rooms" / "room_one.yml"
+        room.write_text(room.read_text() + "\n")
+        changed = Game(str(tmp_path / "data"), "test_map.yml", "test_commands.yml")
+        with pytest.raises(ValueError):
+            restore_game(changed, path)
+
+
+class TestSaveCommands:
+    """Test the save and restore commands."""
+
+    def test_save_and_restore(self, tmp_path, world):
+        """The commands save to and restore from the game's save file."""
+        path = str(tmp_path / "game.sav")
+        game = Game(
+            "tests/data",
+            "test_map.yml",
+            "test_commands.yml",
+            world=world,
+            save_file=path,
+        )
+        assert restore_cmd(game).startswith("There is no saved game")
+        play(game)
+        assert save_game(game) == "Game saved."
+        saved = capture(game)
+        game.map.get_room(1).get_doors()[0].open()
+        game.step("go east")
+        message = restore_cmd(game)
+        assert message == f"Game restored. You are in {game.current_loc.name}."
+        assert capture(game) == saved
+        game.step("go east")
+        assert save_game(game) == "Game saved."
+        assert read_save(path) == capture(game)
+
+    def test_no_save_file(self, world):
+        """Without a save file the game cannot be saved."""
+        game = new_game(world)
+        assert save_game(game) == "This game cannot be saved."
+        assert restore_cmd(game).startswith("There is no saved game")
@@ -0,0 +1,131 @@
+"""Unit tests for the asyncio game server."""
+
+import asyncio
+
+from adventure.journal import read_journal
+from adventure.server import PROMPT, GameServer
+
+PROMPT_BYTES = PROMPT.encode("utf-8")
+TEST_DATA = ("tests/data", "test_map.yml", "test_commands.yml")
+
+
+def run_server(test, data=TEST_DATA, **kwargs):
+    """Run `test(server, port)` against a server, by default for the test map.
+
+    With empty `data` the server plays the shipped game.
+    """
+
+    async def main():
+        server = GameServer(*data, **kwargs)
+        port = await server.start()
+        try:
+            await test(server, port)
+        finally:
+            await server.close()
+
+    asyncio.run(asyncio.wait_for(main(), timeout=30))
+
+
+async def connect(port: int):
+    """Connect a client and read the greeting."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    greeting = await reader.readuntil(PROMPT_BYTES)
+    return reader, writer, greeting.decode("utf-8")
+
+
+async def say(reader, writer, stmt: str) -> str:
+    """Send a statement and return the reply, without the prompt."""
+    writer.write(f"{stmt}\n".encode("utf-8"))
+    reply = await reader.readuntil(PROMPT_BYTES)
+    return reply[: -len(PROMPT_BYTES)].decode("utf-8")
+
+
+class TestServer:
+    """Test sessions on the game server."""
+
+    def test_session(self):
+        """A client is greeted, and gets a reply to each statement."""
+
+        async def test(server, port):
+            reader, writer, greeting = await connect(port)
+            assert greeting.startswith(server.messages["greeting"])
+            assert (await say(reader, writer, "go west")).startswith(
+                "You go through the opening to Room Two."
+            )
+            reply = await say(reader, writer, "lok")
+            assert server.messages["unknown_action"] in reply
+            assert "'look'" in reply
+            writer.write_eof()
+            assert await reader.read() == b""
+            writer.close()
+
+        run_server(test)
+
+    def test_quit(self):
+        """Quitting ends the session."""
+
+        async def test(server, port):
+            reader, writer, _ = await connect(port)
+            writer.write(b"quit\n")
+            rest = await reader.read()
+            assert server.messages["farewell"] in rest.decode("utf-8")
+            writer.close()
+
+        run_server(test, data=())
+
+    def test_sessions_are_separate(self):
+        """Each connection plays its own game."""
+
+        async def test(server, port):
+            clients = [await connect(port) for _ in range(20)]
+            walkers = clients[::2]
+            await asyncio.gather(*(say(r, w, "go west") for r, w, _ in walkers))
+            replies = await asyncio.gather(*(say(r, w, "look") for r, w, _ in clients))
+            for number, reply in enumerate(replies):
+                first_room = "first room" in reply
+                assert first_room == bool(number % 2)
+            assert len(server.sessions) == 20
+            for _, writer, _ in clients:
+                writer.close()
+
+        run_server(test)
+
+    def test_queued_statements(self):
+        """Statements sent all at once are played in order."""
+
+        async def test(server, port):
+            reader, writer, _ = await connect(port)
+            writer.write(b"go west\n" * 10 + b"look\n")
+            for _ in range(11):
+                reply = await reader.readuntil(PROMPT_BYTES)
+            assert "first room" not in reply.decode("utf-8")
+            writer.close()
+
+        run_server(test, queue_size=1)
+
+    def test_close_ends_sessions(self):
+        """Closing the server disconnects its clients."""
+
+        async def test(server, port):
+            reader, writer, _ = await connect(port)
+            await server.close()
+            assert await reader.read() == b""
+            assert not server.sessions
+            writer.close()
+
+        run_server(test)
+
+    def test_journal(self, tmp_path):
+        """Sessions write their events to the server's journal."""
+        path = str(tmp_path / "journal.jsonl")
+
+        async def test(server, port):
+            for _ in range(2):
+                reader, writer, _ = await connect(port)
+                await say(reader, writer, "go west")
+                writer.close()
+
+        run_server(test, journal_file=path)
+        records = list(read_journal(path))
+        assert [record["event"] for record in records] == ["moved", "moved"]
+        assert records[0]["session"] != records[1]["session"]
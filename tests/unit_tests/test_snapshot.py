@@ -0,0 +1,103 @@
+"""Unit tests for compiled map snapshots."""
+
+import os
+
+import pytest
+
+from adventure.map import map as map_module
+from adventure.map.map import Map
+from adventure.map.snapshot import read_snapshot, write_snapshot
+
+TEST_DATA_DIR = "tests/data"
+
+
+class TestSnapshot:
+    """Test building and loading map snapshots."""
+
+    @pytest.fixture
+    def snapshot_file(self, tmp_path):
+        """Path to a snapshot file that does not exist yet."""
+        return str(tmp_path / "test_map.snapshot")
+
+    def test_snapshot_written_on_first_load(self, snapshot_file):
+        """Loading a map with no snapshot yet writes one."""
+        Map(
+            base_data_dir=TEST_DATA_DIR,
+            file_name="test_map.yml",
+            snapshot_file=snapshot_file,
+        )
+        assert os.path.isfile(snapshot_file)
+        docs = read_snapshot(snapshot_file, f"{TEST_DATA_DIR}/test_map.yml")
+        assert f"{TEST_DATA_DIR}/test_map.yml" in docs
+        assert f"{TEST_DATA_DIR}/rooms/room_one.yml" in docs
+        assert "adventure/data/walls/concrete_wall.yml" in docs
+        assert "adventure/data/things/start_rock.yml" in docs
+
+    def test_map_loads_from_fresh_snapshot(self, snapshot_file, monkeypatch):
+        """A fresh snapshot is used without reading any YAML files."""
+        Map(
+            base_data_dir=TEST_DATA_DIR,
+            file_name="test_map.yml",
+            snapshot_file=snapshot_file,
+        )
+
+        def no_yaml(fname):
+            raise AssertionError(f"{fname} should have come from the snapshot")
+
+        monkeypatch.setattr(map_module, "get_yaml_doc", no_yaml)
+        monkeypatch.setattr("adventure.map.snapshot.get_yaml_doc", no_yaml)
+        game_map = Map(
+            base_data_dir=TEST_DATA_DIR,
+            file_name="test_map.yml",
+            snapshot_file=snapshot_file,
+        )
+        assert game_map.name == "Test Map"
+        assert len(game_map.rooms) == 3
+        assert game_map.get_room(1).name == "Room One"
+        assert game_map.get_room(1).contents[0].name == "rock"
+        assert game_map.get_room(1).get_doors()[0].leads_to == 2
+
+    def test_lazy_snapshot_builds_no_rooms(self, snapshot_file, monkeypatch):
+        """A lazy map writes a full snapshot without building its rooms."""
+
+        def no_build(*args, **kwargs):
+            raise AssertionError("No room should be built")
+
+        monkeypatch.setattr(map_module, "load_room_from_yaml", no_build)
+        game_map = Map(
+            base_data_dir=TEST_DATA_DIR,
+            file_name="test_map.yml",
+            snapshot_file=snapshot_file,
+            lazy=True,
+        )
+        assert not game_map.rooms
+        docs = read_snapshot(snapshot_file, f"{TEST_DATA_DIR}/test_map.yml")
+        assert f"{TEST_DATA_DIR}/rooms/room_one.yml" in docs
+        assert "adventure/data/things/start_rock.yml" in docs
+        assert game_map._get_doc is map_module.get_yaml_doc
+
+    def test_snapshot_stale_when_source_changes(self, tmp_path):
+        """Touching a source file invalidates the snapshot."""
+        source = tmp_path / "source.yml"
+        source.write_text("key: value\n", encoding="utf-8")
+        snapshot_file = str(tmp_path / "source.snapshot")
+        write_snapshot(snapshot_file, "map.yml", {str(source): {"key": "value"}})
+        assert read_snapshot(snapshot_file, "map.yml") == {
+            str(source): {"key": "value"}
+        }
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert read_snapshot(snapshot_file, "map.yml") is None
+
+    def test_snapshot_for_other_map_is_stale(self, tmp_path):
+        """A snapshot built for another map file is not used."""
+        snapshot_file = str(tmp_path / "other.snapshot")
+        write_snapshot(snapshot_file, "map.yml", {})
+        assert read_snapshot(snapshot_file, "other_map.yml") is None
+
+    def test_unreadable_snapshot_is_stale(self, tmp_path):
+        """Garbage or missing snapshot files are treated as stale."""
+        snapshot_file = tmp_path / "garbage.snapshot"
+        assert read_snapshot(str(snapshot_file), "map.yml") is None
+        snapshot_file.write_bytes(b"not a pickle")
+        assert read_snapshot(str(snapshot_file), "map.yml") is None
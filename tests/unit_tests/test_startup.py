@@ -0,0 +1,56 @@
+"""Startup time tests."""
+
+import os
+import subprocess
+import sys
+
+from adventure.startup import PROJECT_DIR, format_report, measure_imports, total_us
+
+# Milliseconds allowed for importing the game; override with ADVENTURE_STARTUP_BUDGET.
+STARTUP_BUDGET_MS = float(os.environ.get("ADVENTURE_STARTUP_BUDGET", "500"))
+DEFERRED_MODULES = ["colorama", "readchar", "pynput", "concurrent.futures.process"]
+# Only loaded by main.py for --serve, --prefork or --batch.
+MODE_MODULES = ["asyncio", "adventure.server", "adventure.prefork", "adventure.batch"]
+
+
+class TestStartup:
+    """Test what the game imports when it starts."""
+
+    def test_startup_budget(self):
+        """Importing the game fits in the startup budget."""
+        times = measure_imports()
+        total_ms = total_us(times) / 1000
+        assert total_ms < STARTUP_BUDGET_MS, format_report(times)
+
+    def test_heavy_imports_deferred(self):
+        """UI, keyboard and color libraries are not loaded at startup."""
+        imported = {entry.module for entry in measure_imports()}
+        assert not imported & set(DEFERRED_MODULES)
+
+    def test_modes_deferred(self):
+        """Starting the game does not load the server or batch modes."""
+        imported = {entry.module for entry in measure_imports()}
+        assert "adventure.game" in imported
+        assert not imported & set(MODE_MODULES)
+
+    def test_game_without_console(self):
+        """A game with its own UI never loads the console libraries."""
+        script = (
+            "import sys\n"
+            "from adventure.game import Game\n"
+            "from adventure.ui.baseui import BaseUI\n"
+            "class QuietUI(BaseUI):\n"
+            "    def display_message(self, message, color=None): pass\n"
+            "    def get_input(self, prompt=''): return ''\n"
+            "    def show_color(self, msg, color): return msg\n"
+            "Game('adventure/data', 'maps/sparse_map.yml', 'commands.yml', ui=QuietUI())\n"
+            f"print(sorted(set({DEFERRED_MODULES!r}) & set(sys.modules)))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_DIR,
+            check=True,
+        )
+        assert result.stdout.strip() == "[]"
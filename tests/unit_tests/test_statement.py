@@ -44,3 +44,20 @@ class TestStatement:
         cmd_list = CommandList(commands_yml_file=TEST_COMMANDS)
         with pytest.raises(BadStatementError):
             Statement.identify_verb(Statement, tokens=[], commands=cmd_list)
+
+    def test_statement_verb_ignores_case(self):
+        """Test that verbs are matched whatever their case."""
+        cmd_list = CommandList(commands_yml_file=TEST_COMMANDS)
+        stmt = Statement(statement="Go North", cmd_list=cmd_list)
+        assert stmt.verb.name == "move"
+        assert stmt.action == "Go"
+        assert stmt.args == ["North"]
+
+    def test_statement_phrase(self):
+        """Test that the words after the verb are sorted into a phrase."""
+        cmd_list = CommandList(commands_yml_file=TEST_COMMANDS)
+        stmt = Statement(statement="grab the sword from the table", cmd_list=cmd_list)
+        assert stmt.phrase.verb == "grab"
+        assert stmt.phrase.direct == ("sword",)
+        assert stmt.phrase.preposition == "from"
+        assert stmt.phrase.indirect == ("table",)
@@ -1,9 +1,10 @@
 """Test Adventure Room Wall functionality."""
 
 import pytest
-from adventure.rooms.wall import Wall
-from adventure.rooms.door import Door
+from adventure.rooms.wall import Wall, WallTemplate, TemplateWall
+from adventure.rooms.door import Door, DoorTemplate, TemplateDoor
 from adventure.map.direction import Direction
+from adventure.rooms.room import Room
 
 
 class TestWall:
@@ -54,3 +55,60 @@ class TestWall:
         assert wall.get_door() is None
         wall.add_door(door=a_door)
         assert wall.get_door().name == "Door1"
+
+
+class TestTemplates:
+    """Test walls and doors that share their descriptions through templates."""
+
+    def test_templates_are_shared(self):
+        """Test that equal documents give the same template object."""
+        doc = {"name": "concrete_wall", "short_desc": "short", "long_desc": "long"}
+        assert WallTemplate.from_doc(doc) is WallTemplate.from_doc(dict(doc))
+        assert DoorTemplate.from_doc(doc) is DoorTemplate.from_doc(dict(doc))
+        assert WallTemplate.from_doc(doc) != WallTemplate.from_doc(
+            {"short_desc": "other", "long_desc": "long"}
+        )
+
+    def test_template_wall(self):
+        """Test that a template wall reads its descriptions from the template."""
+        template = WallTemplate(short_desc="short", long_desc="long desc")
+        wall = TemplateWall(template=template, location=Direction.EAST, doors=[])
+        assert isinstance(wall, Wall)
+        assert wall.name == "EAST wall"
+        assert wall.short_desc == "short"
+        assert wall.long_desc == "long desc"
+        assert not wall.has_door()
+
+    def test_template_doors_keep_own_state(self):
+        """Test that doors sharing a template open and close independently."""
+        template = DoorTemplate(name="Door1", short_desc="A door", long_desc="wooden")
+        first = TemplateDoor(template=template)
+        second = TemplateDoor(template=template, leads_to=3)
+        first.close()
+        assert not first.is_open
+        assert second.is_open
+        assert second.leads_to == 3
+        assert first.name == second.name == "Door1"
+        assert first.long_desc == "wooden"
+
+    def test_door_wall(self):
+        """A room finds the wall a door is in, even with an equal door elsewhere."""
+        room = Room(name="a hall", short_desc="hall", long_desc="A hall.")
+        doors = {}
+        for location in (Direction.NORTH, Direction.SOUTH):
+            doors[location] = Door(
+                name="door", short_desc="a door", long_desc="A door."
+            )
+            wall = Wall(
+                name=f"{location.name} wall",
+                short_desc="short",
+                long_desc="long desc",
+                location=location,
+                doors=[doors[location]],
+            )
+            room.add_wall(wall, location)
+        assert doors[Direction.NORTH] == doors[Direction.SOUTH]
+        assert room.get_door_wall(doors[Direction.SOUTH]).location == Direction.SOUTH
+        assert (
+            room.get_door_wall(Door(name="door", short_desc="", long_desc="")) is None
+        )